@@ -0,0 +1 @@
+"""Benchmarks for Discord Bot hot paths."""
@@ -0,0 +1,126 @@
+"""Benchmark the auto-translate fan-out at a fixed message rate against the offline translation backend.
+
+Run from the project root:
+
+    python -m benchmarks.bench_auto_translate [--rate 50] [--duration 10] [--subscribers 20] [--languages de fr es]
+                                              [--vocabulary 200] [--latency 0.05] [--error-rate 0]
+
+Messages from one author with ``--subscribers`` auto-translate subscribers (spread over ``--languages``) are
+fed to `DiscordLogic.on_message` at ``--rate`` messages per second. Texts are drawn from ``--vocabulary``
+distinct phrases, so repeated chatter exercises the translation cache. No network or database is used.
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from discord_bot.adapters.translation_backends import LocalTranslationBackend
+from discord_bot.business_logic.discord_logic import DiscordLogic
+from discord_bot.business_logic.translator import Translator
+
+AUTHOR_ID = 1
+
+
+class RecordingChannel:
+    """Channel stand-in that counts sends."""
+    def __init__(self) -> None:
+        self.id = 2
+        self.sent = 0
+
+    async def send(self, content: str) -> None:
+        self.sent += 1
+
+
+def fake_message(index: int, text: str, channel: RecordingChannel) -> SimpleNamespace:
+    """Build a minimal guild message object accepted by `DiscordLogic.on_message`."""
+    return SimpleNamespace(
+        id=index,
+        author=SimpleNamespace(id=AUTHOR_ID, display_name="author"),
+        guild=SimpleNamespace(id=1),
+        channel=channel,
+        content=text,
+        created_at=SimpleNamespace(isoformat=lambda: "2026-01-01T00:00:00"),
+    )
+
+
+async def drive(
+    bot: DiscordLogic, rate: float, duration: float, vocabulary: int, channel: RecordingChannel
+) -> tuple[list[float], float]:
+    """Feed messages at ``rate`` per second and return per-message handling latencies and the elapsed time."""
+    latencies: list[float] = []
+    phrases = random.Random(0)
+
+    async def handle(index: int) -> None:
+        text = f"phrase number {phrases.randrange(vocabulary)}"
+        started = time.perf_counter()
+        await bot.on_message(fake_message(index, text, channel))
+        latencies.append(time.perf_counter() - started)
+
+    tasks: list[asyncio.Task] = []
+    started = time.perf_counter()
+    for index in range(int(rate * duration)):
+        # Schedule against the wall clock so slow handlers do not lower the offered rate.
+        delay = started + index / rate - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(handle(index)))
+    await asyncio.gather(*tasks)
+    return latencies, time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rate", type=float, default=50, help="Messages per second")
+    parser.add_argument("--duration", type=float, default=10, help="Seconds to send messages for")
+    parser.add_argument("--subscribers", type=int, default=20)
+    parser.add_argument("--languages", nargs="+", default=["de", "fr", "es"])
+    parser.add_argument("--vocabulary", type=int, default=200, help="Distinct phrases messages are drawn from")
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds per backend call")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of failing backend calls")
+    args = parser.parse_args()
+
+    backend = LocalTranslationBackend(latency=args.latency, error_rate=args.error_rate)
+    translator = Translator(backend=backend)
+    subscribers = list(range(100, 100 + args.subscribers))
+    for position, subscriber_id in enumerate(subscribers):
+        translator.set_user_language(subscriber_id, args.languages[position % len(args.languages)])
+
+    bot = DiscordLogic()
+    bot.set_translator(translator)
+    bot.auto_translate_targets = {AUTHOR_ID: set(subscribers)}
+    channel = RecordingChannel()
+
+    async def run() -> tuple[list[float], float]:
+        results = await drive(bot, args.rate, args.duration, args.vocabulary, channel)
+        # Let digests held back by the send limit go out before reporting.
+        await asyncio.gather(*bot._digest_tasks.values())
+        return results
+
+    latencies, elapsed = asyncio.run(run())
+    translator.executor.shutdown(wait=True)
+
+    latencies_ms = sorted(latency * 1000 for latency in latencies)
+    messages = len(latencies_ms)
+    status = translator.get_backend_status()
+    cache = status["cache"]
+    lookups = cache["hits"] + cache["misses"]
+    print(f"messages={messages} offered={args.rate:.1f}/s achieved={messages / elapsed:.1f}/s elapsed={elapsed:.2f}s")
+    print(f"latency mean={statistics.fmean(latencies_ms):.1f}ms "
+          f"p50={latencies_ms[messages // 2]:.1f}ms "
+          f"p95={latencies_ms[int(messages * 0.95) - 1]:.1f}ms "
+          f"p99={latencies_ms[int(messages * 0.99) - 1]:.1f}ms max={latencies_ms[-1]:.1f}ms")
+    print(f'sends={channel.sent} (naive fan-out: {messages * args.subscribers}) '
+          f'backend_calls={backend.calls} retries={status["retries"]} breaker={status["breaker"]["state"]} '
+          f'cache_hit_rate={cache["hits"] / lookups if lookups else 0:.1%}')
+    print(f"rate limit: {bot.get_auto_translate_counters()}")
+
+
+if __name__ == "__main__":
+    main()
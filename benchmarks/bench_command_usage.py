@@ -0,0 +1,127 @@
+"""Benchmark command throughput: former read-modify-write usage tracking versus aggregated bulk writes.
+
+Run from the project root:
+
+    python -m benchmarks.bench_command_usage [--commands 500] [--concurrency 1 20] [--latency 0.002] [--uri URI]
+
+Without ``--uri`` an in-memory stand-in with an artificial per-call latency replaces MongoDB. The
+aggregated run includes its final flush. ``counted`` is the sum of ``usage_count`` afterwards; the
+former path loses increments when invocations of the same command overlap.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from discord_bot.adapters.db import AsyncDBMS
+from discord_bot.business_logic.discord_logic import DiscordLogic
+from tests.fake_mongo import connect_fake
+
+COMMANDS = ["dish", "funfact", "Translate", "language"]
+TODAY = datetime.now().date().isoformat()
+
+
+async def update_command_usage_legacy(dbms: AsyncDBMS, command_name: str) -> None:
+    """Replicate the former path: read and rewrite the command row, then read and rewrite today's statistics."""
+    commands = await dbms.get_data_async("commands", {"command_name": command_name})
+    if commands:
+        command = commands[0]
+        command["usage_count"] = command.get("usage_count", 0) + 1
+        command["last_used"] = datetime.now().isoformat()
+        await dbms.update_data_async("commands", {"command_name": command_name}, command)
+        stats = await dbms.get_data_async("statistics", {"date": TODAY})
+        if stats:
+            stat = stats[0]
+            stat["total_commands"] = stat.get("total_commands", 0) + 1
+            await dbms.update_data_async("statistics", {"date": TODAY}, stat)
+
+
+async def run_legacy(dbms: AsyncDBMS, commands: int, concurrency: int) -> None:
+    callback = AsyncMock()
+
+    async def invoke(index: int) -> None:
+        await callback(Mock())
+        await update_command_usage_legacy(dbms, COMMANDS[index % len(COMMANDS)])
+
+    await drive(invoke, commands, concurrency)
+
+
+async def run_aggregated(bot: DiscordLogic, commands: int, concurrency: int) -> None:
+    callback = AsyncMock()
+
+    async def invoke(index: int) -> None:
+        await bot._run_command(COMMANDS[index % len(COMMANDS)], callback, Mock())
+
+    await drive(invoke, commands, concurrency)
+    await bot.stats_aggregator.stop()
+
+
+async def drive(invoke, commands: int, concurrency: int) -> None:
+    """Run ``commands`` invocations with at most ``concurrency`` of them in flight."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def limited(index: int) -> None:
+        async with semaphore:
+            await invoke(index)
+
+    await asyncio.gather(*(limited(index) for index in range(commands)))
+
+
+def reset(dbms: AsyncDBMS) -> None:
+    dbms.delete_data("commands", {})
+    dbms.delete_data("statistics", {})
+    dbms.insert_many("commands", [{"command_name": name, "usage_count": 0, "last_used": None} for name in COMMANDS])
+    dbms.insert_data("statistics", {"date": TODAY, "total_commands": 0})
+
+
+def round_trips(dbms: AsyncDBMS) -> int:
+    database = dbms.db
+    return sum(database[name].calls for name in ("commands", "statistics")) if hasattr(database, "latency") else -1
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--commands", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 20])
+    parser.add_argument("--latency", type=float, default=0.002, help="Per-call latency of the in-memory stand-in")
+    parser.add_argument("--uri", default=None, help="Benchmark against a real mongod instead of the stand-in")
+    args = parser.parse_args()
+
+    dbms = AsyncDBMS(uri=args.uri, db_name="benchmark_command_usage")
+    if args.uri:
+        dbms.connect()
+    else:
+        connect_fake(dbms, latency=args.latency)
+
+    print(f'{"path":<10} {"concurrency":>11} {"commands/s":>11} {"round trips":>12} {"counted":>8}')
+    for concurrency in args.concurrency:
+        for name in ("former", "aggregated"):
+            reset(dbms)
+            calls_before = round_trips(dbms)
+            started = time.perf_counter()
+            if name == "former":
+                asyncio.run(run_legacy(dbms, args.commands, concurrency))
+            else:
+                bot = DiscordLogic(dbms=dbms)
+                bot.logging = Mock()
+                bot.stats_aggregator.logging = Mock()
+                asyncio.run(run_aggregated(bot, args.commands, concurrency))
+            elapsed = time.perf_counter() - started
+            trips = round_trips(dbms) - calls_before if calls_before >= 0 else "n/a"
+            counted = sum(row.get("usage_count", 0) for row in dbms.get_data("commands", {}))
+            print(f"{name:<10} {concurrency:>11} {args.commands / elapsed:>11,.0f} {trips:>12} {counted:>8}")
+
+    if args.uri:
+        dbms.client.drop_database(dbms.db_name)
+        dbms.close()
+
+
+if __name__ == "__main__":
+    main()
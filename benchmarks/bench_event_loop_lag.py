@@ -0,0 +1,124 @@
+"""Benchmark event-loop lag while messages are persisted with the sync and the async DB adapter.
+
+Run from the project root:
+
+    python -m benchmarks.bench_event_loop_lag [--messages 300] [--latency 0.002] [--uri mongodb://...]
+
+Without ``--uri`` an in-memory stand-in with an artificial per-call latency replaces MongoDB.
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from discord_bot.adapters.db import DBMS, AsyncDBMS
+from discord_bot.business_logic.discord_logic import DiscordLogic
+from tests.fake_mongo import connect_fake
+
+TICK_SECONDS = 0.005
+TODAY = datetime.now().date().isoformat()
+
+
+async def measure_lag(stop: asyncio.Event) -> list[float]:
+    """Sample how late the event loop wakes up a coroutine sleeping for `TICK_SECONDS`."""
+    lags: list[float] = []
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(TICK_SECONDS)
+        lags.append(max(0.0, time.perf_counter() - started - TICK_SECONDS))
+    return lags
+
+
+def fake_message(index: int) -> SimpleNamespace:
+    """Build a minimal guild message object accepted by `DiscordLogic.on_message`."""
+    author = SimpleNamespace(id=1000 + index % 10, display_name=f"user{index % 10}")
+    return SimpleNamespace(
+        id=index,
+        author=author,
+        guild=SimpleNamespace(id=1),
+        channel=SimpleNamespace(id=2),
+        content=f"message {index}",
+        created_at=SimpleNamespace(isoformat=lambda: "2026-01-01T00:00:00"),
+    )
+
+
+def save_message_sync(dbms: DBMS, message_data: dict) -> None:
+    """Replicate the former blocking `_save_message` path (insert plus read-modify-write of statistics)."""
+    dbms.insert_data("messages", message_data)
+    stats = dbms.get_data("statistics", {"date": TODAY})
+    if stats:
+        stat = stats[0]
+        stat["total_messages"] = stat.get("total_messages", 0) + 1
+        dbms.update_data("statistics", {"date": TODAY}, stat)
+
+
+async def run_sync(dbms: DBMS, messages: int) -> list[float]:
+    """Handle messages with blocking DB calls made directly on the event loop."""
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(measure_lag(stop))
+    for index in range(messages):
+        message = fake_message(index)
+        save_message_sync(dbms, {"message_id": message.id, "content": message.content})
+        await asyncio.sleep(0)
+    stop.set()
+    return await monitor
+
+
+async def run_async(bot: DiscordLogic, messages: int) -> list[float]:
+    """Handle messages through `DiscordLogic.on_message`, which awaits the async adapter."""
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(measure_lag(stop))
+    await asyncio.gather(*(bot.on_message(fake_message(index)) for index in range(messages)))
+    if bot.message_buffer:
+        await bot.message_buffer.stop()
+    stop.set()
+    return await monitor
+
+
+def report(name: str, lags: list[float], elapsed: float, dbms: DBMS) -> None:
+    """Print lag percentiles and the number of message inserts for a single run."""
+    lags_ms = sorted(lag * 1000 for lag in lags) or [0.0]
+    p99 = lags_ms[min(len(lags_ms) - 1, int(len(lags_ms) * 0.99))]
+    print(f'{name:<6} elapsed={elapsed:7.3f}s ticks={len(lags):5d} '
+          f'lag mean={statistics.fmean(lags_ms):7.2f}ms p99={p99:7.2f}ms max={lags_ms[-1]:7.2f}ms '
+          f'stored={dbms.get_table_size("messages")}')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=300)
+    parser.add_argument("--latency", type=float, default=0.002, help="Per-call latency of the in-memory stand-in")
+    parser.add_argument("--uri", default=None, help="Benchmark against a real mongod instead of the stand-in")
+    args = parser.parse_args()
+
+    sync_dbms = DBMS(uri=args.uri, db_name="benchmark")
+    async_dbms = AsyncDBMS(uri=args.uri, db_name="benchmark")
+    for dbms in (sync_dbms, async_dbms):
+        if args.uri:
+            dbms.connect()
+        else:
+            connect_fake(dbms, latency=args.latency)
+        dbms.delete_data("messages", {})
+        dbms.delete_data("statistics", {})
+        dbms.insert_data("statistics", {"date": TODAY, "total_messages": 0})
+
+    started = time.perf_counter()
+    lags = asyncio.run(run_sync(sync_dbms, args.messages))
+    report("sync", lags, time.perf_counter() - started, sync_dbms)
+
+    bot = DiscordLogic(dbms=async_dbms)
+    started = time.perf_counter()
+    lags = asyncio.run(run_async(bot, args.messages))
+    report("async", lags, time.perf_counter() - started, async_dbms)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Benchmark `Model.logging` calls per second: former open-per-call writes versus the `LogWriter` queue.
+
+A last line reports the cost of a call that is sampled out, which neither formats nor queues a line.
+
+Run from the project root:
+
+    python -m benchmarks.bench_logging [--calls 20000] [--threads 1 4]
+
+Log files are written to a temporary directory that is removed afterwards.
+"""
+
+import argparse
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from discord_bot.business_logic.model import Model
+from discord_bot.init import log_loader
+from discord_bot.init.log_loader import LOG_FILTER, LogWriter
+
+
+class LegacyModel(Model):
+    """Replicate the former implementation: resolve, create, open, write and close on every call."""
+    def logging(self, message: str = "Model logging", log_file_name: str | None = None) -> None:
+        log_file = self.log_loader.get_log_file_path(
+            log_file_name or self.__class__.__name__, treat_as_filename=bool(log_file_name)
+        )
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        if not log_file.exists():
+            log_file.touch()
+        with open(log_file, "a", encoding="utf-8") as file:
+            file.write(f"[{timestamp}] {message}\n")
+
+    def execute_function(self) -> None:
+        pass
+
+
+class BufferedModel(Model):
+    def execute_function(self) -> None:
+        pass
+
+
+def run(model: Model, calls: int, threads: int) -> float:
+    """Return calls per second of ``calls`` log calls spread over ``threads`` threads."""
+    per_thread = calls // threads
+
+    def worker() -> None:
+        for index in range(per_thread):
+            model.logging(f"Selected dish {index} for category Italian")
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    started = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return per_thread * threads / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=20_000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 4])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as log_dir:
+        # The queue is sized to hold every call so no line is dropped during the measurement.
+        writer = LogWriter(queue_size=args.calls * 2)
+        log_loader.LOG_WRITER = writer
+        sys.modules["discord_bot.business_logic.model"].LOG_WRITER = writer
+
+        print(f'{"threads":>7} {"legacy calls/s":>15} {"buffered calls/s":>17} {"incl. drain":>12}')
+        for threads in args.threads:
+            legacy = LegacyModel()
+            legacy.log_loader.log_dir = Path(log_dir) / "legacy"
+            legacy_rate = run(legacy, args.calls, threads)
+
+            buffered = BufferedModel()
+            buffered.log_loader.log_dir = Path(log_dir) / "buffered"
+            started = time.perf_counter()
+            buffered_rate = run(buffered, args.calls, threads)
+            writer.flush()
+            drained_rate = args.calls // threads * threads / (time.perf_counter() - started)
+            print(f"{threads:>7} {legacy_rate:>15,.0f} {buffered_rate:>17,.0f} {drained_rate:>12,.0f}")
+        writer.close()
+
+        LOG_FILTER.set_sample_rate("bench.filtered", 0)
+        started = time.perf_counter()
+        for index in range(args.calls):
+            buffered.logging(lambda: f"Selected dish {index} for category Italian", sample="bench.filtered")
+        elapsed = time.perf_counter() - started
+        print(f"sampled-out calls: {args.calls / elapsed:,.0f} calls/s ({elapsed / args.calls * 1e9:,.0f} ns per call)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Benchmark `DBMS.get_random_entry`: former count + skip path versus the `$sample` pipeline.
+
+Without a category `$sample` uses a random cursor; with one it follows `$match`, so the server scans
+the matching documents and sorts them randomly, and the category rows show that cost.
+
+Needs a running mongod (the docker-compose `mongo` service works). Run from the project root:
+
+    python -m benchmarks.bench_random_entry [--uri mongodb://...] [--sizes 10000 100000 1000000] [--picks 200]
+
+The benchmark writes to a throwaway `benchmark_random_entry` database and drops it afterwards.
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from pymongo.errors import ConnectionFailure
+
+from discord_bot.adapters.db import DBMS
+from discord_bot.init.config_loader import DBConfigLoader
+
+DB_NAME = "benchmark_random_entry"
+CATEGORIES = ["Italian", "Chinese", "Mexican", "Austrian", "Indian"]
+
+
+def get_random_entry_skip(dbms: DBMS, table_name: str, category: str | None) -> dict:
+    """Replicate the former implementation: count the table, then skip to a random index."""
+    query = {"category": category} if category is not None else {}
+    size = dbms.get_table_size(table_name, category)
+    if size == 0:
+        return {}
+    cursor = dbms._table(table_name).find(query).skip(random.randrange(size)).limit(1)
+    for document in cursor:
+        return document
+    return {}
+
+
+def seed(dbms: DBMS, table_name: str, size: int) -> None:
+    """Fill a collection with ``size`` dish-like documents and a category index."""
+    table = dbms._table(table_name)
+    table.drop()
+    batch: list[dict] = []
+    for index in range(size):
+        batch.append({"id": index, "category": CATEGORIES[index % len(CATEGORIES)], "dish": f"Dish {index}"})
+        if len(batch) == 10_000:
+            table.insert_many(batch)
+            batch = []
+    if batch:
+        table.insert_many(batch)
+    table.create_index("category")
+
+
+def time_picks(pick, picks: int) -> tuple[float, float]:
+    """Return mean and p95 latency in milliseconds over ``picks`` calls of ``pick``."""
+    durations: list[float] = []
+    for _ in range(picks):
+        started = time.perf_counter()
+        pick()
+        durations.append((time.perf_counter() - started) * 1000)
+    durations.sort()
+    return statistics.fmean(durations), durations[int(len(durations) * 0.95) - 1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--uri", default=DBConfigLoader.MONGO_URI)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--picks", type=int, default=200)
+    args = parser.parse_args()
+
+    dbms = DBMS(uri=args.uri, db_name=DB_NAME)
+    try:
+        dbms.connect(max_attempts=1)
+    except ConnectionFailure as error:
+        print(f"Cannot reach MongoDB, start mongod or pass --uri: {error}")
+        return
+
+    print(f'{"size":>9} {"category":>9} {"skip mean":>10} {"skip p95":>10} {"$sample mean":>13} {"$sample p95":>12}')
+    try:
+        for size in args.sizes:
+            table_name = f"dishes_{size}"
+            seed(dbms, table_name, size)
+            for category in (None, "Italian"):
+                skip_mean, skip_p95 = time_picks(lambda: get_random_entry_skip(dbms, table_name, category), args.picks)
+                sample_mean, sample_p95 = time_picks(lambda: dbms.get_random_entry(table_name, category), args.picks)
+                print(
+                    f"{size:>9} {category or '-':>9} {skip_mean:>8.2f}ms {skip_p95:>8.2f}ms "
+                    f"{sample_mean:>11.2f}ms {sample_p95:>10.2f}ms"
+                )
+    finally:
+        if dbms.client is not None:
+            dbms.client.drop_database(DB_NAME)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""Read-through cache for constant-value tables in front of another `DatabasePort`."""
+
+import random
+import threading
+import time
+
+from discord_bot.contracts.ports import DatabasePort
+from discord_bot.init.config_loader import CacheConfigLoader
+from discord_bot.init.metrics import METRICS
+
+CACHE_REQUESTS = METRICS.counter(
+    "discord_bot_cache_requests_total", "Cache lookups by cache and result (hit or miss).", ("cache", "result")
+)
+
+class CachedTable:
+    """Immutable snapshot of a table, grouped by category for constant-time random picks."""
+    def __init__(self, rows: list[dict]) -> None:
+        self.rows: tuple[dict, ...] = tuple(rows)
+        grouped: dict[str, list[dict]] = {}
+        for row in rows:
+            category = row.get("category")
+            if category is not None:
+                grouped.setdefault(category, []).append(row)
+        self.by_category: dict[str, tuple[dict, ...]] = {category: tuple(group) for category, group in grouped.items()}
+        self.loaded_at = time.monotonic()
+
+    def select(self, category: str | None) -> tuple[dict, ...]:
+        """Return all rows, or only the rows of one category."""
+        return self.rows if category is None else self.by_category.get(category, ())
+
+class CachedDBMS(DatabasePort):
+    """`DatabasePort` decorator that serves reads of rarely changing tables from memory.
+
+    Writes through this port invalidate the affected table; everything else is delegated unchanged.
+    """
+    def __init__(
+        self, dbms: DatabasePort, cached_tables: tuple[str, ...] | None = None, ttl: float | None = None
+    ) -> None:
+        self.dbms = dbms
+        self.cached_tables = set(cached_tables if cached_tables is not None else CacheConfigLoader.CACHED_TABLES)
+        self.ttl = CacheConfigLoader.TABLE_TTL if ttl is None else ttl
+        self.hits = 0
+        self.misses = 0
+        self._tables: dict[str, CachedTable] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def _cached(self, table_name: str) -> CachedTable:
+        """Return the cached snapshot of a table, loading it on first use or after expiry.
+
+        Args:
+            table_name (str): Name of a table listed in `cached_tables`.
+
+        Returns:
+            CachedTable: Snapshot of the table.
+        """
+        with self._lock:
+            table = self._tables.get(table_name)
+            if table is not None and (not self.ttl or time.monotonic() - table.loaded_at < self.ttl):
+                self.hits += 1
+                CACHE_REQUESTS.inc("tables", "hit")
+                return table
+            self.misses += 1
+            generation = self._generation
+        CACHE_REQUESTS.inc("tables", "miss")
+
+        table = CachedTable(self.dbms.get_data(table_name, {}))
+        with self._lock:
+            # Skip storing rows that were read while a write invalidated the table.
+            if generation == self._generation:
+                self._tables[table_name] = table
+        return table
+
+    def invalidate_cache(self, table_name: str | None = None) -> None:
+        with self._lock:
+            self._generation += 1
+            if table_name is None:
+                self._tables.clear()
+            else:
+                self._tables.pop(table_name, None)
+
+    def connect(self, max_attempts: int = 10, delay_seconds: float = 2) -> None:
+        self.dbms.connect(max_attempts=max_attempts, delay_seconds=delay_seconds)
+
+    def get_random_entry(self, table_name: str, category: str | None) -> dict:
+        if table_name not in self.cached_tables:
+            return self.dbms.get_random_entry(table_name, category)
+
+        rows = self._cached(table_name).select(category)
+        if not rows:
+            return {}
+        # Hand out a copy so callers cannot modify the cached row.
+        return dict(random.choice(rows))
+
+    def get_table_size(self, table_name: str, category: str | None = None) -> int:
+        if table_name not in self.cached_tables:
+            return self.dbms.get_table_size(table_name, category)
+        return len(self._cached(table_name).select(category))
+
+    def get_distinct_values(self, table_name: str, field: str) -> list[str]:
+        if table_name not in self.cached_tables:
+            return self.dbms.get_distinct_values(table_name, field)
+        return sorted({row[field] for row in self._cached(table_name).rows if row.get(field) is not None})
+
+    def get_data(self, table_name: str, query: dict) -> list[dict]:
+        return self.dbms.get_data(table_name, query)
+
+    def insert_data(self, table_name: str, data: dict) -> bool:
+        try:
+            return self.dbms.insert_data(table_name, data)
+        finally:
+            self.invalidate_cache(table_name)
+
+    def insert_many(self, table_name: str, data: list[dict]) -> bool:
+        try:
+            return self.dbms.insert_many(table_name, data)
+        finally:
+            self.invalidate_cache(table_name)
+
+    def update_data(self, table_name: str, query: dict, data: dict) -> bool:
+        try:
+            return self.dbms.update_data(table_name, query, data)
+        finally:
+            self.invalidate_cache(table_name)
+
+    def increment_data(self, table_name: str, query: dict, counters: dict[str, int], upsert: bool = True) -> bool:
+        try:
+            return self.dbms.increment_data(table_name, query, counters, upsert)
+        finally:
+            self.invalidate_cache(table_name)
+
+    def bulk_increment(
+        self, table_name: str, updates: list[tuple[dict, dict[str, int], dict]], upsert: bool = False
+    ) -> bool:
+        try:
+            return self.dbms.bulk_increment(table_name, updates, upsert)
+        finally:
+            self.invalidate_cache(table_name)
+
+    def bulk_update(self, table_name: str, updates: list[tuple[dict, dict]]) -> bool:
+        try:
+            return self.dbms.bulk_update(table_name, updates)
+        finally:
+            self.invalidate_cache(table_name)
+
+    def get_oldest_data(self, table_name: str, query: dict, field: str, limit: int) -> list[dict]:
+        return self.dbms.get_oldest_data(table_name, query, field, limit)
+
+    def create_table(self, table_name: str, capped_size: int | None = None) -> bool:
+        return self.dbms.create_table(table_name, capped_size)
+
+    def create_index(
+        self,
+        table_name: str,
+        keys: list[tuple[str, int]],
+        unique: bool = False,
+        expire_after_seconds: int | None = None,
+    ) -> str:
+        return self.dbms.create_index(table_name, keys, unique, expire_after_seconds)
+
+    def get_indexes(self, table_name: str) -> list[dict]:
+        return self.dbms.get_indexes(table_name)
+
+    def delete_data(self, db_name: str, query: dict) -> bool:
+        try:
+            return self.dbms.delete_data(db_name, query)
+        finally:
+            self.invalidate_cache(db_name)
+
+    def upload_table(self, db_name: str, table_name: str, data: list[dict], drop_existing: bool = True) -> bool:
+        try:
+            return self.dbms.upload_table(db_name, table_name, data, drop_existing)
+        finally:
+            self.invalidate_cache(table_name)
@@ -1,13 +1,43 @@
 """MongoDB-backed implementation of the `DatabasePort` interface."""
 
-import numpy as np
+import asyncio
 import time
-from pymongo import MongoClient
-from pymongo.errors import ConnectionFailure
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, wraps
+from typing import Any, Callable
+from pymongo import MongoClient, UpdateOne
+from pymongo.errors import ConnectionFailure, OperationFailure
 from pymongo.database import Database
 
 from discord_bot.contracts.ports import DatabasePort
 from discord_bot.init.config_loader import DBConfigLoader
+from discord_bot.init.metrics import METRICS
+
+DB_LATENCY = METRICS.histogram(
+    "discord_bot_db_operation_seconds",
+    "Latency of DBMS operations by method and collection.",
+    ("operation", "collection"),
+)
+DB_ERRORS = METRICS.counter(
+    "discord_bot_db_errors_total", "DBMS operations that raised, by method and collection.", ("operation", "collection")
+)
+
+def _observed(function: Callable[..., Any]) -> Callable[..., Any]:
+    """Record latency and errors of a DBMS method whose first argument is the collection name."""
+    operation = function.__name__
+
+    @wraps(function)
+    def wrapper(self, collection: str, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return function(self, collection, *args, **kwargs)
+        except Exception:
+            DB_ERRORS.inc(operation, collection)
+            raise
+        finally:
+            DB_LATENCY.observe(time.perf_counter() - started, operation, collection)
+
+    return wrapper
 
 class DBMS(DatabasePort):
     """MongoDB-backed implementation of the `DatabasePort` interface."""
@@ -56,42 +86,133 @@ class DBMS(DatabasePort):
 
         return self.db[table_name]
 
+    @_observed
     def get_table_size(self, table_name: str, category: str | None = None) -> int:
         query = {"category": category} if category is not None else {}
         return self._table(table_name).count_documents(query)
 
+    @_observed
     def get_random_entry(self, table_name: str, category: str | None) -> dict:
-        query = {"category": category} if category is not None else {}
-        size = self.get_table_size(table_name, category)
-        if size == 0:
-            return {}
-        
-        index = int(np.random.randint(0, size))
-        # Use skip+limit to fetch a single random document efficiently.
-        cursor = self._table(table_name).find(query).skip(index).limit(1)
-
-        for document in cursor:
+        pipeline: list[dict] = []
+        if category is not None:
+            pipeline.append({"$match": {"category": category}})
+        # Without a category, $sample is the first stage and the server picks a document with a random
+        # cursor. After $match it is not: the server reads every matching document (through the
+        # dishes.category index) and sorts them randomly, so the cost grows with the category's size.
+        # Dishes and fun facts are normally answered from `CachedDBMS` before reaching this query.
+        pipeline.append({"$sample": {"size": 1}})
+
+        for document in self._table(table_name).aggregate(pipeline):
             return document
         return {}
 
+    @_observed
     def get_data(self, table_name: str, query: dict) -> list[dict]:
         return [document for document in self._table(table_name).find(query)]
 
+    @_observed
+    def get_oldest_data(self, table_name: str, query: dict, field: str, limit: int) -> list[dict]:
+        return list(self._table(table_name).find(query, sort=[(field, 1)], limit=limit))
+
+    @_observed
     def get_distinct_values(self, table_name: str, field: str) -> list[str]:
         return sorted(
             value for value in self._table(table_name).distinct(field)
             if value is not None
         )
 
+    @_observed
     def insert_data(self, table_name: str, data: dict) -> bool:
         return self._table(table_name).insert_one(data).acknowledged
 
+    @_observed
+    def insert_many(self, table_name: str, data: list[dict]) -> bool:
+        if not data:
+            return False
+        # Unordered so one bad document does not abort the rest of the batch.
+        return self._table(table_name).insert_many(data, ordered=False).acknowledged
+
+    @_observed
     def update_data(self, table_name: str, query: dict, data: dict) -> bool:
         return self._table(table_name).update_many(query, {"$set": data}).acknowledged
 
+    @_observed
+    def increment_data(self, table_name: str, query: dict, counters: dict[str, int], upsert: bool = True) -> bool:
+        return self._table(table_name).update_one(query, {"$inc": counters}, upsert=upsert).acknowledged
+
+    @_observed
+    def bulk_increment(
+        self, table_name: str, updates: list[tuple[dict, dict[str, int], dict]], upsert: bool = False
+    ) -> bool:
+        if not updates:
+            return True
+        requests = [
+            UpdateOne(query, {"$inc": counters, **({"$set": values} if values else {})}, upsert=upsert)
+            for query, counters, values in updates
+        ]
+        # Unordered so the server may apply the updates in parallel and one failure does not skip the rest.
+        return self._table(table_name).bulk_write(requests, ordered=False).acknowledged
+
+    @_observed
+    def bulk_update(self, table_name: str, updates: list[tuple[dict, dict]]) -> bool:
+        if not updates:
+            return True
+        requests = [UpdateOne(query, {"$set": values}) for query, values in updates]
+        return self._table(table_name).bulk_write(requests, ordered=False).acknowledged
+
+    @_observed
     def delete_data(self, db_name: str, query: dict) -> bool:
         return self._table(db_name).delete_many(query).acknowledged
 
+    @_observed
+    def create_table(self, table_name: str, capped_size: int | None = None) -> bool:
+        if self.db is None:
+            raise RuntimeError("DBMS not connected. Call connect() first.")
+        if table_name in self.db.list_collection_names():
+            return False
+        if capped_size:
+            self.db.create_collection(table_name, capped=True, size=capped_size)
+        else:
+            self.db.create_collection(table_name)
+        return True
+
+    @_observed
+    def create_index(
+        self,
+        table_name: str,
+        keys: list[tuple[str, int]],
+        unique: bool = False,
+        expire_after_seconds: int | None = None,
+    ) -> str:
+        options = {"expireAfterSeconds": expire_after_seconds} if expire_after_seconds is not None else {}
+        # createIndexes is a no-op for an existing index with the same keys and options.
+        return self._table(table_name).create_index(list(keys), unique=unique, **options)
+
+    @_observed
+    def get_indexes(self, table_name: str) -> list[dict]:
+        table = self._table(table_name)
+        usage: dict[str, int] = {}
+        try:
+            for stats in table.aggregate([{"$indexStats": {}}]):
+                usage[stats["name"]] = int(stats["accesses"]["ops"])
+        except OperationFailure:
+            # $indexStats needs the indexStats privilege; without it the usage stays unknown.
+            pass
+        return [
+            {
+                "name": name,
+                # Directions may come back as floats (1.0); text and hashed indexes keep their string type.
+                "keys": [
+                    (field, int(direction) if isinstance(direction, (int, float)) else direction)
+                    for field, direction in info["key"]
+                ],
+                "unique": bool(info.get("unique", False)),
+                "expire_after_seconds": int(info["expireAfterSeconds"]) if "expireAfterSeconds" in info else None,
+                "ops": usage.get(name),
+            }
+            for name, info in table.index_information().items()
+        ]
+
     def upload_table(self, db_name: str, table_name: str, data: list[dict], drop_existing: bool = True) -> bool:
         if self.client is None:
             raise RuntimeError("DBMS not connected. Call connect() first.")
@@ -110,3 +231,60 @@ class DBMS(DatabasePort):
 
         except Exception as error:
             raise RuntimeError(f'Error uploading table: {error}')
+
+class AsyncDBMS(DBMS):
+    """Asyncio-friendly `DBMS` that runs PyMongo calls on a dedicated, bounded thread pool.
+
+    The synchronous methods stay available for thread-based callers such as the admin panel,
+    while the `*_async` variants never block the event loop they are awaited from.
+    """
+    def __init__(self, uri: str | None = None, db_name: str | None = None, max_workers: int | None = None) -> None:
+        super().__init__(uri=uri, db_name=db_name)
+        self.max_workers = max_workers or DBConfigLoader.ASYNC_WORKERS
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=f"dbms-{self.db_name}")
+
+    async def _run(self, function: Callable[..., Any], *args) -> Any:
+        """Run a blocking DBMS method on the executor and await its result.
+
+        Args:
+            function (Callable[..., Any]): Bound synchronous method to execute.
+            *args: Positional arguments passed to ``function``.
+
+        Returns:
+            Any: Whatever ``function`` returns.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(function, *args))
+
+    async def get_data_async(self, table_name: str, query: dict) -> list[dict]:
+        return await self._run(self.get_data, table_name, query)
+
+    async def insert_data_async(self, table_name: str, data: dict) -> bool:
+        return await self._run(self.insert_data, table_name, data)
+
+    async def insert_many_async(self, table_name: str, data: list[dict]) -> bool:
+        return await self._run(self.insert_many, table_name, data)
+
+    async def update_data_async(self, table_name: str, query: dict, data: dict) -> bool:
+        return await self._run(self.update_data, table_name, query, data)
+
+    async def increment_data_async(
+        self, table_name: str, query: dict, counters: dict[str, int], upsert: bool = True
+    ) -> bool:
+        return await self._run(self.increment_data, table_name, query, counters, upsert)
+
+    async def bulk_increment_async(
+        self, table_name: str, updates: list[tuple[dict, dict[str, int], dict]], upsert: bool = False
+    ) -> bool:
+        return await self._run(self.bulk_increment, table_name, updates, upsert)
+
+    async def delete_data_async(self, db_name: str, query: dict) -> bool:
+        return await self._run(self.delete_data, db_name, query)
+
+    def close(self) -> None:
+        """Shut down the worker pool and close the Mongo client."""
+        self.executor.shutdown(wait=True)
+        if self.client is not None:
+            self.client.close()
+            self.client = None
+            self.db = None
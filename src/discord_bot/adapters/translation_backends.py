@@ -0,0 +1,103 @@
+"""Translation backends behind `TranslationBackendPort` and the registry used to select one by name."""
+
+import random
+import threading
+import time
+from typing import Callable
+
+from deep_translator import GoogleTranslator  # type: ignore[import-untyped]
+
+from discord_bot.contracts.ports import TranslationBackendPort
+from discord_bot.init.config_loader import TranslatorConfigLoader
+
+class GoogleTranslationBackend(TranslationBackendPort):
+    """Translate through Google Translate using `deep_translator`."""
+    def __init__(self) -> None:
+        # GoogleTranslator keeps per-request state on the instance, so clients are reused per thread.
+        self._clients = threading.local()
+
+    def _client(self, target_language: str) -> GoogleTranslator:
+        """Return this thread's client for a target language, creating it on first use."""
+        clients: dict[str, GoogleTranslator] = self._clients.__dict__.setdefault("by_language", {})
+        if target_language not in clients:
+            clients[target_language] = GoogleTranslator(source="auto", target=target_language)
+        return clients[target_language]
+
+    def translate(self, text: str, target_language: str) -> str:
+        return self._client(target_language).translate(text)
+
+    def translate_batch(self, texts: list[str], target_language: str) -> list[str]:
+        return self._client(target_language).translate_batch(texts)
+
+class LocalTranslationBackend(TranslationBackendPort):
+    """Deterministic offline backend for tests, benchmarks and load tests.
+
+    Known words are looked up in a small dictionary; everything else is returned with a
+    ``[target]`` prefix. Every call sleeps `latency` seconds and fails with probability
+    `error_rate`, drawn from a seeded generator so runs are reproducible.
+    """
+    DICTIONARY: dict[str, dict[str, str]] = {
+        "de": {"hello": "hallo", "thanks": "danke", "yes": "ja", "no": "nein", "good morning": "guten Morgen"},
+        "fr": {"hello": "bonjour", "thanks": "merci", "yes": "oui", "no": "non", "good morning": "bonjour"},
+        "es": {"hello": "hola", "thanks": "gracias", "yes": "sí", "no": "no", "good morning": "buenos días"},
+    }
+
+    def __init__(self, latency: float | None = None, error_rate: float | None = None, seed: int | None = None) -> None:
+        self.latency = TranslatorConfigLoader.LOCAL_LATENCY if latency is None else latency
+        self.error_rate = TranslatorConfigLoader.LOCAL_ERROR_RATE if error_rate is None else error_rate
+        self.calls = 0
+        self._random = random.Random(seed if seed is not None else 0)
+        self._lock = threading.Lock()
+
+    def _call(self) -> None:
+        """Simulate the round trip of one backend request."""
+        with self._lock:
+            self.calls += 1
+            failed = self._random.random() < self.error_rate
+        if self.latency:
+            time.sleep(self.latency)
+        if failed:
+            raise ConnectionError("Simulated translation backend error")
+
+    def _translate(self, text: str, target_language: str) -> str:
+        known = self.DICTIONARY.get(target_language, {}).get(text.strip().lower())
+        return known if known is not None else f"[{target_language}] {text}"
+
+    def translate(self, text: str, target_language: str) -> str:
+        self._call()
+        return self._translate(text, target_language)
+
+    def translate_batch(self, texts: list[str], target_language: str) -> list[str]:
+        self._call()
+        return [self._translate(text, target_language) for text in texts]
+
+TRANSLATION_BACKENDS: dict[str, Callable[[], TranslationBackendPort]] = {
+    "google": GoogleTranslationBackend,
+    "local": LocalTranslationBackend,
+}
+
+def register_translation_backend(name: str, factory: Callable[[], TranslationBackendPort]) -> None:
+    """Make an additional backend selectable through the `[translator] backend` setting.
+
+    Args:
+        name (str): Name used in `config.ini`.
+        factory (Callable[[], TranslationBackendPort]): Creates the backend without arguments.
+    """
+    TRANSLATION_BACKENDS[name] = factory
+
+def create_translation_backend(name: str | None = None) -> TranslationBackendPort:
+    """Create a registered backend.
+
+    Args:
+        name (str | None): Registered backend name; the configured backend if omitted.
+
+    Returns:
+        TranslationBackendPort: New backend instance.
+
+    Raises:
+        ValueError: If no backend is registered under ``name``.
+    """
+    name = name or TranslatorConfigLoader.BACKEND
+    if name not in TRANSLATION_BACKENDS:
+        raise ValueError(f"Unknown translation backend '{name}', expected one of {sorted(TRANSLATION_BACKENDS)}")
+    return TRANSLATION_BACKENDS[name]()
@@ -1,9 +1,14 @@
 """This File contains the gradio Web-Interface."""
 
+import math
+from collections.abc import Iterator
+from concurrent.futures import as_completed
+
 import gradio as gr
 
 from discord_bot.business_logic.discord_logic import DiscordLogic
 from discord_bot.contracts.ports import ViewPort, DatabasePort, DishPort, FunFactPort, TranslatePort, ControllerPort
+from discord_bot.init.config_loader import BroadcastConfigLoader
 from discord_bot.init.db_loader import DBLoader
 
 class AdminPanel(ViewPort):
@@ -132,49 +137,123 @@ class AdminPanel(ViewPort):
                         with gr.Column():
                             user_count = gr.Textbox(label="Total Users", value="Loading...", interactive=False)
 
+                    gr.Markdown("### Today")
+                    with gr.Row():
+                        with gr.Column():
+                            messages_today = gr.Textbox(label="Messages", value="Loading...", interactive=False)
+                        with gr.Column():
+                            dms_today = gr.Textbox(label="Direct Messages", value="Loading...", interactive=False)
+                        with gr.Column():
+                            commands_today = gr.Textbox(label="Commands", value="Loading...", interactive=False)
+                    command_breakdown = gr.JSON(label="Command Breakdown")
+
+                    def load_live_statistics() -> tuple[str, str, str, dict]:
+                        """Load today's live counters from the bot's in-memory statistics.
+
+                        Returns:
+                            tuple[str, str, str, dict]: Messages, DMs and commands formatted with commas,
+                                plus the per-command breakdown.
+                        """
+                        if not self.discord_bot:
+                            return ("0", "0", "0", {})
+                        live = self.discord_bot.get_live_statistics()
+                        return (
+                            "{:,}".format(live.get("total_messages", 0)),
+                            "{:,}".format(live.get("total_dms", 0)),
+                            "{:,}".format(live.get("total_commands", 0)),
+                            live.get("command_breakdown", {}),
+                        )
+
                     def load_bot_status_initial():
                         """Load the initial status of the Discord bot.
 
                         Returns:
-                            tuple[str, str, str, str]: A tuple containing:
+                            tuple: A tuple containing:
                                 - Bot status as a string.
                                 - Number of guilds as a string.
                                 - Number of users formatted with commas as a string.
                                 - An additional info message as a string.
+                                - Today's messages, DMs, commands and command breakdown.
                         """
                         if not self.check_available() or not self.discord_bot:
-                            return ("No discord bot instance", "0", "0", "")
+                            return ("No discord bot instance", "0", "0", "", "0", "0", "0", {})
                         try:
                             stats = self.discord_bot.get_bot_stats()
-                            return (stats.get("status", "Offline"), str(stats.get("guilds", 0)), "{:,}".format(stats.get("users", 0)), "")
+                            return (
+                                stats.get("status", "Offline"),
+                                str(stats.get("guilds", 0)),
+                                "{:,}".format(stats.get("users", 0)),
+                                "",
+                                *load_live_statistics(),
+                            )
                         except Exception:
-                            return ( "Error", "0", "0", "")
+                            return ("Error", "0", "0", "", "0", "0", "0", {})
 
                     def load_bot_status():
                         """Refresh and load the current status of the Discord bot.
 
                         Returns:
-                            tuple[gr.update | str, gr.update | str, gr.update | str, str]: A tuple containing:
+                            tuple: A tuple containing:
                                 - Bot status (string or Gradio update object).
                                 - Number of guilds (string or Gradio update object).
                                 - Number of users formatted with commas (string or Gradio update object).
                                 - A message indicating success or error of the refresh.
+                                - Today's messages, DMs, commands and command breakdown.
                         """
                         if not self.check_available() or not self.discord_bot:
-                            return (gr.update(value="No discord bot instance"), gr.update(value="0"), gr.update(value="0"), "No discord bot instance")
+                            return (
+                                gr.update(value="No discord bot instance"),
+                                gr.update(value="0"),
+                                gr.update(value="0"),
+                                "No discord bot instance",
+                                "0",
+                                "0",
+                                "0",
+                                {},
+                            )
 
                         try:
                             stats = self.discord_bot.get_bot_stats()
-                            return (stats.get("status", "Offline"), str(stats.get("guilds", 0)), "{:,}".format(stats.get("users", 0)), "Refresh successful")
+                            return (
+                                stats.get("status", "Offline"),
+                                str(stats.get("guilds", 0)),
+                                "{:,}".format(stats.get("users", 0)),
+                                "Refresh successful",
+                                *load_live_statistics(),
+                            )
                         except Exception:
-                            return (gr.update(value="Error"), gr.update(value="0"), gr.update(value="0"), "Error while refreshing")
-                        
-                    refresh_btn.click(fn=load_bot_status, outputs=[bot_status, guild_count, user_count, refresh_status])
-                    app.load(fn=load_bot_status_initial, outputs=[bot_status, guild_count, user_count, refresh_status])
+                            return (
+                                gr.update(value="Error"),
+                                gr.update(value="0"),
+                                gr.update(value="0"),
+                                "Error while refreshing",
+                                "0",
+                                "0",
+                                "0",
+                                {},
+                            )
+
+                    overview_outputs = [
+                        bot_status,
+                        guild_count,
+                        user_count,
+                        refresh_status,
+                        messages_today,
+                        dms_today,
+                        commands_today,
+                        command_breakdown,
+                    ]
+                    refresh_btn.click(fn=load_bot_status, outputs=overview_outputs)
+                    app.load(fn=load_bot_status_initial, outputs=overview_outputs)
 
                 with gr.Tab("Control Panel"):
-                    section_selector = gr.Dropdown(label="Select Section", choices=["Guild Management", "Custom Messages"], value="Guild Management",interactive=True)
-                   
+                    section_selector = gr.Dropdown(
+                        label="Select Section",
+                        choices=["Guild Management", "Custom Messages", "Broadcast Jobs"],
+                        value="Guild Management",
+                        interactive=True,
+                    )
+
                     with gr.Row(visible=True) as guild_mgmt_section:
                         with gr.Column():
                             gr.Markdown("## Guild Management")
@@ -234,7 +313,9 @@ class AdminPanel(ViewPort):
                     with gr.Row(visible=False) as custom_msg_section:
                         with gr.Column():
                             gr.Markdown("## Custom Messages")
-                            channel_dropdown = gr.Dropdown(label="Select Channel", choices=[], interactive=True)
+                            channel_dropdown = gr.Dropdown(
+                                label="Select Channels", choices=[], multiselect=True, interactive=True
+                            )
                             message_input = gr.Textbox(label="Message", placeholder="Enter message to send", lines=3)
                             send_message_btn = gr.Button("Send Message", size="lg", interactive=True)
                             refresh_channels_btn = gr.Button("Refresh Channels")
@@ -265,49 +346,206 @@ class AdminPanel(ViewPort):
 
                                 return (gr.update(choices=channels), f'Loaded {len(channels)} channels')
 
-                            def send_custom_message(channel_selection: str, message: str) -> str:
-                                """Send a custom message to a selected Discord channel.
+                            def resolve_channels(
+                                selections: list[str],
+                            ) -> tuple[dict[tuple[int, int], str], str | None]:
+                                """Resolve channel selections to (guild_id, channel_id) targets.
 
                                 Args:
-                                    channel_selection (str): The selected channel string, expected in the format "Name (ID: 123456)".
-                                    message (str): The message text to send.
+                                    selections (list[str]): Channel strings in the format "Name (ID: 123456)".
 
                                 Returns:
-                                    str: A message indicating the result of the operation:
-                                        - Error messages if the bot is unavailable, the channel is invalid, or the message is empty.
-                                        - Success or failure message after attempting to send the message.
+                                    tuple[dict[tuple[int, int], str], str | None]: The targets mapped to their
+                                        selection, and an error for the first selection that cannot be resolved.
+                                """
+                                targets: dict[tuple[int, int], str] = {}
+                                for selection in selections:
+                                    try:
+                                        channel_id = int(selection.split("ID: ")[1].rstrip(")"))
+                                    except (ValueError, IndexError):
+                                        return targets, f"Invalid channel selection: {selection}"
+                                    channel_obj = (
+                                        self.discord_bot.client.get_channel(channel_id) if self.discord_bot else None
+                                    )
+                                    if not channel_obj:
+                                        return targets, f"Channel not found: {selection}"
+                                    # Type guard: PrivateChannel has no guild attribute
+                                    if not getattr(channel_obj, "guild", None):
+                                        return targets, f"Channel has no guild: {selection}"
+                                    targets[(channel_obj.guild.id, channel_id)] = selection  # type: ignore[union-attr]
+                                return targets, None
+
+                            def send_custom_message(channel_selection: list[str] | str, message: str) -> Iterator[str]:
+                                """Send a custom message to the selected Discord channels and report each delivery.
+
+                                Args:
+                                    channel_selection (list[str] | str): The selected channel strings,
+                                        expected in the format "Name (ID: 123456)".
+                                    message (str): The message text to send.
+
+                                Yields:
+                                    str: A status message that grows with one line per finished channel:
+                                        - Error messages if the bot is unavailable, a channel is invalid,
+                                          or the message is empty.
+                                        - Success or failure per channel after attempting to send the message.
                                 """
                                 guard = _bot_guard()
                                 if guard:
-                                    return guard
+                                    yield guard
+                                    return
 
-                                if not channel_selection:
-                                    return "Select a channel"
+                                if isinstance(channel_selection, str):
+                                    channel_selection = [channel_selection]
+                                selections = list(channel_selection or [])
+                                if not selections:
+                                    yield "Select a channel"
+                                    return
 
                                 if not self.discord_bot:
-                                    return "Bot not available"
-                                
+                                    yield "Bot not available"
+                                    return
+
+                                targets, error = resolve_channels(selections)
+                                if error:
+                                    yield error
+                                    return
+
+                                message_text = (message or "").strip()
+                                if not message_text:
+                                    yield "Message required"
+                                    return
+
+                                futures = self.discord_bot.submit_broadcast(list(targets), message_text)
+                                labels = {future: targets[target] for target, future in futures.items()}
+                                lines: list[str] = []
+                                yield f"Sending to {len(futures)} channel(s)..."
+                                # Every batch of max_concurrency sends takes at most one send timeout;
+                                # one more covers scheduling.
+                                batches = math.ceil(len(futures) / BroadcastConfigLoader.MAX_CONCURRENCY)
+                                timeout = BroadcastConfigLoader.SEND_TIMEOUT * (batches + 1)
                                 try:
-                                    channel_id = int(channel_selection.split("ID: ")[1].rstrip(")"))
-                                    channel_obj = self.discord_bot.client.get_channel(channel_id)
-                                    if not channel_obj:
-                                        return "Channel not found"
-                                    # Type guard: PrivateChannel has no guild attribute
-                                    if not hasattr(channel_obj, 'guild'):
-                                        return "Channel has no guild"
-                                    if not channel_obj.guild:  # type: ignore[union-attr]
-                                        return "Channel has no guild"
-                                    guild_id = channel_obj.guild.id  # type: ignore[union-attr]
-                                except (ValueError, IndexError):
-                                    return "Invalid channel selection"
+                                    for future in as_completed(labels, timeout=timeout):
+                                        sent = future.result()
+                                        lines.append(f'- {"Sent" if sent else "Failed"}: {labels[future]}')
+                                        delivered = sum(line.startswith("- Sent") for line in lines)
+                                        yield f"Delivered {delivered}/{len(futures)}\n" + "\n".join(lines)
+                                except TimeoutError:
+                                    lines.extend(
+                                        f"- No result: {label}" for future, label in labels.items() if not future.done()
+                                    )
+                                    delivered = sum(line.startswith("- Sent") for line in lines)
+                                    yield (
+                                        f"Delivered {delivered}/{len(futures)}, stopped waiting after {timeout:g} s\n"
+                                        + "\n".join(lines)
+                                    )
+
+                    with gr.Row(visible=False) as broadcast_section:
+                        with gr.Column():
+                            gr.Markdown("## Broadcast Jobs")
+                            broadcast_guilds = gr.Dropdown(
+                                label="Guilds (empty = all)", choices=[], multiselect=True, interactive=True
+                            )
+                            broadcast_pattern = gr.Textbox(
+                                label="Channel Name Pattern", placeholder="e.g. announce* (empty = all channels)"
+                            )
+                            broadcast_message = gr.Textbox(
+                                label="Message", placeholder="Enter message to broadcast", lines=3
+                            )
+                            with gr.Row():
+                                broadcast_preview_btn = gr.Button("Preview Channels")
+                                broadcast_start_btn = gr.Button("Start Broadcast", variant="primary")
+                            broadcast_status = gr.Markdown("")
+                            broadcast_job_id = gr.Dropdown(label="Job", choices=[], interactive=True)
+                            with gr.Row():
+                                broadcast_refresh_btn = gr.Button("Refresh Jobs")
+                                broadcast_cancel_btn = gr.Button("Cancel Job", variant="stop")
+                            broadcast_jobs = gr.JSON(label="Jobs")
 
+                            def _broadcast_channels(guild_selection: list[str] | None, pattern: str) -> list[dict]:
+                                if not self.discord_bot:
+                                    return []
+                                guild_ids = [
+                                    int(selection.split("ID: ")[1].rstrip(")")) for selection in guild_selection or []
+                                ]
+                                return self.discord_bot.select_broadcast_channels(
+                                    guild_ids, (pattern or "").strip() or None
+                                )
+
+                            def refresh_broadcast_guilds():
+                                """Load the guild choices of the broadcast section."""
+                                if not self.check_available() or not self.discord_bot:
+                                    return gr.update(choices=[])
+                                return gr.update(
+                                    choices=[
+                                        "{} (ID: {})".format(guild["name"], guild["id"])
+                                        for guild in self.discord_bot.get_guilds()
+                                    ]
+                                )
+
+                            def preview_broadcast(guild_selection: list[str] | None, pattern: str) -> str:
+                                """List the channels a broadcast with the current filters would reach.
+
+                                Returns:
+                                    str: Markdown list of the selected channels or an error message.
+                                """
+                                guard = _bot_guard()
+                                if guard:
+                                    return guard
+                                channels = _broadcast_channels(guild_selection, pattern)
+                                if not channels:
+                                    return "No matching channels"
+                                return f"{len(channels)} channel(s):\n" + "\n".join(
+                                    f"- {channel['guild_name']} / #{channel['channel_name']}" for channel in channels
+                                )
+
+                            def refresh_broadcast_jobs():
+                                """Load the progress of all broadcast jobs.
+
+                                Returns:
+                                    tuple[gr.update, list[dict]]: Job choices and the job summaries.
+                                """
+                                if not self.check_available() or not self.discord_bot:
+                                    return (gr.update(choices=[]), [])
+                                jobs = self.discord_bot.get_broadcast_jobs()
+                                return (gr.update(choices=[job["job_id"] for job in jobs]), jobs)
+
+                            def start_broadcast(guild_selection: list[str] | None, pattern: str, message: str):
+                                """Start a resumable broadcast job for the selected channels.
+
+                                Returns:
+                                    tuple[str, gr.update, list[dict]]: Status message, job choices and job summaries.
+                                """
+                                guard = _bot_guard()
+                                if guard or not self.discord_bot:
+                                    return (guard or "Bot not available", *refresh_broadcast_jobs())
                                 message_text = (message or "").strip()
                                 if not message_text:
-                                    return "Message required"
+                                    return ("Message required", *refresh_broadcast_jobs())
+                                channels = _broadcast_channels(guild_selection, pattern)
+                                if not channels:
+                                    return ("No matching channels", *refresh_broadcast_jobs())
+                                job_id = self.discord_bot.start_broadcast_job(channels, message_text)
+                                if not job_id:
+                                    return ("Broadcast jobs need a database", *refresh_broadcast_jobs())
+                                return (
+                                    f"Started job {job_id} for {len(channels)} channel(s)",
+                                    *refresh_broadcast_jobs(),
+                                )
+
+                            def cancel_broadcast(job_id: str | None):
+                                """Cancel the selected broadcast job.
+
+                                Returns:
+                                    tuple[str, gr.update, list[dict]]: Status message, job choices and job summaries.
+                                """
+                                if not job_id or not self.discord_bot:
+                                    return ("Select a job", *refresh_broadcast_jobs())
+                                cancelled = self.discord_bot.cancel_broadcast_job(job_id)
+                                return (
+                                    (f"Cancelled job {job_id}" if cancelled else "Job is not running"),
+                                    *refresh_broadcast_jobs(),
+                                )
 
-                                success = self.discord_bot.send_message(guild_id, channel_id, message_text)
-                                return ("Message sent successfully" if success else "Failed to send message")
-                   
                     def switch_section(section: str):
                         """Switch visibility between different UI sections in the app.
 
@@ -315,18 +553,16 @@ class AdminPanel(ViewPort):
                             section (str): The name of the section to display. Supported values:
                                 - "Guild Management"
                                 - "Custom Messages"
+                                - "Broadcast Jobs"
 
                         Returns:
-                            tuple[gr.update, gr.update]: Two Gradio update objects controlling visibility of:
+                            tuple[gr.update, gr.update, gr.update]: Gradio updates controlling the visibility of:
                                 - The Guild Management section.
                                 - The Custom Messages section.
+                                - The Broadcast Jobs section.
                         """
-                        if section == "Guild Management":
-                            return (gr.update(visible=True), gr.update(visible=False))
-                        elif section == "Custom Messages":
-                            return (gr.update(visible=False), gr.update(visible=True))
-                        else:
-                            return (gr.update(visible=False), gr.update(visible=False))
+                        sections = ("Guild Management", "Custom Messages", "Broadcast Jobs")
+                        return tuple(gr.update(visible=section == name) for name in sections)
                     
                     gr.on(
                         triggers=[section_selector.change],
@@ -334,7 +570,8 @@ class AdminPanel(ViewPort):
                         inputs=section_selector,
                         outputs=[
                             guild_mgmt_section,
-                            custom_msg_section
+                            custom_msg_section,
+                            broadcast_section
                         ]
                     )
                     
@@ -347,6 +584,201 @@ class AdminPanel(ViewPort):
 
                     app.load(fn=refresh_channel_list, outputs=[channel_dropdown, channel_status])
 
+                    broadcast_preview_btn.click(
+                        fn=preview_broadcast, inputs=[broadcast_guilds, broadcast_pattern], outputs=[broadcast_status]
+                    )
+                    broadcast_start_btn.click(
+                        fn=start_broadcast,
+                        inputs=[broadcast_guilds, broadcast_pattern, broadcast_message],
+                        outputs=[broadcast_status, broadcast_job_id, broadcast_jobs],
+                    )
+                    broadcast_refresh_btn.click(fn=refresh_broadcast_jobs, outputs=[broadcast_job_id, broadcast_jobs])
+                    broadcast_cancel_btn.click(
+                        fn=cancel_broadcast,
+                        inputs=[broadcast_job_id],
+                        outputs=[broadcast_status, broadcast_job_id, broadcast_jobs],
+                    )
+                    app.load(fn=refresh_broadcast_guilds, outputs=[broadcast_guilds])
+
+                with gr.Tab("Diagnostics"):
+                    gr.Markdown("### Event Loop")
+                    diagnostics_refresh_btn = gr.Button("Refresh", variant="primary")
+                    diagnostics_summary = gr.Markdown("")
+                    diagnostics_handlers = gr.JSON(label="Handlers (slowest first)")
+                    diagnostics_stalls = gr.Markdown("")
+                    gr.Markdown("### Auto-translate")
+                    diagnostics_auto_translate = gr.Markdown("")
+
+                    def load_diagnostics():
+                        """Load event-loop lag, handler timings, recent stalls and auto-translate counters of the bot.
+
+                        Returns:
+                            tuple[str, dict, str, str]: Lag summary, per-handler timings, the recent
+                                stalls with their stack traces and the auto-translate counters as Markdown.
+                        """
+                        if not self.check_available() or not self.discord_bot:
+                            return ("No discord bot instance", {}, "", "")
+                        report = self.discord_bot.get_diagnostics()
+                        lag = report["loop_lag_ms"]
+                        summary = (
+                            f"Loop lag: last {lag['last']} ms, max {lag['max']} ms "
+                            f"(stall threshold {report['threshold_ms']} ms)"
+                        )
+                        counters = self.discord_bot.get_auto_translate_counters()
+                        auto_translate = (
+                            f'{counters["sent"]} sent, {counters["merged"]} merged into {counters["digests"]} digests, '
+                            f'**{counters["dropped"]} dropped** by the channel and guild send limits'
+                        )
+                        if not report["stalls"]:
+                            return (summary, report["handlers"], "No stalls recorded", auto_translate)
+                        stalls = "\n\n".join(
+                            f"**{stall['time']}** `{stall['handler']}` blocked for {stall['blocked_seconds']}s\n"
+                            f"```\n{stall['stack']}```"
+                            for stall in report["stalls"]
+                        )
+                        return (summary, report["handlers"], stalls, auto_translate)
+
+                    diagnostics_refresh_btn.click(
+                        fn=load_diagnostics,
+                        outputs=[
+                            diagnostics_summary,
+                            diagnostics_handlers,
+                            diagnostics_stalls,
+                            diagnostics_auto_translate,
+                        ],
+                    )
+
+                    gr.Markdown("### Command Profiling")
+                    with gr.Row():
+                        profile_command = gr.Dropdown(label="Command", choices=[], interactive=True)
+                        profile_runs = gr.Number(label="Next invocations", value=1, precision=0, minimum=1)
+                        profile_mode = gr.Radio(label="Profiler", choices=["cprofile", "sampling"], value="cprofile")
+                    with gr.Row():
+                        profile_arm_btn = gr.Button("Profile next invocations", variant="primary")
+                        profile_disarm_btn = gr.Button("Disarm")
+                        profile_refresh_btn = gr.Button("Refresh")
+                    profile_status = gr.Markdown("")
+                    profile_table = gr.Dataframe(
+                        headers=["#", "Command", "Time", "Profiler", "Duration (ms)"],
+                        datatype=["number", "str", "str", "str", "number"],
+                        interactive=False,
+                    )
+                    with gr.Row():
+                        profile_selection = gr.Dropdown(label="Profile", choices=[], interactive=True)
+                        profile_download_btn = gr.Button("Prepare download")
+                    profile_summary = gr.Code(label="Summary", language=None, interactive=False)
+                    profile_file = gr.File(label="Profile file", interactive=False)
+
+                    def _profile_entries() -> list[tuple[str, int, dict]]:
+                        if not self.discord_bot:
+                            return []
+                        profiles = self.discord_bot.get_command_profiles()
+                        return [
+                            (command, index, entry)
+                            for command, entries in profiles["results"].items()
+                            for index, entry in enumerate(entries)
+                        ]
+
+                    def refresh_profiles():
+                        """Load profilable commands, armed commands and stored profiles.
+
+                        Returns:
+                            tuple[gr.update, str, list[list], gr.update]: Command choices, armed
+                                commands, profile table rows and profile choices.
+                        """
+                        if not self.check_available() or not self.discord_bot:
+                            return (gr.update(choices=[]), "No discord bot instance", [], gr.update(choices=[]))
+                        profiles = self.discord_bot.get_command_profiles()
+                        armed = ", ".join(
+                            f"{command} ({state['runs']}x {state['mode']})"
+                            for command, state in profiles["armed"].items()
+                        )
+                        entries = _profile_entries()
+                        rows = [
+                            [number, command, entry["time"], entry["mode"], entry["duration_ms"]]
+                            for number, (command, _, entry) in enumerate(entries, start=1)
+                        ]
+                        choices = [
+                            f"{number}: {command} {entry['time']}"
+                            for number, (command, _, entry) in enumerate(entries, start=1)
+                        ]
+                        return (
+                            gr.update(choices=profiles["commands"]),
+                            f"Armed: {armed}" if armed else "No command armed",
+                            rows,
+                            gr.update(choices=choices, value=choices[-1] if choices else None),
+                        )
+
+                    def arm_profile(command: str | None, runs: float | None, mode: str):
+                        """Profile the next invocations of the selected command.
+
+                        Returns:
+                            tuple[gr.update, str, list[list], gr.update]: Same outputs as `refresh_profiles`.
+                        """
+                        if not self.check_available() or not self.discord_bot:
+                            return refresh_profiles()
+                        runs_value = _parse_positive_int(runs) or 1
+                        if not command:
+                            status = "Select a command"
+                        elif self.discord_bot.profile_command(command, runs_value, mode):
+                            status = f"Profiling the next {runs_value} invocation(s) of {command} with {mode}"
+                        else:
+                            status = f"Cannot profile {command}"
+                        command_choices, _, rows, profile_choices = refresh_profiles()
+                        return (command_choices, status, rows, profile_choices)
+
+                    def disarm_profile(command: str | None):
+                        """Stop profiling the selected command before its remaining armed invocations.
+
+                        Returns:
+                            tuple[gr.update, str, list[list], gr.update]: Same outputs as `refresh_profiles`.
+                        """
+                        if not self.check_available() or not self.discord_bot:
+                            return refresh_profiles()
+                        if not command:
+                            status = "Select a command"
+                        elif self.discord_bot.cancel_command_profiling(command):
+                            status = f"Stopped profiling {command}"
+                        else:
+                            status = f"{command} is not armed"
+                        command_choices, _, rows, profile_choices = refresh_profiles()
+                        return (command_choices, status, rows, profile_choices)
+
+                    def download_profile(selection: str | None):
+                        """Write the selected profile to a file.
+
+                        Returns:
+                            tuple[str, str | None]: Profile summary and the file path for download.
+                        """
+                        if not selection or not self.discord_bot:
+                            return ("", None)
+                        entries = _profile_entries()
+                        number = int(selection.split(":", 1)[0])
+                        if not 1 <= number <= len(entries):
+                            return ("Profile no longer stored", None)
+                        command, index, entry = entries[number - 1]
+                        return (entry["summary"], self.discord_bot.export_command_profile(command, index))
+
+                    profile_refresh_btn.click(
+                        fn=refresh_profiles, outputs=[profile_command, profile_status, profile_table, profile_selection]
+                    )
+                    profile_arm_btn.click(
+                        fn=arm_profile,
+                        inputs=[profile_command, profile_runs, profile_mode],
+                        outputs=[profile_command, profile_status, profile_table, profile_selection],
+                    )
+                    profile_disarm_btn.click(
+                        fn=disarm_profile,
+                        inputs=[profile_command],
+                        outputs=[profile_command, profile_status, profile_table, profile_selection],
+                    )
+                    profile_download_btn.click(
+                        fn=download_profile, inputs=[profile_selection], outputs=[profile_summary, profile_file]
+                    )
+                    app.load(
+                        fn=refresh_profiles, outputs=[profile_command, profile_status, profile_table, profile_selection]
+                    )
+
                 with gr.Tab("Database"):
                     with gr.Tabs():
                         with gr.Tab("Dishes"):
@@ -464,6 +896,7 @@ class AdminPanel(ViewPort):
                                 try:
                                     self.dbms.delete_data("dishes", {})
                                     self.db_loader.import_tables(force_reload=True, specific_table="dishes")
+                                    self.dbms.invalidate_cache("dishes")
                                     return "Dish table reset to initial data"
                                 
                                 except Exception as error:
@@ -582,6 +1015,7 @@ class AdminPanel(ViewPort):
                                 try:
                                     self.dbms.delete_data("fun_facts", {})
                                     self.db_loader.import_tables(force_reload=True, specific_table="fun_facts")
+                                    self.dbms.invalidate_cache("fun_facts")
                                     return "Fun facts table reset to initial data"
                                 
                                 except Exception as error:
@@ -610,26 +1044,82 @@ class AdminPanel(ViewPort):
                                 trans_input = gr.Textbox(label="Input", lines=5, placeholder="Enter text...")
                                 trans_output = gr.Textbox(label="Output", lines=5, interactive=False)
                             
+                            trans_batch = gr.Checkbox(label="Translate each line separately (batch)", value=False)
                             trans_btn = gr.Button("Translate", size="lg")
                             
-                            def translate(text: str) -> str:
+                            def translate(text: str, batch: bool) -> str:
                                 """Translate a given text using the controller or translator component.
 
                                 Args:
                                     text (str): The text to translate.
+                                    batch (bool): Translate every non-empty line on its own with one batched call.
 
                                 Returns:
                                     str: The translated text, or an error message if text is empty or no translation component is available.
                                 """
                                 if not text:
                                     return "Enter text"
+                                if batch and self.translator:
+                                    lines = [line for line in text.splitlines() if line.strip()]
+                                    return "\n".join(self.translator.translate_many(lines))
                                 if self.controller:
                                     return self.controller.translate_text(text)
                                 elif self.translator:
                                     return self.translator.execute_function(text)
                                 return "N/A"
                             
-                            trans_btn.click(fn=translate, inputs=trans_input, outputs=trans_output)
+                            trans_btn.click(fn=translate, inputs=[trans_input, trans_batch], outputs=trans_output)
+
+                            gr.Markdown("### User Language")
+
+                            with gr.Row():
+                                lang_user_id = gr.Number(label="User ID", precision=0)
+                                lang_code = gr.Textbox(label="Language Code", placeholder="e.g. de, fr, ja")
+                            lang_btn = gr.Button("Save Language")
+                            lang_status = gr.Markdown("")
+
+                            def set_user_language(user_id: float | None, language: str) -> str:
+                                """Save a Discord user's auto-translate target language.
+
+                                Args:
+                                    user_id (float | None): Discord ID of the user.
+                                    language (str): Language code to translate into.
+
+                                Returns:
+                                    str: A status message indicating success or failure.
+                                """
+                                if not user_id or not language or not language.strip():
+                                    return "Enter a user ID and a language code"
+                                if not self.translator:
+                                    return "N/A"
+                                try:
+                                    if self.translator.set_user_language(int(user_id), language):
+                                        return f"Language of user {int(user_id)} set to {language.strip().lower()}"
+                                    return "Failed to save language"
+                                except Exception as error:
+                                    return f"Error: {error}"
+
+                            lang_btn.click(fn=set_user_language, inputs=[lang_user_id, lang_code], outputs=lang_status)
+
+                            gr.Markdown("### Backend Status")
+
+                            backend_status_btn = gr.Button("Refresh Backend Status")
+                            backend_status_json = gr.JSON(label="Circuit Breaker, Retries and Cache")
+
+                            def load_backend_status() -> dict:
+                                """Load the circuit breaker state and retry counters of the translator.
+
+                                Returns:
+                                    dict: Backend status reported by the translator, or an error entry.
+                                """
+                                if not self.translator:
+                                    return {"error": "N/A"}
+                                try:
+                                    return self.translator.get_backend_status()
+                                except Exception as error:
+                                    return {"error": str(error)}
+
+                            backend_status_btn.click(fn=load_backend_status, outputs=backend_status_json)
                         
                         with gr.Tab("Statistics"):
                             gr.Markdown("### Database Statistics")
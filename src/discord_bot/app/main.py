@@ -1,20 +1,30 @@
 """Entry point for starting the Discord bot and admin panel."""
 
+import asyncio
 import discord
 import runpy
 import threading
 
 from discord_bot.business_logic.fun_fact_selector import FunFactSelector
 from discord_bot.business_logic.dish_selector import DishSelector
-from discord_bot.adapters.db import DBMS
+from discord_bot.adapters.db import DBMS, AsyncDBMS
+from discord_bot.adapters.cached_db import CachedDBMS
 from discord_bot.business_logic.translator import Translator
 from discord_bot.business_logic.discord_logic import DiscordLogic
-from discord_bot.init.config_loader import DBConfigLoader
+from discord_bot.init.config_loader import DBConfigLoader, MetricsConfigLoader, TranslatorConfigLoader
 from discord_bot.init.db_loader import DBLoader
+from discord_bot.init.metrics import MetricsServer
 from discord_bot.adapters.view import AdminPanel
 from discord_bot.adapters.controller.controller import Controller
-
-def start_bot(cv_db: DBMS, fun_fact_selector: FunFactSelector, dish_selector: DishSelector, translator: Translator, discord_bot: DiscordLogic) -> None:
+from discord_bot.contracts.ports import DatabasePort
+
+def start_bot(
+    cv_db: DatabasePort,
+    fun_fact_selector: FunFactSelector,
+    dish_selector: DishSelector,
+    translator: Translator,
+    discord_bot: DiscordLogic,
+) -> None:
     """Start the Discord bot."""
 
     async def funfact_command(interaction: discord.Interaction) -> None:
@@ -47,9 +57,13 @@ def start_bot(cv_db: DBMS, fun_fact_selector: FunFactSelector, dish_selector: Di
             await interaction.response.send_message("This message has no text content to translate.", ephemeral=True)
             return
 
-        translated_text = translator.execute_function(text_to_translate)
+        # Acknowledge within Discord's 3s window; the translation may take longer.
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        translated_text = await translator.execute_function_async(text_to_translate)
 
-        await interaction.response.send_message(f'**Original:** {text_to_translate}\n**Translated:** {translated_text}', ephemeral=True)
+        await interaction.followup.send(
+            f"**Original:** {text_to_translate}\n**Translated:** {translated_text}", ephemeral=True
+        )
 
     async def auto_translate_command(interaction: discord.Interaction, target: discord.Member) -> None:
         """Enable auto-translation of a member's messages for the current user.
@@ -58,9 +72,14 @@ def start_bot(cv_db: DBMS, fun_fact_selector: FunFactSelector, dish_selector: Di
             interaction (discord.Interaction): Interaction context for the command.
             target (discord.Member): Member to auto-translate.
         """
-        discord_bot.enable_auto_translate(target_user_id=target.id, subscriber_user_id=interaction.user.id, target_user_name=target.display_name, subscriber_user_name=interaction.user.display_name)
+        await asyncio.to_thread(
+            discord_bot.enable_auto_translate,
+            target_user_id=target.id,
+            subscriber_user_id=interaction.user.id,
+            target_user_name=target.display_name,
+            subscriber_user_name=interaction.user.display_name,
+        )
         await interaction.response.send_message(f'Auto-translate enabled for <@{target.id}>.')
-        discord_bot._update_command_usage("auto-translate")
 
     async def auto_translate_remove_command(interaction: discord.Interaction, target: discord.Member) -> None:
         """Disable auto-translation previously enabled for a member.
@@ -74,9 +93,22 @@ def start_bot(cv_db: DBMS, fun_fact_selector: FunFactSelector, dish_selector: Di
             await interaction.response.send_message(f'No auto-translate is set up for <@{target.id}>.')
             return
 
-        discord_bot.disable_auto_translate(target_user_id=target.id, subscriber_user_id=interaction.user.id)
+        await asyncio.to_thread(
+            discord_bot.disable_auto_translate, target_user_id=target.id, subscriber_user_id=interaction.user.id
+        )
         await interaction.response.send_message(f'Auto-translate disabled for <@{target.id}>.')
-        discord_bot._update_command_usage("auto-translate-remove")
+
+    async def language_command(interaction: discord.Interaction, language: str) -> None:
+        """Handle the `/language` command and save the user's auto-translate target language.
+
+        Args:
+            interaction (discord.Interaction): Interaction context for the command.
+            language (str): Language code chosen by the user.
+        """
+        await asyncio.to_thread(
+            translator.set_user_language, interaction.user.id, language, interaction.user.display_name
+        )
+        await interaction.response.send_message(f"Auto-translations for you are now in `{language}`.", ephemeral=True)
 
     async def auto_translate_list_command(interaction: discord.Interaction) -> None:
         """List all configured auto-translate targets in the guild.
@@ -91,23 +123,12 @@ def start_bot(cv_db: DBMS, fun_fact_selector: FunFactSelector, dish_selector: Di
 
         target_lines: list[str] = []
         for target_id, subscribers in targets.items():
-            subscriber_names: dict[int, str] = {}
-
-            if discord_bot.dbms:
-                for sid in subscribers:
-                    sub_records = discord_bot.dbms.get_data("auto_translate", {"target_user_id": target_id, "subscriber_user_id": sid})
-                    if sub_records:
-                        sub_name = sub_records[0].get("subscriber_user_name")
-                        if sub_name:
-                            subscriber_names[sid] = str(sub_name)
-
             target_label = f'<@{target_id}>'
             subscriber_labels = [f'<@{sid}>' for sid in subscribers]
             target_lines.append(f'- {target_label}: {", ".join(subscriber_labels)}')
 
         reply_content = "**Auto-translate targets:**\nTarget: Subscriber\n" + "\n".join(target_lines)
         await interaction.response.send_message(reply_content)
-        discord_bot._update_command_usage("auto-translate-list")
 
     dish_categories = cv_db.get_distinct_values("dishes", "category")
 
@@ -117,6 +138,13 @@ def start_bot(cv_db: DBMS, fun_fact_selector: FunFactSelector, dish_selector: Di
     discord_bot.register_command("auto-translate", auto_translate_command, description="Auto-translate a user's messages and display it in the channel visible to everyone", user_option=True)
     discord_bot.register_command("auto-translate-remove", auto_translate_remove_command, description="Stop auto-translate for a user", user_option=True)
     discord_bot.register_command("auto-translate-list", auto_translate_list_command, description="List current auto-translate targets")
+    discord_bot.register_command(
+        "language",
+        language_command,
+        description="Set the language your auto-translations are shown in",
+        option_name="language",
+        choices=list(TranslatorConfigLoader.LANGUAGE_CHOICES),
+    )
 
     discord_bot.run()
 
@@ -124,18 +152,18 @@ if __name__ == "__main__":
     runpy.run_module("discord_bot.init.log_loader", run_name="__main__")
     runpy.run_module("discord_bot.init.db_loader", run_name="__main__")
 
-    cv_db = DBMS(db_name=DBConfigLoader.CV_DB_NAME)
+    # Dishes and fun facts are served from memory; the admin panel writes through the same
+    # cached port so its changes invalidate the cache.
+    cv_db = CachedDBMS(DBMS(db_name=DBConfigLoader.CV_DB_NAME))
     cv_db.connect()
 
-    discord_db = DBMS(db_name=DBConfigLoader.DISCORD_DB_NAME)
+    discord_db = AsyncDBMS(db_name=DBConfigLoader.DISCORD_DB_NAME)
     discord_db.connect()
 
-    general_db = DBMS()
-    general_db.connect()
-
     dish_selector = DishSelector(dbms=cv_db)
     fun_fact_selector = FunFactSelector(dbms=cv_db)
     translator = Translator(dbms=discord_db)
+    translator.warm_language_cache()
 
     discord_bot = DiscordLogic(dbms=discord_db)
     discord_bot.set_translator(translator)
@@ -149,7 +177,7 @@ if __name__ == "__main__":
     )
 
     panel = AdminPanel(
-        dbms=general_db,
+        dbms=cv_db,
         discord_bot=discord_bot,
         dish_selector=dish_selector,
         fun_fact_selector=fun_fact_selector,
@@ -158,5 +186,15 @@ if __name__ == "__main__":
         db_loader=db_loader
     )
 
+    if MetricsConfigLoader.ENABLED:
+        try:
+            MetricsServer().start()
+        except OSError as error:
+            # A busy port only costs the metrics endpoint, not the bot.
+            discord_bot.logging(
+                f"Metrics endpoint not started on {MetricsConfigLoader.HOST}:{MetricsConfigLoader.PORT}: {error}",
+                level="error",
+            )
+
     threading.Thread(target=start_bot, args=(cv_db, fun_fact_selector, dish_selector, translator, discord_bot), daemon=False).start()
     panel.launch()
@@ -0,0 +1,286 @@
+"""Resumable broadcast jobs that send one admin message to many channels."""
+
+import asyncio
+import fnmatch
+import random
+import threading
+import uuid
+from datetime import datetime
+from typing import Any
+
+from discord_bot.contracts.ports import DatabasePort
+from discord_bot.business_logic.model import Model
+from discord_bot.business_logic.rate_limiter import TokenBucket
+from discord_bot.init.config_loader import BroadcastConfigLoader
+
+class BroadcastManager(Model):
+    """Run broadcast jobs with bounded concurrency, a global send rate and retries.
+
+    Jobs and the delivery state of every target are stored in the `broadcast_jobs` table, so jobs
+    that were still running when the bot stopped continue after the next start. Progress is written
+    every `persist_every` finished targets; targets sent after the last write are sent again on
+    resume (at-least-once delivery).
+
+    Jobs are created, cancelled and listed from admin panel threads while the bot's event loop
+    delivers them, so `jobs`, the task map and every job's status and targets change under `_lock`.
+    """
+    TABLE_NAME = "broadcast_jobs"
+
+    def __init__(
+        self,
+        discord_bot,
+        dbms: DatabasePort,
+        max_concurrency: int | None = None,
+        rate: float | None = None,
+        max_retries: int | None = None,
+        persist_every: int | None = None,
+    ) -> None:
+        super().__init__()
+        self.discord_bot = discord_bot
+        self.dbms = dbms
+        self.max_concurrency = max_concurrency or BroadcastConfigLoader.MAX_CONCURRENCY
+        self.rate = rate or BroadcastConfigLoader.RATE
+        self.max_retries = BroadcastConfigLoader.MAX_RETRIES if max_retries is None else max_retries
+        self.persist_every = persist_every or BroadcastConfigLoader.PERSIST_EVERY
+        self.retry_delay = 1.0
+        # One bucket for all jobs, so parallel jobs together stay below the configured send rate.
+        self._bucket = TokenBucket(self.rate, self.max_concurrency)
+        self.jobs: dict[str, dict] = {}
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock = threading.Lock()
+
+    def execute_function(self) -> None:
+        pass
+
+    def select_channels(self, guild_ids: list[int] | None = None, name_pattern: str | None = None) -> list[dict]:
+        """List the text channels the bot may write to, filtered by guild and channel name.
+
+        Args:
+            guild_ids (list[int] | None): Only channels of these guilds; all guilds if empty.
+            name_pattern (str | None): Shell-style pattern for the channel name, e.g. ``"announce*"``.
+
+        Returns:
+            list[dict]: ``guild_id``, ``guild_name``, ``channel_id`` and ``channel_name`` per channel.
+        """
+        channels: list[dict] = []
+        for guild in self.discord_bot.client.guilds:
+            if guild_ids and guild.id not in guild_ids:
+                continue
+            for channel in guild.text_channels:
+                if name_pattern and not fnmatch.fnmatch(channel.name, name_pattern):
+                    continue
+                if not channel.permissions_for(guild.me).send_messages:
+                    continue
+                channels.append(
+                    {
+                        "guild_id": guild.id,
+                        "guild_name": guild.name,
+                        "channel_id": channel.id,
+                        "channel_name": channel.name,
+                    }
+                )
+        return channels
+
+    def create_job(self, channels: list[dict], message: str) -> str:
+        """Store a new job and start it on the bot's event loop.
+
+        Args:
+            channels (list[dict]): Targets as returned by `select_channels`.
+            message (str): Message to broadcast.
+
+        Returns:
+            str: ID of the new job.
+        """
+        now = datetime.now().isoformat()
+        job: dict[str, Any] = {
+            "job_id": uuid.uuid4().hex,
+            "message": message,
+            "status": "running",
+            "created_at": now,
+            "updated_at": now,
+            "targets": [{**channel, "status": "pending", "attempts": 0} for channel in channels],
+        }
+        self._count(job)
+        self.dbms.insert_data(self.TABLE_NAME, dict(job))
+        with self._lock:
+            self.jobs[job["job_id"]] = job
+        self._submit(job)
+        self.logging(f'Created broadcast job {job["job_id"]} for {len(channels)} channels')
+        return job["job_id"]
+
+    def cancel_job(self, job_id: str) -> bool:
+        """Stop a running job; targets not sent yet stay pending.
+
+        Returns:
+            bool: True if the job was running.
+        """
+        with self._lock:
+            job = self.jobs.get(job_id)
+            if not job or job["status"] != "running":
+                return False
+            # A task that has not started yet sees the status and sends nothing.
+            job["status"] = "cancelled"
+            task = self._tasks.get(job_id)
+        if task is not None and self._loop is not None:
+            # The task stores the final state when it ends.
+            self._loop.call_soon_threadsafe(task.cancel)
+        else:
+            self.dbms.update_data(self.TABLE_NAME, {"job_id": job_id}, {"status": "cancelled"})
+        return True
+
+    def get_job(self, job_id: str) -> dict | None:
+        with self._lock:
+            job = self.jobs.get(job_id)
+            if job is not None:
+                return self._summary(job)
+        rows = self.dbms.get_data(self.TABLE_NAME, {"job_id": job_id})
+        return self._summary(rows[0]) if rows else None
+
+    def list_jobs(self) -> list[dict]:
+        """Return a summary of every stored job, newest first, with live progress for jobs in memory."""
+        jobs = {row["job_id"]: row for row in self.dbms.get_data(self.TABLE_NAME, {})}
+        with self._lock:
+            jobs.update(self.jobs)
+            summaries = [self._summary(job) for job in jobs.values()]
+        return sorted(summaries, key=lambda job: job.get("created_at") or "", reverse=True)
+
+    async def resume_jobs(self) -> int:
+        """Continue every job that was running when the bot last stopped.
+
+        Returns:
+            int: Number of resumed jobs.
+        """
+        self._loop = asyncio.get_running_loop()
+        try:
+            rows = await self.dbms.get_data_async(self.TABLE_NAME, {"status": "running"})
+        except Exception as error:
+            self.logging(f"Error loading broadcast jobs: {error}", level="error")
+            return 0
+
+        resumed = 0
+        for job in rows:
+            job.pop("_id", None)
+            with self._lock:
+                if job["job_id"] in self._tasks:
+                    continue
+                self.jobs[job["job_id"]] = job
+                self._tasks[job["job_id"]] = self._loop.create_task(self._run(job))
+            resumed += 1
+        if resumed:
+            self.logging(f"Resumed {resumed} broadcast jobs")
+        return resumed
+
+    async def stop(self) -> None:
+        """Persist the progress of running jobs; they resume on the next start."""
+        with self._lock:
+            tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _submit(self, job: dict) -> None:
+        """Start a job on the bot's event loop from any thread."""
+        loop = self._loop or self.discord_bot.loop
+        if loop is None:
+            # The bot is not connected yet; resume_jobs() picks the stored job up once it is.
+            return
+        self._loop = loop
+
+        def start() -> None:
+            with self._lock:
+                self._tasks[job["job_id"]] = loop.create_task(self._run(job))
+
+        loop.call_soon_threadsafe(start)
+
+    async def _send(self, job: dict, target: dict) -> bool:
+        """Send the job message to one target once the rate limit allows it."""
+        while not self._bucket.available():
+            await asyncio.sleep(self._bucket.wait_time())
+        self._bucket.consume()
+        with self._lock:
+            target["attempts"] += 1
+        try:
+            return await asyncio.wait_for(
+                self.discord_bot.send_message_async(target["guild_id"], target["channel_id"], job["message"]),
+                BroadcastConfigLoader.SEND_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            with self._lock:
+                target["error"] = "timeout"
+            return False
+
+    async def _run(self, job: dict) -> None:
+        """Deliver every pending target of a job."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        finished_since_persist = 0
+
+        async def deliver(target: dict) -> None:
+            nonlocal finished_since_persist
+            async with semaphore:
+                # Checked before every send, so a cancelled job stops even if its task had not started yet.
+                while target["status"] == "pending" and job["status"] == "running":
+                    sent = await self._send(job, target)
+                    with self._lock:
+                        if sent:
+                            target["status"] = "sent"
+                        elif target["attempts"] > self.max_retries:
+                            target["status"] = "failed"
+                    if not sent and target["status"] == "pending":
+                        # Exponential backoff with jitter before the next attempt of this channel.
+                        await asyncio.sleep(random.uniform(0, self.retry_delay * 2 ** (target["attempts"] - 1)))
+
+            finished_since_persist += 1
+            if finished_since_persist >= self.persist_every:
+                finished_since_persist = 0
+                await self._persist(job)
+
+        try:
+            await asyncio.gather(*(deliver(target) for target in job["targets"] if target["status"] == "pending"))
+            with self._lock:
+                if job["status"] == "running":
+                    job["status"] = "completed"
+                self._count(job)
+            self.logging(f'Broadcast job {job["job_id"]} {job["status"]}: {job["sent"]} sent, {job["failed"]} failed')
+        finally:
+            await asyncio.shield(self._persist(job))
+            with self._lock:
+                self._tasks.pop(job["job_id"], None)
+
+    @staticmethod
+    def _count(job: dict) -> None:
+        for status in ("pending", "sent", "failed"):
+            job[status] = sum(target["status"] == status for target in job["targets"])
+
+    async def _persist(self, job: dict) -> None:
+        """Write the job status, counters and per-target delivery state."""
+        with self._lock:
+            self._count(job)
+            job["updated_at"] = datetime.now().isoformat()
+            fields = {key: job[key] for key in ("status", "updated_at", "pending", "sent", "failed")}
+            # Copied, since the database thread encodes them while deliveries go on.
+            fields["targets"] = [dict(target) for target in job["targets"]]
+        try:
+            await self.dbms.update_data_async(self.TABLE_NAME, {"job_id": job["job_id"]}, fields)
+        except Exception as error:
+            self.logging(f'Error saving broadcast job {job["job_id"]}: {error}', level="error")
+
+    def _summary(self, job: dict) -> dict:
+        """Return the job without its target list, plus the channels that failed; callers hold `_lock` for live jobs."""
+        self._count(job)
+        return {
+            "job_id": job["job_id"],
+            "status": job["status"],
+            "created_at": job.get("created_at"),
+            "message": job["message"],
+            "total": len(job["targets"]),
+            "pending": job["pending"],
+            "sent": job["sent"],
+            "failed": job["failed"],
+            "retries": sum(max(0, target["attempts"] - 1) for target in job["targets"]),
+            "failed_channels": [
+                f"{target.get('guild_name')} / #{target.get('channel_name')}"
+                for target in job["targets"]
+                if target["status"] == "failed"
+            ],
+        }
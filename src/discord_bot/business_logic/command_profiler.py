@@ -0,0 +1,192 @@
+"""Opt-in profiling of the next invocations of a command, with results kept per command."""
+
+import cProfile
+import io
+import pstats
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter, deque
+from collections.abc import Awaitable
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from discord_bot.business_logic.model import Model
+from discord_bot.init.config_loader import ProfilingConfigLoader
+
+PROFILE_MODES = ("cprofile", "sampling")
+
+class CommandProfiler(Model):
+    """Profile the next ``runs`` invocations of an armed command with cProfile or a sampling profiler.
+
+    Commands that are not armed pass through `run` with a single dictionary lookup. Both profilers
+    observe the whole event-loop thread while the command is awaited, so tasks interleaving with the
+    command appear in its profile too. Only one invocation is profiled at a time; one that starts
+    while another is being profiled runs unprofiled and does not use up an armed run.
+
+    - ``cprofile`` records every call deterministically; results download as a pstats ``.prof`` file
+      (readable with ``python -m pstats`` or snakeviz).
+    - ``sampling`` reads the loop thread's stack every ``sample_interval`` seconds from a separate
+      thread, which adds almost no overhead to the command itself; results download as folded
+      stacks (``frame;frame;frame count``) for flamegraph tools.
+    """
+    def __init__(
+        self, max_results: int | None = None, sample_interval: float | None = None, top_functions: int | None = None
+    ) -> None:
+        super().__init__()
+        self.max_results = max_results or ProfilingConfigLoader.MAX_RESULTS
+        self.sample_interval = sample_interval or ProfilingConfigLoader.SAMPLE_INTERVAL
+        self.top_functions = top_functions or ProfilingConfigLoader.TOP_FUNCTIONS
+        self.armed: dict[str, dict[str, Any]] = {}
+        self.results: dict[str, deque[dict]] = {}
+        self._active = False
+        # `arm` and the result readers run on the admin panel thread, `run` on the event loop.
+        self._lock = threading.Lock()
+
+    def execute_function(self) -> None:
+        pass
+
+    def arm(self, command: str, runs: int = 1, mode: str = "cprofile") -> None:
+        """Profile the next ``runs`` invocations of ``command`` with the profiler ``mode``."""
+        if mode not in PROFILE_MODES:
+            raise ValueError(f'Unknown profile mode {mode!r}, expected one of {", ".join(PROFILE_MODES)}')
+        if runs < 1:
+            raise ValueError("runs must be at least 1")
+        with self._lock:
+            self.armed[command] = {"runs": runs, "mode": mode}
+        self.logging(f"Profiling the next {runs} invocation(s) of {command} with {mode}")
+
+    def disarm(self, command: str) -> bool:
+        with self._lock:
+            return self.armed.pop(command, None) is not None
+
+    async def run(self, command: str, awaitable: Awaitable) -> Any:
+        """Await a command callback, profiling it if ``command`` is armed."""
+        mode: str | None = None
+        with self._lock:
+            armed = self.armed.get(command)
+            if armed is not None and not self._active:
+                mode = armed["mode"]
+                armed["runs"] -= 1
+                if armed["runs"] <= 0:
+                    self.armed.pop(command, None)
+                self._active = True
+        if mode is None:
+            return await awaitable
+
+        started = time.perf_counter()
+        try:
+            if mode == "cprofile":
+                profile = cProfile.Profile()
+                profile.enable()
+                try:
+                    return await awaitable
+                finally:
+                    profile.disable()
+                    self._store(command, mode, time.perf_counter() - started, self._cprofile_result(profile))
+            sampler = _StackSampler(threading.get_ident(), self.sample_interval)
+            sampler.start()
+            try:
+                return await awaitable
+            finally:
+                sampler.stop()
+                self._store(command, mode, time.perf_counter() - started, self._sampling_result(sampler))
+        finally:
+            self._active = False
+
+    def _cprofile_result(self, profile: cProfile.Profile) -> dict:
+        summary = io.StringIO()
+        stats = pstats.Stats(profile, stream=summary)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top_functions)
+        return {"summary": summary.getvalue(), "data": stats}
+
+    def _sampling_result(self, sampler: "_StackSampler") -> dict:
+        total = sum(sampler.stacks.values())
+        lines = [
+            f"{total} samples every {self.sample_interval * 1000:g} ms, innermost frame of the most frequent stacks:"
+        ]
+        for stack, count in sampler.stacks.most_common(self.top_functions):
+            lines.append(f'{count:>6} {count / total:6.1%}  {stack.rsplit(";", 1)[-1]}')
+        return {"summary": "\n".join(lines), "data": sampler.stacks}
+
+    def _store(self, command: str, mode: str, duration: float, result: dict) -> None:
+        entry = {
+            "time": datetime.now().isoformat(timespec="seconds"),
+            "mode": mode,
+            "duration_ms": round(duration * 1000, 2),
+            **result,
+        }
+        with self._lock:
+            self.results.setdefault(command, deque(maxlen=self.max_results)).append(entry)
+        self.logging(lambda: f"Profiled {command} with {mode} in {duration * 1000:.1f} ms")
+
+    def get_results(self) -> dict:
+        """Return armed commands and the stored profiles per command without their raw data."""
+        with self._lock:
+            return {
+                "armed": {command: dict(armed) for command, armed in self.armed.items()},
+                "results": {
+                    command: [{key: value for key, value in entry.items() if key != "data"} for entry in entries]
+                    for command, entries in self.results.items()
+                },
+            }
+
+    def export(self, command: str, index: int = -1, directory: Path | None = None) -> Path | None:
+        """Write a stored profile of ``command`` to a file and return its path.
+
+        Args:
+            command (str): Profiled command name.
+            index (int): Position in the command's stored profiles, oldest first; ``-1`` is the latest.
+            directory (Path | None): Target directory, a temporary directory by default.
+
+        Returns:
+            Path | None: ``.prof`` file for cProfile, ``.folded`` text file for sampling, or ``None``
+                if there is no such profile.
+        """
+        with self._lock:
+            entries = self.results.get(command)
+            try:
+                entry = entries[index] if entries else None
+            except IndexError:
+                entry = None
+        if entry is None:
+            return None
+        directory = directory or Path(tempfile.gettempdir()) / "discord_bot_profiles"
+        directory.mkdir(parents=True, exist_ok=True)
+        name = f'{command.replace(" ", "_")}-{entry["time"].replace(":", "")}-{entry["mode"]}'
+        if entry["mode"] == "cprofile":
+            path = directory / f"{name}.prof"
+            entry["data"].dump_stats(path)
+        else:
+            path = directory / f"{name}.folded"
+            path.write_text("".join(f"{stack} {count}\n" for stack, count in entry["data"].items()), encoding="utf-8")
+        return path
+
+class _StackSampler:
+    """Thread collecting the stacks of another thread as folded strings, outermost frame first."""
+    def __init__(self, thread_id: int, interval: float) -> None:
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, name="command-profiler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _sample(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if names:
+                self.stacks[";".join(reversed(names))] += 1
@@ -1,14 +1,53 @@
 """Concrete implementation of `DiscordLogicPort` using `discord.py`."""
 
 import asyncio
+import time
+from concurrent.futures import Future
 from datetime import datetime
-from typing import Callable
+from typing import Any, Awaitable, Callable
 import discord
 from discord import app_commands
 
 from discord_bot.contracts.ports import DiscordLogicPort, DatabasePort, TranslatePort
-from discord_bot.init.config_loader import DiscordConfigLoader
+from discord_bot.init.config_loader import DiscordConfigLoader, RateLimitConfigLoader, BroadcastConfigLoader
+from discord_bot.init.metrics import METRICS
 from discord_bot.business_logic.model import Model
+from discord_bot.business_logic.message_buffer import MessageBuffer
+from discord_bot.business_logic.stats_aggregator import StatsAggregator
+from discord_bot.business_logic.broadcast_manager import BroadcastManager
+from discord_bot.business_logic.loop_watchdog import LoopWatchdog
+from discord_bot.business_logic.command_profiler import CommandProfiler
+from discord_bot.business_logic.retention_manager import RetentionManager
+from discord_bot.business_logic.rate_limiter import TokenBucket
+
+DISCORD_MESSAGE_LIMIT = 2000
+
+AUTO_TRANSLATIONS = METRICS.counter(
+    "discord_bot_auto_translations_total",
+    "Auto-translations by outcome: sent directly, merged into a digest, dropped, and digest messages sent.",
+    ("outcome",),
+)
+COMMAND_LATENCY = METRICS.histogram(
+    "discord_bot_command_seconds",
+    "Latency of slash and context menu commands by command and outcome.",
+    ("command", "outcome"),
+)
+
+class _Client(discord.Client):
+    """`discord.Client` that awaits ``before_close`` once before the connection is closed.
+
+    discord.py closes the client itself on Ctrl-C and when `run` returns, so this sees every shutdown.
+    """
+    def __init__(self, before_close: Callable[[], Awaitable[None]], **options: Any) -> None:
+        super().__init__(**options)
+        self._before_close = before_close
+        self._before_close_task: asyncio.Future | None = None
+
+    async def close(self) -> None:
+        if self._before_close_task is None:
+            self._before_close_task = asyncio.ensure_future(self._before_close())
+        await self._before_close_task
+        await super().close()
 
 class DiscordLogic(Model, DiscordLogicPort):
     """Discord bot logic using `discord.py` library."""
@@ -18,15 +57,28 @@ class DiscordLogic(Model, DiscordLogicPort):
         intents.message_content = True
         intents.guilds = True
         intents.members = True
-        self.client = discord.Client(intents=intents)
+        self.client = _Client(self._flush_on_close, intents=intents)
         self.tree = app_commands.CommandTree(self.client)
         self.loop = None
         self.guild_count = 0
         self.commands: dict[str, Callable] = {}
         self.unread_dms: list[dict] = []
         self.dbms = dbms
+        self.message_buffer = MessageBuffer(dbms) if dbms else None
+        self.stats_aggregator = StatsAggregator(dbms) if dbms else None
+        self.broadcast_manager = BroadcastManager(self, dbms) if dbms else None
+        self.retention_manager = RetentionManager(dbms) if dbms else None
         self.translator: TranslatePort | None = None
         self.auto_translate_targets: dict[int, set[int]] = {}
+        # Auto-translate output is limited per channel and per guild; while a limit is exhausted the
+        # translations of a channel wait in a digest that is sent as one message.
+        self._channel_buckets: dict[int, TokenBucket] = {}
+        self._guild_buckets: dict[int, TokenBucket] = {}
+        self._digests: dict[int, list[str]] = {}
+        self._digest_tasks: dict[int, asyncio.Task] = {}
+        self.auto_translate_counters = {"sent": 0, "merged": 0, "dropped": 0, "digests": 0}
+        self.watchdog = LoopWatchdog()
+        self.profiler = CommandProfiler()
         if self.dbms:
             self._load_auto_translate_targets()
         
@@ -34,27 +86,32 @@ class DiscordLogic(Model, DiscordLogicPort):
         async def on_ready():
             """Event handler for when the bot is ready."""
             self.loop = asyncio.get_running_loop()
-            await self._on_ready()
+            await self.watchdog.run("on_ready", self._on_ready())
         
         @self.client.event
         async def on_message(message):
-            await self.on_message(message)
+            await self.watchdog.run("on_message", self.on_message(message))
 
         @self.client.event
         async def on_guild_join(guild: discord.Guild):
             """Event handler for when the bot joins a guild."""
             self.logging(f'Joined guild: {guild.name} ({guild.id})')
-            self._update_connected_guilds()
+            await self.watchdog.run("on_guild_join", self._update_connected_guilds())
 
         @self.client.event
         async def on_guild_remove(guild: discord.Guild):
             """Event handler for when the bot leaves a guild."""
             self.logging(f'Left guild: {guild.name} ({guild.id})')
-            self._update_connected_guilds()
+            await self.watchdog.run("on_guild_remove", self._update_connected_guilds())
 
     async def _on_ready(self) -> None:
         """"Handle bot readiness: sync commands and update guild stats."""
         self.logging(f'Logged in as {self.client.user}')
+        if self.stats_aggregator:
+            self.stats_aggregator.start()
+        if self.retention_manager:
+            self.retention_manager.start()
+        self.watchdog.start()
         
         await self.tree.sync()
         self.logging(f'Synced {len(self.tree.get_commands())} slash commands globally')
@@ -63,7 +120,20 @@ class DiscordLogic(Model, DiscordLogicPort):
             await self.tree.sync(guild=guild)
             self.logging(f'Synced to guild: {guild.name}')
 
-        self._update_connected_guilds()
+        await self._update_connected_guilds()
+        if self.broadcast_manager:
+            await self.broadcast_manager.resume_jobs()
+
+    async def _run_command(self, command: str, callback: Callable, interaction: discord.Interaction, *args) -> None:
+        """Run a command callback, profile it if armed, record its latency and count its usage."""
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            await self.watchdog.run(f"command:{command}", self.profiler.run(command, callback(interaction, *args)))
+            outcome = "success"
+        finally:
+            COMMAND_LATENCY.observe(time.perf_counter() - started, command, outcome)
+        self._update_command_usage(command)
 
     async def on_message(self, message: discord.Message) -> None:
         if message.author == self.client.user:
@@ -76,11 +146,13 @@ class DiscordLogic(Model, DiscordLogicPort):
                 "user_name": str(message.author),
                 "content": message.content,
                 "timestamp": message.created_at.isoformat(),
+                # Stored as a date so the TTL index and the archival job can compare it.
+                "created_at": message.created_at,
                 "read": False,
                 "is_command": message.content.startswith("/") and message.content in self.commands
             }
             self.unread_dms.append(dm_data)
-            self._save_direct_message(dm_data)
+            await self._save_direct_message(dm_data)
         else:
             message_data = {
                 "message_id": message.id,
@@ -90,9 +162,10 @@ class DiscordLogic(Model, DiscordLogicPort):
                 "user_name": str(message.author),
                 "content": message.content,
                 "timestamp": message.created_at.isoformat(),
+                "created_at": message.created_at,
                 "is_command": message.content.startswith("/") and message.content in self.commands
             }
-            self._save_message(message_data)
+            await self._save_message(message_data)
 
         if self.translator and message.author.id in self.auto_translate_targets:
             subscribers = list(self.auto_translate_targets.get(message.author.id, set()))
@@ -102,39 +175,226 @@ class DiscordLogic(Model, DiscordLogicPort):
                 self.logging(f'Auto-translate skipped for {message.author.display_name}: no translatable text content.', log_file_name="translator")
                 return
 
+            try:
+                languages = await asyncio.to_thread(self.translator.get_target_languages, subscribers)
+            except Exception as error:
+                self.logging(
+                    f"Error looking up auto-translate languages: {error}", log_file_name="translator", level="error"
+                )
+                return
+
+            # Translate and send once per target language instead of once per subscriber.
+            groups: dict[str, list[int]] = {}
             for subscriber_id in subscribers:
-                translated = self.translator.execute_function(text_content, user_id=subscriber_id)
-                try:
-                    await message.channel.send(f'**Auto-translate** for <@{subscriber_id}> from <@{message.author.id}>:\n**Translated**: {translated}')
-                
-                except Exception as error:
-                    self.logging(f'Failed to send auto-translation in channel: {error}', log_file_name="translator")
+                groups.setdefault(languages[subscriber_id], []).append(subscriber_id)
+
+            translations = await asyncio.gather(
+                *(self.translator.translate_to_async(text_content, language) for language in groups)
+            )
+            guild_id = message.guild.id if message.guild else None
+            for subscriber_ids, translated in zip(groups.values(), translations):
+                mentions = " ".join(f"<@{subscriber_id}>" for subscriber_id in sorted(subscriber_ids))
+                await self._send_auto_translation(
+                    message.channel, guild_id, f"{mentions} from <@{message.author.id}>:\n**Translated**: {translated}"
+                )
+
+    def _buckets(self, channel_id: int, guild_id: int | None) -> list[TokenBucket]:
+        """Return the token buckets that limit sends to a channel, creating them on first use."""
+        buckets = [
+            self._channel_buckets.setdefault(
+                channel_id, TokenBucket(RateLimitConfigLoader.CHANNEL_RATE, RateLimitConfigLoader.CHANNEL_BURST)
+            )
+        ]
+        if guild_id is not None:
+            buckets.append(
+                self._guild_buckets.setdefault(
+                    guild_id, TokenBucket(RateLimitConfigLoader.GUILD_RATE, RateLimitConfigLoader.GUILD_BURST)
+                )
+            )
+        return buckets
+
+    async def _send_auto_translation(self, channel, guild_id: int | None, entry: str) -> None:
+        """Send one auto-translation, or add it to the channel's digest while the send limit is exhausted.
 
-    def send_message(self, guild_id: int, channel_id: int, message: str) -> bool:
-        if not self.client.is_ready() or not self.loop:
-            return False
+        Args:
+            channel: Channel the original message was posted in.
+            guild_id (int | None): Guild of the channel, None for DMs.
+            entry (str): Mentions and translated text.
+        """
+        buckets = self._buckets(channel.id, guild_id)
+        # Once a digest is pending, later entries join it so the channel keeps the message order.
+        if channel.id not in self._digests and all(bucket.available() for bucket in buckets):
+            for bucket in buckets:
+                bucket.consume()
+            self._count_auto_translation("sent")
+            try:
+                await channel.send(f"**Auto-translate** for {entry}")
+            except Exception as error:
+                self.logging(
+                    f"Failed to send auto-translation in channel: {error}", log_file_name="translator", level="error"
+                )
+            return
 
+        digest = self._digests.setdefault(channel.id, [])
+        if len(digest) >= RateLimitConfigLoader.MAX_DIGEST_ENTRIES:
+            self._count_auto_translation("dropped")
+            return
+        digest.append(entry)
+        self._count_auto_translation("merged")
+        if channel.id not in self._digest_tasks:
+            self._digest_tasks[channel.id] = asyncio.get_running_loop().create_task(
+                self._send_digest(channel, guild_id)
+            )
+
+    async def _send_digest(self, channel, guild_id: int | None) -> None:
+        """Wait until the channel may be written to again and send all pending entries as one message."""
+        buckets = self._buckets(channel.id, guild_id)
+        try:
+            while not all(bucket.available() for bucket in buckets):
+                await asyncio.sleep(max(bucket.wait_time() for bucket in buckets))
+            for bucket in buckets:
+                bucket.consume()
+
+            entries = self._digests.pop(channel.id, [])
+            content = f"**Auto-translate digest** ({len(entries)} messages)"
+            for entry in entries:
+                if len(content) + len(entry) + 3 > DISCORD_MESSAGE_LIMIT:
+                    self._count_auto_translation("dropped")
+                    continue
+                content += f"\n- {entry}"
+            self._count_auto_translation("digests")
+            await channel.send(content)
+        except Exception as error:
+            self.logging(
+                f"Failed to send auto-translation digest in channel: {error}", log_file_name="translator", level="error"
+            )
+        finally:
+            self._digests.pop(channel.id, None)
+            self._digest_tasks.pop(channel.id, None)
+
+    def _count_auto_translation(self, outcome: str) -> None:
+        self.auto_translate_counters[outcome] += 1
+        AUTO_TRANSLATIONS.inc(outcome)
+
+    def get_auto_translate_counters(self) -> dict:
+        return dict(self.auto_translate_counters)
+
+    def _resolve_channel(self, guild_id: int, channel_id: int):
+        """Return the sendable channel for the IDs, or None if it does not exist or cannot receive messages."""
         guild = self.client.get_guild(guild_id)
         if not guild:
-            return False
+            return None
 
         channel = guild.get_channel(channel_id)
         if not channel:
-            return False
+            return None
         
         # Type check: only TextChannel has send method
         if not isinstance(channel, (discord.TextChannel, discord.VoiceChannel, discord.StageChannel, discord.Thread)):
-            return False
+            return None
+        return channel
+
+    async def send_message_async(self, guild_id: int, channel_id: int, message: str) -> bool:
+        """Send a message from the bot's event loop.
+
+        Args:
+            guild_id (int): ID of the Discord guild.
+            channel_id (int): ID of the channel to send the message to.
+            message (str): Message to be sent.
 
-        # Schedule the coroutine in the Discord event loop
-        future = asyncio.run_coroutine_threadsafe(channel.send(message), self.loop)
+        Returns:
+            bool: True if the message was sent, False if the channel is unknown or the send failed.
+        """
+        channel = self._resolve_channel(guild_id, channel_id)
+        if channel is None:
+            return False
         try:
-            future.result(timeout=10)  # Block up to 10s for result
+            await channel.send(message)
             return True
-        
         except Exception as error:
-            self.logging(f"Failed to send message: {error}")
+            self.logging(f"Failed to send message: {error}", level="error")
+            return False
+
+    def submit_message(self, guild_id: int, channel_id: int, message: str) -> Future:
+        if not self.client.is_ready() or not self.loop:
+            future: Future = Future()
+            future.set_result(False)
+            return future
+        # Schedule the coroutine in the Discord event loop; the caller decides whether and how long to wait.
+        return asyncio.run_coroutine_threadsafe(self.send_message_async(guild_id, channel_id, message), self.loop)
+
+    def send_message(self, guild_id: int, channel_id: int, message: str) -> bool:
+        try:
+            return self.submit_message(guild_id, channel_id, message).result(timeout=BroadcastConfigLoader.SEND_TIMEOUT)
+        except Exception as error:
+            self.logging(f"Failed to send message: {error}", level="error")
+            return False
+
+    def submit_broadcast(
+        self, targets: list[tuple[int, int]], message: str, max_concurrency: int | None = None
+    ) -> dict[tuple[int, int], Future]:
+        futures: dict[tuple[int, int], Future] = {target: Future() for target in dict.fromkeys(targets)}
+        if not self.client.is_ready() or not self.loop:
+            for future in futures.values():
+                future.set_result(False)
+            return futures
+
+        task = asyncio.run_coroutine_threadsafe(
+            self._broadcast(futures, message, max_concurrency or BroadcastConfigLoader.MAX_CONCURRENCY), self.loop
+        )
+        task.add_done_callback(self._log_broadcast_error)
+        return futures
+
+    def _log_broadcast_error(self, task: Future) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            self.logging(f"Broadcast failed: {task.exception()}", level="error")
+
+    async def _broadcast(self, futures: dict[tuple[int, int], Future], message: str, max_concurrency: int) -> None:
+        """Send ``message`` to every target with at most ``max_concurrency`` sends in flight."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def deliver(guild_id: int, channel_id: int, future: Future) -> None:
+            async with semaphore:
+                try:
+                    result = await asyncio.wait_for(
+                        self.send_message_async(guild_id, channel_id, message), BroadcastConfigLoader.SEND_TIMEOUT
+                    )
+                except Exception as error:
+                    self.logging(f"Broadcast to channel {channel_id} failed: {error}", level="error")
+                    result = False
+            future.set_result(result)
+
+        try:
+            await asyncio.gather(
+                *(deliver(guild_id, channel_id, future) for (guild_id, channel_id), future in futures.items())
+            )
+        finally:
+            # Cancelled during shutdown or failed early: callers waiting on the remaining targets get False.
+            for future in futures.values():
+                if not future.done():
+                    future.set_result(False)
+
+    def select_broadcast_channels(
+        self, guild_ids: list[int] | None = None, name_pattern: str | None = None
+    ) -> list[dict]:
+        if not self.broadcast_manager:
+            return []
+        return self.broadcast_manager.select_channels(guild_ids, name_pattern)
+
+    def start_broadcast_job(self, channels: list[dict], message: str) -> str | None:
+        if not self.broadcast_manager:
+            return None
+        return self.broadcast_manager.create_job(channels, message)
+
+    def get_broadcast_jobs(self) -> list[dict]:
+        if not self.broadcast_manager:
+            return []
+        return self.broadcast_manager.list_jobs()
+
+    def cancel_broadcast_job(self, job_id: str) -> bool:
+        if not self.broadcast_manager:
             return False
+        return self.broadcast_manager.cancel_job(job_id)
     
     def execute_function(self) -> None:
         pass
@@ -148,7 +408,44 @@ class DiscordLogic(Model, DiscordLogicPort):
         self.client.run(token)
 
     def stop(self) -> None:
-        asyncio.create_task(self.client.close())
+        if not self.loop or not self.loop.is_running():
+            return
+
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if running_loop is self.loop:
+            self.loop.create_task(self._shutdown())
+            return
+
+        # Called from another thread (e.g. the admin panel): wait until buffered messages are written.
+        future = asyncio.run_coroutine_threadsafe(self._shutdown(), self.loop)
+        try:
+            future.result(timeout=30)
+        except Exception as error:
+            self.logging(f"Error during shutdown: {error}", level="error")
+
+    async def _shutdown(self) -> None:
+        """Close the Discord client, which flushes buffered data through `_flush_on_close`."""
+        await self.client.close()
+
+    async def _flush_on_close(self) -> None:
+        """Stop the background tasks and write buffered messages and statistics before the client closes."""
+        self.watchdog.stop()
+        for name, component in (
+            ("broadcast manager", self.broadcast_manager),
+            ("message buffer", self.message_buffer),
+            ("statistics", self.stats_aggregator),
+            ("retention manager", self.retention_manager),
+        ):
+            if component is None:
+                continue
+            try:
+                await component.stop()
+            except Exception as error:
+                self.logging(f"Error stopping the {name} during shutdown: {error}", level="error")
 
     def set_translator(self, translator: TranslatePort) -> None:
         self.translator = translator
@@ -205,6 +502,38 @@ class DiscordLogic(Model, DiscordLogicPort):
     def is_connected(self) -> bool:
         return self.client.is_ready()
     
+    def get_diagnostics(self) -> dict:
+        return self.watchdog.get_report()
+
+    def _command_names(self) -> list[str]:
+        # Context menus are stored as "context_<name>" but run and profiled under their name.
+        return sorted(name.removeprefix("context_") for name in self.commands)
+
+    def profile_command(self, command: str, runs: int = 1, mode: str = "cprofile") -> bool:
+        if command not in self._command_names():
+            return False
+        try:
+            self.profiler.arm(command, runs, mode)
+        except ValueError as error:
+            self.logging(f"Cannot profile {command}: {error}", level="warning")
+            return False
+        return True
+
+    def cancel_command_profiling(self, command: str) -> bool:
+        return self.profiler.disarm(command)
+
+    def get_command_profiles(self) -> dict:
+        return {"commands": self._command_names(), **self.profiler.get_results()}
+
+    def export_command_profile(self, command: str, index: int = -1) -> str | None:
+        path = self.profiler.export(command, index)
+        return str(path) if path else None
+
+    def get_live_statistics(self) -> dict:
+        if not self.stats_aggregator:
+            return {}
+        return self.stats_aggregator.get_live_statistics()
+
     def get_bot_stats(self) -> dict:
         if not self.is_connected():
             return {"status": "Offline", "guilds": 0, "users": 0}
@@ -214,7 +543,7 @@ class DiscordLogic(Model, DiscordLogicPort):
             return {"status": "Online", "guilds": len(self.client.guilds), "users": total_members}
         
         except Exception as error:
-            self.logging(f"Error getting bot stats: {error}")
+            self.logging(f"Error getting bot stats: {error}", level="error")
             return {"status": "Error", "guilds": 0, "users": 0}
 
     def update_settings(self, prefix: str, status_text: str, auto_reply: bool, log_messages: bool) -> bool:
@@ -240,7 +569,7 @@ class DiscordLogic(Model, DiscordLogicPort):
             return True
         
         except Exception as error:
-            self.logging(f'Error updating settings: {error}')
+            self.logging(f"Error updating settings: {error}", level="error")
             return False
         
     def enable_auto_translate(self, target_user_id: int, subscriber_user_id: int, target_user_name: str | None = None, subscriber_user_name: str | None = None) -> None:
@@ -277,8 +606,7 @@ class DiscordLogic(Model, DiscordLogicPort):
         if context_menu:
             @self.tree.context_menu(name=command)
             async def context_command(interaction: discord.Interaction, message: discord.Message):
-                await callback(interaction, message)  # type: ignore[misc]
-                self._update_command_usage(command)
+                await self._run_command(command, callback, interaction, message)
 
             self.commands[f'context_{command}'] = callback
             self._save_command(command, description or f'{command} context menu')
@@ -288,8 +616,7 @@ class DiscordLogic(Model, DiscordLogicPort):
             @self.tree.command(name=command, description=description or f'{command} command')
             @app_commands.describe(target="Select a user")
             async def slash_command(interaction: discord.Interaction, target: discord.Member):
-                await callback(interaction, target)  # type: ignore[misc]
-                self._update_command_usage(command)
+                await self._run_command(command, callback, interaction, target)
         elif option_name and choices:
             trimmed_choices = [c for c in choices if c][:25]
 
@@ -298,20 +625,18 @@ class DiscordLogic(Model, DiscordLogicPort):
             @app_commands.describe(selection=f'Select {option_name}')
             @app_commands.choices(selection=[app_commands.Choice(name=choice, value=choice) for choice in trimmed_choices])
             async def slash_command(interaction: discord.Interaction, selection: app_commands.Choice[str]):
-                await callback(interaction, selection.value)  # type: ignore[misc]
-                self._update_command_usage(command)
+                await self._run_command(command, callback, interaction, selection.value)
         else:
 
             @self.tree.command(name=command, description=description or f'{command} command')
             async def slash_command(interaction: discord.Interaction):
-                await callback(interaction)  # type: ignore[misc]
-                self._update_command_usage(command)
+                await self._run_command(command, callback, interaction)
 
         self.commands[command] = callback
         self._save_command(command, description or f'{command} command')
         return True
             
-    def _update_connected_guilds(self) -> None:
+    async def _update_connected_guilds(self) -> None:
         """Update the connected guilds statistic in the database, if available."""
         if not self.dbms:
             return
@@ -320,39 +645,39 @@ class DiscordLogic(Model, DiscordLogicPort):
             self.guild_count = guild_count
 
             # Persist live guild count so admin panels reflect current state.
-            self.dbms.update_data("statistics", {}, {"connected_guilds": guild_count})
+            await self.dbms.update_data_async("statistics", {}, {"connected_guilds": guild_count})
             self.logging(f'Connected guilds updated: {guild_count}')
 
         except Exception as error:
-            self.logging(f'Error updating connected guilds: {error}')
+            self.logging(f"Error updating connected guilds: {error}", level="error")
 
-    def _save_message(self, message_data: dict) -> None:
-        """Persist a public guild message to the database and update statistics.
+    async def _save_message(self, message_data: dict) -> None:
+        """Queue a public guild message for batched persistence and update statistics.
 
         Args:
             message_data (dict): Serialized message payload.
         """
-        if not self.dbms:
+        if not self.dbms or not self.message_buffer:
             return
         try:
-            self.dbms.insert_data("messages", message_data)
+            await self.message_buffer.put("messages", message_data)
             self._increment_message_stats()
         except Exception as error:
-            self.logging(f'Error saving message: {error}')
+            self.logging(f"Error saving message: {error}", level="error")
     
-    def _save_direct_message(self, dm_data: dict) -> None:
-        """Persist a direct message to the database and update statistics.
+    async def _save_direct_message(self, dm_data: dict) -> None:
+        """Queue a direct message for batched persistence and update statistics.
 
         Args:
             dm_data (dict): Serialized DM payload.
         """
-        if not self.dbms:
+        if not self.dbms or not self.message_buffer:
             return
         try:
-            self.dbms.insert_data("direct_messages", dm_data)
+            await self.message_buffer.put("direct_messages", dm_data)
             self._increment_dm_stats()
         except Exception as error:
-            self.logging(f'Error saving direct message: {error}')
+            self.logging(f"Error saving direct message: {error}", level="error")
     
     def _save_command(self, command_name: str, description: str) -> None:
         """Ensure a command row exists in the `commands` table.
@@ -375,76 +700,30 @@ class DiscordLogic(Model, DiscordLogicPort):
                 }
                 self.dbms.insert_data("commands", command_data)
         except Exception as error:
-            self.logging(f'Error saving command: {error}')
+            self.logging(f"Error saving command: {error}", level="error")
     
     def _update_command_usage(self, command_name: str) -> None:
-        """Increment usage counters for a command and update statistics.
+        """Count a command invocation; the aggregator writes it to `commands` and `statistics` on its next flush.
 
         Args:
             command_name (str): Name of the command that was invoked.
         """
-        if not self.dbms:
+        if not self.stats_aggregator:
             return
-        try:
-            commands = self.dbms.get_data("commands", {"command_name": command_name})
-            if commands:
-                command = commands[0]
-                command["usage_count"] = command.get("usage_count", 0) + 1
-                command["last_used"] = datetime.now().isoformat()
-                self.dbms.update_data("commands", {"command_name": command_name}, command)
-                self._increment_command_stats(command_name)
-        except Exception as error:
-            self.logging(f'Error updating command usage: {error}')
+        self.stats_aggregator.record_command(command_name)
     
     def _increment_message_stats(self) -> None:
-        """Increment the daily total message counter in statistics."""
-        if not self.dbms:
+        """Count a message in today's in-memory statistics."""
+        if not self.stats_aggregator:
             return
-        try:
-            today = datetime.now().date().isoformat()
-            stats = self.dbms.get_data("statistics", {"date": today})
-            if stats:
-                stat = stats[0]
-                stat["total_messages"] = stat.get("total_messages", 0) + 1
-                self.dbms.update_data("statistics", {"date": today}, stat)
-        except Exception as error:
-            self.logging(f'Error updating message stats: {error}')
+        self.stats_aggregator.record({"total_messages": 1})
     
     def _increment_dm_stats(self) -> None:
-        """Increment the daily total DM counter in statistics."""
-        if not self.dbms:
+        """Count a DM in today's in-memory statistics."""
+        if not self.stats_aggregator:
             return
-        try:
-            today = datetime.now().date().isoformat()
-            stats = self.dbms.get_data("statistics", {"date": today})
-            if stats:
-                stat = stats[0]
-                stat["total_dms"] = stat.get("total_dms", 0) + 1
-                self.dbms.update_data("statistics", {"date": today}, stat)
-        except Exception as error:
-            self.logging(f'Error updating DM stats: {error}')
+        self.stats_aggregator.record({"total_dms": 1})
     
-    def _increment_command_stats(self, command_name: str) -> None:
-        """Increment the daily command counters for the given command.
-
-        Args:
-            command_name (str): Command whose usage should be counted.
-        """
-        if not self.dbms:
-            return
-        try:
-            today = datetime.now().date().isoformat()
-            stats = self.dbms.get_data("statistics", {"date": today})
-            if stats:
-                stat = stats[0]
-                stat["total_commands"] = stat.get("total_commands", 0) + 1
-                if "command_breakdown" not in stat:
-                    stat["command_breakdown"] = {}
-                stat["command_breakdown"][command_name] = stat["command_breakdown"].get(command_name, 0) + 1
-                self.dbms.update_data("statistics", {"date": today}, stat)
-        except Exception as error:
-            self.logging(f'Error updating command stats: {error}')
-
     def _load_auto_translate_targets(self) -> None:
         """Load all auto-translate target subscriptions from the database."""
         if not self.dbms:
@@ -464,7 +743,7 @@ class DiscordLogic(Model, DiscordLogicPort):
                 targets.setdefault(target, set()).add(subscriber)
             self.auto_translate_targets = targets
         except Exception as error:
-            self.logging(f'Error loading auto-translate targets: {error}')
+            self.logging(f"Error loading auto-translate targets: {error}", level="error")
 
 if __name__ == "__main__":
     from discord_bot.adapters.db import DBMS
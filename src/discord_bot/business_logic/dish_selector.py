@@ -12,10 +12,10 @@ class DishSelector(Model, DishPort):
     def execute_function(self, category: str) -> str:
         dish = self.dbms.get_random_entry("dishes", category)
         if not dish:
-            self.logging("No dish found.")
+            self.logging("No dish found.", level="warning")
             return ""
         result = dish.get("dish") or str(dish)
-        self.logging(f'Dish selected: {result}')
+        self.logging(lambda: f"Dish selected: {result}", sample="dish_selector.selection")
         return result
 
 if __name__ == "__main__":
@@ -12,10 +12,10 @@ class FunFactSelector(Model, FunFactPort):
     def execute_function(self) -> str:
         fun_fact = self.dbms.get_random_entry("fun_facts", None)
         if not fun_fact:
-            self.logging("No fun fact found.")
+            self.logging("No fun fact found.", level="warning")
             return ""
         result = fun_fact.get("fun_fact") or str(fun_fact)
-        self.logging(f'Fun fact selected: {result}')
+        self.logging(lambda: f"Fun fact selected: {result}", sample="fun_fact_selector.selection")
         return result
 
 if __name__ == "__main__":
@@ -0,0 +1,109 @@
+"""Offline language identification with character n-gram profiles built from `init/lang_data`."""
+
+import math
+import re
+from collections import Counter
+from pathlib import Path
+
+from discord_bot.init.config_loader import TranslatorConfigLoader
+
+LANG_DATA_PATH = Path(__file__).parent.parent / "init" / "lang_data"
+
+# Mentions, custom emoji, URLs and everything that is not a letter carry no language information.
+_NOISE = re.compile(r"<a?[@#:][^>]*>|https?://\S+|[^\w\s]|[\d_]")
+
+class LanguageDetector:
+    """Guess the language of a text with a naive Bayes model over character n-grams.
+
+    Each `<code>.txt` file in `data_path` is a sample corpus for the language `<code>`. The model
+    can only choose among these languages, so a text in a related language without a corpus (Swedish
+    for German, Ukrainian for Russian) still gets a best guess. Such guesses are rejected when the
+    text contains a letter the corpus never uses or too few of its trigrams occur in the corpus.
+    Short, ambiguous and rejected texts are reported as unknown so callers fall back to translating them.
+    """
+    NGRAM_SIZES = (1, 2, 3)
+    SMOOTHING = 0.5
+
+    def __init__(
+        self, data_path: Path | None = None, min_chars: int | None = None, min_margin: float | None = None,
+        min_coverage: float | None = None,
+    ) -> None:
+        self.min_chars = TranslatorConfigLoader.DETECT_MIN_CHARS if min_chars is None else min_chars
+        self.min_margin = TranslatorConfigLoader.DETECT_MIN_MARGIN if min_margin is None else min_margin
+        self.min_coverage = TranslatorConfigLoader.DETECT_MIN_COVERAGE if min_coverage is None else min_coverage
+        self.profiles: dict[str, tuple[Counter, int]] = {}
+        for corpus in sorted((data_path or LANG_DATA_PATH).glob("*.txt")):
+            counts = self._ngrams(corpus.read_text(encoding="utf-8"))
+            self.profiles[corpus.stem] = (counts, sum(counts.values()))
+        self._vocabulary_size = (
+            len(set().union(*(counts for counts, _ in self.profiles.values()))) if self.profiles else 0
+        )
+
+    @staticmethod
+    def _clean(text: str) -> str:
+        return " ".join(_NOISE.sub(" ", text.lower()).split())
+
+    @classmethod
+    def _ngrams(cls, text: str) -> Counter:
+        counts: Counter = Counter()
+        for word in cls._clean(text).split():
+            padded = f" {word} "
+            for size in cls.NGRAM_SIZES:
+                counts.update(padded[index:index + size] for index in range(len(padded) - size + 1))
+        return counts
+
+    def scores(self, text: str) -> dict[str, float]:
+        """Return the mean log-likelihood per n-gram of the text under every language profile."""
+        return self._scores(self._ngrams(text))
+
+    def _scores(self, counts: Counter) -> dict[str, float]:
+        total = sum(counts.values())
+        if not total:
+            return {}
+        scores: dict[str, float] = {}
+        for language, (profile, profile_total) in self.profiles.items():
+            denominator = profile_total + self.SMOOTHING * self._vocabulary_size
+            scores[language] = (
+                sum(
+                    count * math.log((profile.get(gram, 0) + self.SMOOTHING) / denominator)
+                    for gram, count in counts.items()
+                )
+                / total
+            )
+        return scores
+
+    def coverage(self, text: str, language: str) -> float:
+        """Return the share of the text's trigrams that occur in the corpus of ``language``.
+
+        A text with a letter the corpus never uses gets 0.0, since it cannot be written in that language.
+        """
+        return self._coverage(self._ngrams(text), language)
+
+    def _coverage(self, counts: Counter, language: str) -> float:
+        profile = self.profiles[language][0]
+        if any(len(gram) == 1 and gram not in profile for gram in counts):
+            return 0.0
+        trigrams = {gram: count for gram, count in counts.items() if len(gram) == 3}
+        total = sum(trigrams.values())
+        return sum(count for gram, count in trigrams.items() if gram in profile) / total if total else 0.0
+
+    def detect(self, text: str) -> str | None:
+        """Return the language code of ``text``, or None if it is too short, too ambiguous or out of set.
+
+        Args:
+            text (str): Text to identify.
+
+        Returns:
+            str | None: A language code such as ``"de"``, or None.
+        """
+        if len(self._clean(text).replace(" ", "")) < self.min_chars:
+            return None
+        counts = self._ngrams(text)
+        ranked = sorted(self._scores(counts).items(), key=lambda item: item[1], reverse=True)
+        if not ranked:
+            return None
+        if len(ranked) > 1 and ranked[0][1] - ranked[1][1] < self.min_margin:
+            return None
+        if self._coverage(counts, ranked[0][0]) < self.min_coverage:
+            return None
+        return ranked[0][0]
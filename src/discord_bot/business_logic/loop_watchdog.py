@@ -0,0 +1,171 @@
+"""Detect handlers that block the bot's event loop and record where they were stuck."""
+
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from collections.abc import Awaitable
+from datetime import datetime
+from typing import Any
+
+from discord_bot.business_logic.model import Model
+from discord_bot.init.config_loader import WatchdogConfigLoader
+from discord_bot.init.metrics import METRICS
+
+LOOP_LAG = METRICS.histogram(
+    "discord_bot_event_loop_lag_seconds", "How late the bot's event loop wakes up a sleeping task."
+)
+LOOP_LAG_LAST = METRICS.gauge("discord_bot_event_loop_lag_last_seconds", "Most recent event-loop lag sample.")
+LOOP_STALLS = METRICS.counter(
+    "discord_bot_event_loop_stalls_total",
+    "Times a handler blocked the event loop longer than the watchdog threshold.",
+    ("handler",),
+)
+
+class LoopWatchdog(Model):
+    """Measure event-loop lag and capture the stack of handlers that block the loop.
+
+    A heartbeat task on the loop records when it last ran. A separate thread checks the heartbeat;
+    once it is older than ``interval + threshold`` the loop is blocked, and the thread takes the loop
+    thread's current stack from `sys._current_frames`. The blocking handler is found on that stack
+    as the innermost `run` frame, which every command and event handler is wrapped in.
+    """
+    def __init__(
+        self, interval: float | None = None, threshold: float | None = None, max_stalls: int | None = None
+    ) -> None:
+        super().__init__()
+        self.interval = interval or WatchdogConfigLoader.INTERVAL
+        self.threshold = threshold or WatchdogConfigLoader.THRESHOLD
+        self.stalls: deque[dict] = deque(maxlen=max_stalls or WatchdogConfigLoader.MAX_STALLS)
+        self.handlers: dict[str, dict[str, float]] = {}
+        self.max_lag = 0.0
+        self.last_lag = 0.0
+        self._beat = time.monotonic()
+        self._open_stall: dict | None = None
+        self._loop_thread_id: int | None = None
+        self._heartbeat_task: asyncio.Task | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        # Guards `handlers`, `stalls` and open stalls, which the loop, the monitor thread and the admin panel share.
+        self._lock = threading.Lock()
+
+    def execute_function(self) -> None:
+        pass
+
+    def start(self) -> None:
+        """Start the heartbeat on the running loop and the monitor thread."""
+        if self._heartbeat_task is not None:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._beat = time.monotonic()
+        self._heartbeat_task = asyncio.get_running_loop().create_task(self._heartbeat())
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            self._heartbeat_task = None
+        self._stop.set()
+
+    async def run(self, name: str, awaitable: Awaitable) -> Any:
+        """Await a handler and record its duration under ``name``.
+
+        The local variable ``name`` of this frame is what the monitor thread reads to attribute a
+        stall, so handlers must be awaited through this method.
+        """
+        started = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                stats = self._stats(name)
+                stats["calls"] += 1
+                stats["total_seconds"] += elapsed
+                stats["max_seconds"] = max(stats["max_seconds"], elapsed)
+
+    def _stats(self, name: str) -> dict[str, float]:
+        """Return the timings of a handler, creating them on first use. Caller holds the lock."""
+        return self.handlers.setdefault(name, {"calls": 0, "total_seconds": 0.0, "max_seconds": 0.0, "stalls": 0})
+
+    async def _heartbeat(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, time.perf_counter() - started - self.interval)
+            self._beat = time.monotonic()
+            self.last_lag = lag
+            self.max_lag = max(self.max_lag, lag)
+            LOOP_LAG.observe(lag)
+            LOOP_LAG_LAST.set(lag)
+            with self._lock:
+                stall = self._open_stall
+                if stall is not None:
+                    # The loop runs again: the stall ended, so its final length is known now.
+                    stall["blocked_seconds"] = round(lag, 3)
+                    self._open_stall = None
+
+    def _watch(self) -> None:
+        """Monitor thread: report each blocked period of the loop once."""
+        reported_beat = None
+        while not self._stop.wait(self.threshold / 4):
+            beat = self._beat
+            blocked = time.monotonic() - beat - self.interval
+            if blocked >= self.threshold and beat != reported_beat:
+                reported_beat = beat
+                self._report(blocked)
+
+    def _report(self, blocked: float) -> None:
+        frame = sys._current_frames().get(self._loop_thread_id) if self._loop_thread_id else None
+        if frame is None:
+            return
+        handler = self._handler_name(frame)
+        stall = {
+            "time": datetime.now().isoformat(timespec="seconds"),
+            "handler": handler,
+            "blocked_seconds": round(blocked, 3),
+            "stack": "".join(traceback.format_stack(frame)),
+        }
+        with self._lock:
+            self.stalls.append(stall)
+            self._open_stall = stall
+            self._stats(handler)["stalls"] += 1
+        LOOP_STALLS.inc(handler)
+        self.logging(
+            lambda: f"Event loop blocked for more than {blocked:.3f}s in {handler}:\n{stall['stack']}", level="warning"
+        )
+
+    def _handler_name(self, frame) -> str:
+        """Return the name of the innermost handler wrapped by `run` on the stack, or "unknown"."""
+        run_code = LoopWatchdog.run.__code__
+        while frame is not None:
+            if frame.f_code is run_code:
+                return str(frame.f_locals.get("name", "unknown"))
+            frame = frame.f_back
+        return "unknown"
+
+    def get_report(self) -> dict:
+        """Return loop lag, per-handler timings and the most recent stalls, newest first."""
+        # Snapshot under the lock; the loop keeps adding handlers and stalls while the panel reads them.
+        with self._lock:
+            snapshot = {name: dict(stats) for name, stats in self.handlers.items()}
+            stalls = [dict(stall) for stall in reversed(self.stalls)]
+        handlers = {
+            name: {
+                "calls": int(stats["calls"]),
+                "avg_ms": round(stats["total_seconds"] / stats["calls"] * 1000, 2) if stats["calls"] else 0.0,
+                "max_ms": round(stats["max_seconds"] * 1000, 2),
+                "stalls": int(stats["stalls"]),
+            }
+            for name, stats in sorted(snapshot.items(), key=lambda item: item[1]["max_seconds"], reverse=True)
+        }
+        return {
+            "loop_lag_ms": {"last": round(self.last_lag * 1000, 2), "max": round(self.max_lag * 1000, 2)},
+            "threshold_ms": round(self.threshold * 1000, 2),
+            "handlers": handlers,
+            "stalls": stalls,
+        }
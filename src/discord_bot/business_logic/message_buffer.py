@@ -0,0 +1,147 @@
+"""Bounded write-behind queue that batches Discord messages into `insert_many` calls."""
+
+import asyncio
+
+from discord_bot.contracts.ports import DatabasePort
+from discord_bot.business_logic.model import Model
+from discord_bot.init.config_loader import MessageBufferConfigLoader
+
+class MessageBuffer(Model):
+    """Collect documents in memory and persist them in batches by size or time.
+
+    Documents of a failed write are kept, up to `max_queue_size` of them, and written again with the
+    next batch; the flusher retries them every `flush_interval` even when no new documents arrive.
+    """
+    def __init__(
+        self,
+        dbms: DatabasePort,
+        flush_size: int | None = None,
+        flush_interval: float | None = None,
+        max_queue_size: int | None = None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.dbms = dbms
+        self.flush_size = flush_size or MessageBufferConfigLoader.FLUSH_SIZE
+        self.flush_interval = flush_interval or MessageBufferConfigLoader.FLUSH_INTERVAL
+        self.max_queue_size = max_queue_size or MessageBufferConfigLoader.MAX_QUEUE_SIZE
+        self.queue: asyncio.Queue[tuple[str, dict] | None] = asyncio.Queue(maxsize=self.max_queue_size)
+        self.flushed_documents = 0
+        self.flush_count = 0
+        self.dropped_documents = 0
+        self._retry: list[tuple[str, dict]] = []
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._closing = False
+
+    def execute_function(self) -> None:
+        pass
+
+    def start(self) -> None:
+        """Start the background flush task on the running event loop."""
+        if self._task is not None:
+            return
+        self._closing = False
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def put(self, table_name: str, document: dict) -> None:
+        """Queue a document for the next batched write.
+
+        Waits while the queue is full, which slows producers down instead of growing memory without bound.
+
+        Args:
+            table_name (str): Target table of the document.
+            document (dict): Document to insert.
+        """
+        self.start()
+        await self.queue.put((table_name, document))
+        if self.queue.qsize() >= self.flush_size:
+            self._wakeup.set()
+
+    async def stop(self) -> None:
+        """Flush every queued document and stop the background task."""
+        if self._task is None:
+            return
+        self._closing = True
+        # The sentinel wakes a flusher that is idle on an empty queue.
+        await self.queue.put(None)
+        self._wakeup.set()
+        await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        """Gather documents until the batch is full or the flush interval elapsed, then write them."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch: list[tuple[str, dict] | None] = []
+            if not self._retry:
+                batch.append(await self.queue.get())
+            else:
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), self.flush_interval))
+                except asyncio.TimeoutError:
+                    pass
+            # Without new documents the retry is written right away.
+            deadline = loop.time() + (self.flush_interval if batch else 0)
+
+            while len(batch) < self.flush_size and not self._closing:
+                self._drain_into(batch)
+                remaining = deadline - loop.time()
+                if len(batch) >= self.flush_size or remaining <= 0:
+                    break
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), remaining)
+                except asyncio.TimeoutError:
+                    pass
+
+            self._drain_into(batch)
+            await self._write([item for item in batch if item is not None])
+
+            if self._closing and self.queue.empty():
+                if self._retry:
+                    self.logging(
+                        f"Dropping {len(self._retry)} documents that could not be written before shutdown",
+                        level="error",
+                    )
+                    self.dropped_documents += len(self._retry)
+                    self._retry = []
+                return
+
+    def _drain_into(self, batch: list) -> None:
+        """Move already queued documents into the batch without waiting.
+
+        Args:
+            batch (list): Batch to extend, up to `flush_size` documents.
+        """
+        while len(batch) < self.flush_size and not self.queue.empty():
+            batch.append(self.queue.get_nowait())
+
+    async def _write(self, batch: list[tuple[str, dict]]) -> None:
+        """Persist the documents of earlier failed writes and a batch with one `insert_many` per table.
+
+        Args:
+            batch (list[tuple[str, dict]]): Queued ``(table_name, document)`` pairs.
+        """
+        by_table: dict[str, list[dict]] = {}
+        for table_name, document in self._retry + batch:
+            by_table.setdefault(table_name, []).append(document)
+        self._retry = []
+
+        for table_name, documents in by_table.items():
+            try:
+                await self.dbms.insert_many_async(table_name, documents)
+                self.flushed_documents += len(documents)
+                self.flush_count += 1
+            except Exception as error:
+                self.logging(
+                    f'Failed to flush {len(documents)} documents to "{table_name}", retrying: {error}', level="error"
+                )
+                self._retry.extend((table_name, document) for document in documents)
+
+        overflow = len(self._retry) - self.max_queue_size
+        if overflow > 0:
+            # Oldest first, so a long outage keeps the most recent messages.
+            self.logging(f"Dropping {overflow} documents after repeated write failures", level="error")
+            self.dropped_documents += overflow
+            del self._retry[:overflow]
@@ -1,9 +1,9 @@
 """Provide a base model class with logging support."""
 
-from datetime import datetime
+from collections.abc import Callable
 
 from discord_bot.contracts.ports import ModelPort
-from discord_bot.init.log_loader import LogLoader
+from discord_bot.init.log_loader import LOG_FILTER, LOG_WRITER, LogLoader
 
 
 class Model(ModelPort):
@@ -11,22 +11,24 @@ class Model(ModelPort):
     def __init__(self) -> None:
         self.log_loader = LogLoader()
 
-    def logging(self, message: str = "Model logging", log_file_name: str | None = None) -> None:
+    def logging(
+        self,
+        message: str | Callable[[], str] = "Model logging",
+        log_file_name: str | None = None,
+        level: str = "info",
+        sample: str | None = None,
+    ) -> None:
         try:
+            if not LOG_FILTER.enabled(level, sample):
+                return
+            if callable(message):
+                message = message()
             if log_file_name:
                 log_file = self.log_loader.get_log_file_path(log_file_name, treat_as_filename=True)
             else:
                 class_name = self.__class__.__name__
                 log_file = self.log_loader.get_log_file_path(class_name)
 
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-            log_file.parent.mkdir(parents=True, exist_ok=True)
-            if not log_file.exists():
-                log_file.touch()
-
-            with open(log_file, "a", encoding="utf-8") as file:
-                file.write(f'[{timestamp}] {message}\n')
-
+            LOG_WRITER.write(log_file, message, level=level)
         except Exception as error:
             print(f'Logging failed: {error}')
@@ -0,0 +1,33 @@
+"""Token buckets for limiting how often the bot sends messages."""
+
+import time
+
+class TokenBucket:
+    """Allow `rate` operations per second on average with bursts of up to `capacity`."""
+    def __init__(self, rate: float, capacity: float) -> None:
+        if rate <= 0:
+            raise ValueError(f"Token bucket rate must be greater than 0, got {rate}")
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def available(self) -> bool:
+        """Return True if at least one token can be taken now."""
+        self._refill()
+        return self.tokens >= 1
+
+    def consume(self) -> None:
+        """Take one token; callers check `available()` first."""
+        self._refill()
+        self.tokens -= 1
+
+    def wait_time(self) -> float:
+        """Return the seconds until the next token is available."""
+        self._refill()
+        return max(0.0, (1 - self.tokens) / self.rate)
@@ -0,0 +1,205 @@
+"""Archive expired messages to gzipped JSON Lines files and delete them from the database.
+
+Run from the project root for a single archival pass:
+
+    python -m discord_bot.business_logic.retention_manager
+"""
+
+import asyncio
+import gzip
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from discord_bot.contracts.ports import DatabasePort
+from discord_bot.business_logic.model import Model
+from discord_bot.init.config_loader import RetentionConfigLoader
+
+def _to_json(value):
+    """Serialize the BSON types found in message documents (datetimes, ObjectIds)."""
+    return value.isoformat() if isinstance(value, datetime) else str(value)
+
+def _created_at(document: dict, fallback: datetime) -> datetime:
+    """Parse the ISO ``timestamp`` of a row written before ``created_at`` existed, or return ``fallback``."""
+    try:
+        created_at = datetime.fromisoformat(document["timestamp"])
+    except (KeyError, TypeError, ValueError):
+        return fallback
+    return created_at if created_at.tzinfo else created_at.replace(tzinfo=timezone.utc)
+
+class RetentionManager(Model):
+    """Move rows whose ``created_at`` is older than their table's retention period into archive files.
+
+    Only tables configured with ``archive`` are handled here; the others expire through the TTL
+    index declared in `discord_bot.init.db_indexes`, and capped tables limit their size themselves.
+    Rows of either kind written before ``created_at`` existed get it backfilled from ``timestamp``.
+    """
+    def __init__(
+        self, dbms: DatabasePort, collections: dict[str, tuple[float, bool]] | None = None,
+        interval: float | None = None, batch_size: int | None = None, archive_dir: Path | None = None, **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.dbms = dbms
+        collections = RetentionConfigLoader.COLLECTIONS if collections is None else collections
+        # Retention days per table that is archived before deleting.
+        self.archived_tables = {
+            table: days for table, (days, archive) in collections.items()
+            if archive and days > 0 and table not in RetentionConfigLoader.CAPPED
+        }
+        # Tables whose rows may still lack ``created_at``; dropped once a backfill pass completes.
+        self._unbackfilled = {
+            table for table, (days, _) in collections.items()
+            if days > 0 and table not in RetentionConfigLoader.CAPPED
+        }
+        self.interval = interval or RetentionConfigLoader.INTERVAL
+        self.batch_size = batch_size or RetentionConfigLoader.BATCH_SIZE
+        self.archive_dir = Path(archive_dir or RetentionConfigLoader.ARCHIVE_DIR)
+        self.archived_documents: dict[str, int] = dict.fromkeys(self.archived_tables, 0)
+        self.last_run: str | None = None
+        self.last_error: str | None = None
+        self._stopping = threading.Event()
+        self._task: asyncio.Task | None = None
+
+    def execute_function(self) -> None:
+        pass
+
+    def run_once(self, now: datetime | None = None) -> dict[str, int]:
+        """Backfill missing ``created_at`` fields, then archive and delete expired rows batch by batch.
+
+        A batch is deleted only after its archive file was written, so a failure leaves the rows in
+        the database for the next run; a crash between both steps archives a batch twice at worst.
+
+        Args:
+            now (datetime | None): Time the retention periods are measured from; defaults to now (UTC).
+
+        Returns:
+            dict[str, int]: Number of archived and deleted rows per table.
+        """
+        now = now or datetime.now(timezone.utc)
+        self._backfill_tables(now)
+        archived = {table: self._archive_table(table, days, now) for table, days in self.archived_tables.items()}
+        self.last_run = now.isoformat()
+        return archived
+
+    def _backfill_tables(self, now: datetime) -> None:
+        """Run `_backfill_created_at` on every table that has not completed a backfill yet."""
+        for table in sorted(self._unbackfilled):
+            try:
+                filled = self._backfill_created_at(table, now)
+            except Exception as error:
+                self.last_error = f"{table}: {error}"
+                self.logging(f'Backfilling created_at of "{table}" failed: {error}', level="error")
+                continue
+            if not self._stopping.is_set():
+                self._unbackfilled.discard(table)
+            if filled:
+                self.logging(f'Backfilled created_at of {filled} documents of "{table}"')
+
+    def _archive_table(self, table: str, days: float, now: datetime) -> int:
+        """Archive and delete the rows of one table older than ``days``; returns how many were moved."""
+        query = {"created_at": {"$lt": now - timedelta(days=days)}}
+        archived = 0
+        try:
+            while not self._stopping.is_set():
+                batch = self.dbms.get_oldest_data(table, query, "created_at", self.batch_size)
+                if not batch:
+                    break
+                self._write_archive(table, batch)
+                self.dbms.delete_data(table, {"_id": {"$in": [document["_id"] for document in batch]}})
+                archived += len(batch)
+                if len(batch) < self.batch_size:
+                    break
+        except Exception as error:
+            self.last_error = f"{table}: {error}"
+            self.logging(f'Archiving "{table}" stopped after {archived} documents: {error}', level="error")
+        self.archived_documents[table] += archived
+        if archived:
+            self.logging(f'Archived and deleted {archived} documents of "{table}" older than {days:g} days')
+        return archived
+
+    def _backfill_created_at(self, table: str, now: datetime) -> int:
+        """Set ``created_at`` from ``timestamp`` on rows that lack it, one batch at a time.
+
+        Without the field neither the TTL index nor the archival query ever matches such a row. Rows
+        without a parsable ``timestamp`` get ``now`` and so expire one retention period from now.
+
+        Returns:
+            int: Number of updated rows.
+        """
+        filled = 0
+        while not self._stopping.is_set():
+            batch = self.dbms.get_oldest_data(table, {"created_at": {"$exists": False}}, "_id", self.batch_size)
+            if not batch:
+                break
+            self.dbms.bulk_update(table, [
+                ({"_id": document["_id"]}, {"created_at": _created_at(document, now)}) for document in batch
+            ])
+            filled += len(batch)
+            if len(batch) < self.batch_size:
+                break
+        return filled
+
+    def _write_archive(self, table: str, batch: list[dict]) -> None:
+        """Append a batch to the gzipped JSON Lines file of each month its rows were created in.
+
+        Every append adds a gzip member; `gzip.open` reads the concatenated members as one stream.
+        """
+        by_month: dict[str, list[str]] = {}
+        for document in batch:
+            created_at = document.get("created_at")
+            month = created_at.strftime("%Y-%m") if isinstance(created_at, datetime) else "undated"
+            by_month.setdefault(month, []).append(json.dumps(document, default=_to_json, ensure_ascii=False))
+
+        directory = self.archive_dir / table
+        directory.mkdir(parents=True, exist_ok=True)
+        for month, lines in by_month.items():
+            with gzip.open(directory / f"{table}-{month}.jsonl.gz", "at", encoding="utf-8") as archive:
+                archive.write("\n".join(lines) + "\n")
+
+    def start(self) -> None:
+        """Start the periodic archival task on the running event loop; the database work runs in a thread."""
+        if self._task is not None or not (self.archived_tables or self._unbackfilled):
+            return
+        self._stopping.clear()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the periodic task; a running pass ends after its current batch."""
+        self._stopping.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        """Run an archival pass now and every `interval` seconds."""
+        while True:
+            await asyncio.to_thread(self.run_once)
+            await asyncio.sleep(self.interval)
+
+    def get_status(self) -> dict:
+        """Return the archived tables with their retention, the archived totals and the last run.
+
+        Returns:
+            dict: ``tables`` (retention days per table), ``archived`` (rows per table since start),
+                ``archive_dir``, ``last_run`` and ``last_error``.
+        """
+        return {
+            "tables": dict(self.archived_tables),
+            "archived": dict(self.archived_documents),
+            "archive_dir": str(self.archive_dir),
+            "last_run": self.last_run,
+            "last_error": self.last_error,
+        }
+
+if __name__ == "__main__":
+    from discord_bot.adapters.db import DBMS
+    from discord_bot.init.config_loader import DBConfigLoader
+
+    dbms = DBMS(db_name=DBConfigLoader.DISCORD_DB_NAME)
+    dbms.connect()
+    print(RetentionManager(dbms).run_once())
@@ -0,0 +1,255 @@
+"""Aggregate daily statistics and command usage in memory and flush deltas to the `statistics` and `commands` tables."""
+
+import asyncio
+import threading
+import time
+from datetime import datetime
+
+from discord_bot.contracts.ports import DatabasePort
+from discord_bot.business_logic.model import Model
+from discord_bot.init.config_loader import StatisticsConfigLoader
+
+class StatsAggregator(Model):
+    """Keep per-day counters and per-command usage in memory and persist them with periodic `$inc` flushes."""
+    def __init__(
+        self,
+        dbms: DatabasePort,
+        flush_interval: float | None = None,
+        max_unflushed_interval: float | None = None,
+        max_pending_events: int | None = None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.dbms = dbms
+        self.flush_interval = flush_interval or StatisticsConfigLoader.FLUSH_INTERVAL
+        self.max_unflushed_interval = max_unflushed_interval or StatisticsConfigLoader.MAX_UNFLUSHED_INTERVAL
+        self.max_pending_events = max_pending_events or StatisticsConfigLoader.MAX_PENDING_EVENTS
+        # Counters are keyed by date and use dotted field paths, e.g. "command_breakdown.dish".
+        self._pending: dict[str, dict[str, int]] = {}
+        self._in_flight: dict[str, dict[str, int]] = {}
+        self._persisted: dict[str, dict[str, int]] = {}
+        # Usage per command name since the last flush: invocation count and ISO time of the latest one.
+        self._command_usage: dict[str, list] = {}
+        self._pending_events = 0
+        self._oldest_pending: float | None = None
+        self._lock = threading.Lock()
+        # Serializes flushes with `load`, so a loaded row never replaces deltas flushed meanwhile.
+        self._write_lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+        self._flush_task: asyncio.Task | None = None
+
+    def execute_function(self) -> None:
+        pass
+
+    @staticmethod
+    def _today() -> str:
+        return datetime.now().date().isoformat()
+
+    @staticmethod
+    def _merge(target: dict[str, dict[str, int]], source: dict[str, dict[str, int]]) -> None:
+        """Add the counters of ``source`` into ``target`` in place."""
+        for date, counters in source.items():
+            day = target.setdefault(date, {})
+            for field, amount in counters.items():
+                day[field] = day.get(field, 0) + amount
+
+    def record(self, counters: dict[str, int], date: str | None = None) -> None:
+        """Add counter deltas for a day without touching the database.
+
+        Triggers an early flush when too many events are pending or the oldest delta is older than
+        `max_unflushed_interval`, which bounds how much is lost if the process crashes.
+
+        Args:
+            counters (dict[str, int]): Field paths mapped to the amount to add.
+            date (str | None): ISO date of the counters; defaults to today.
+        """
+        with self._lock:
+            self._merge(self._pending, {date or self._today(): counters})
+            self._pending_events += 1
+            if self._oldest_pending is None:
+                self._oldest_pending = time.monotonic()
+            overdue = (
+                self._pending_events >= self.max_pending_events
+                or time.monotonic() - self._oldest_pending >= self.max_unflushed_interval
+            )
+
+        if overdue:
+            self._schedule_flush()
+
+    def record_command(self, command_name: str) -> None:
+        """Count a command invocation in today's statistics and in the command's `commands` row.
+
+        Args:
+            command_name (str): Name of the invoked command.
+        """
+        used_at = datetime.now().isoformat()
+        with self._lock:
+            usage = self._command_usage.setdefault(command_name, [0, used_at])
+            usage[0] += 1
+            usage[1] = max(usage[1], used_at)
+        self.record({"total_commands": 1, f"command_breakdown.{command_name}": 1})
+
+    def _schedule_flush(self) -> None:
+        """Start a flush on the running event loop unless one is already in progress."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = loop.create_task(self.flush())
+
+    async def flush(self) -> None:
+        """Write all pending deltas with one atomic increment per day and one bulk write for command usage."""
+        async with self._write_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+                command_usage, self._command_usage = self._command_usage, {}
+                self._pending_events = 0
+                self._oldest_pending = None
+                self._merge(self._in_flight, batch)
+
+            unwritten = dict(batch)
+            usage_unwritten = bool(command_usage)
+            try:
+                for date, counters in batch.items():
+                    try:
+                        await self.dbms.increment_data_async("statistics", {"date": date}, counters)
+                    except Exception as error:
+                        self.logging(f"Error flushing statistics for {date}: {error}", level="error")
+                        continue
+                    with self._lock:
+                        self._merge(self._persisted, {date: counters})
+                        self._merge(self._in_flight, {date: {field: -amount for field, amount in counters.items()}})
+                    del unwritten[date]
+
+                if command_usage:
+                    # From here on the bulk write requeues the usage itself.
+                    usage_unwritten = False
+                    await self._flush_command_usage(command_usage)
+            finally:
+                # Failed days, and on cancellation everything not reached yet, go back to pending for the next flush.
+                if unwritten:
+                    with self._lock:
+                        self._merge(self._pending, unwritten)
+                        self._merge(
+                            self._in_flight,
+                            {
+                                date: {field: -amount for field, amount in counters.items()}
+                                for date, counters in unwritten.items()
+                            },
+                        )
+                        self._mark_pending()
+                if usage_unwritten:
+                    self._requeue_command_usage(command_usage)
+
+    def _mark_pending(self) -> None:
+        """Count a requeued batch as a pending event; the caller holds `_lock`."""
+        self._pending_events += 1
+        if self._oldest_pending is None:
+            self._oldest_pending = time.monotonic()
+
+    async def _flush_command_usage(self, command_usage: dict[str, list]) -> None:
+        """Add the usage counts to the `commands` rows with a single bulk write."""
+        updates = [
+            ({"command_name": command_name}, {"usage_count": count}, {"last_used": last_used})
+            for command_name, (count, last_used) in command_usage.items()
+        ]
+        written = False
+        try:
+            # Rows are created when a command is registered, so unknown names are not upserted.
+            await self.dbms.bulk_increment_async("commands", updates, upsert=False)
+            written = True
+        except Exception as error:
+            self.logging(f"Error flushing command usage: {error}", level="error")
+        finally:
+            if not written:
+                self._requeue_command_usage(command_usage)
+
+    def _requeue_command_usage(self, command_usage: dict[str, list]) -> None:
+        """Add unwritten usage counts back so the next flush retries them."""
+        with self._lock:
+            for command_name, (count, last_used) in command_usage.items():
+                usage = self._command_usage.setdefault(command_name, [0, last_used])
+                usage[0] += count
+                usage[1] = max(usage[1], last_used)
+            self._mark_pending()
+
+    async def load(self, date: str | None = None) -> None:
+        """Read the persisted counters of a day once so live statistics include them.
+
+        Args:
+            date (str | None): ISO date to load; defaults to today.
+        """
+        date = date or self._today()
+        # No flush runs while the row is read, so it already contains every delta flushed so far.
+        async with self._write_lock:
+            try:
+                rows = await self.dbms.get_data_async("statistics", {"date": date})
+            except Exception as error:
+                self.logging(f"Error loading statistics for {date}: {error}", level="error")
+                return
+
+            persisted: dict[str, int] = {}
+            for row in rows[:1]:
+                for field in ("total_messages", "total_dms", "total_commands"):
+                    persisted[field] = int(row.get(field, 0) or 0)
+                for command_name, amount in (row.get("command_breakdown") or {}).items():
+                    persisted[f"command_breakdown.{command_name}"] = int(amount or 0)
+            with self._lock:
+                self._persisted[date] = persisted
+
+    def start(self) -> None:
+        """Load today's counters and start the periodic flush task on the running event loop."""
+        if self._task is not None:
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the periodic task and flush whatever is still pending."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._flush_task is not None:
+            await self._flush_task
+        await self.flush()
+
+    async def _run(self) -> None:
+        """Flush pending deltas every `flush_interval` seconds."""
+        await self.load()
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    def get_live_statistics(self, date: str | None = None) -> dict:
+        """Return persisted counters merged with the not yet flushed deltas, without a database query.
+
+        Args:
+            date (str | None): ISO date to report; defaults to today.
+
+        Returns:
+            dict: ``date``, ``total_messages``, ``total_dms``, ``total_commands`` and ``command_breakdown``.
+        """
+        date = date or self._today()
+        merged: dict[str, dict[str, int]] = {}
+        with self._lock:
+            for source in (self._persisted, self._in_flight, self._pending):
+                if date in source:
+                    self._merge(merged, {date: source[date]})
+
+        counters = merged.get(date, {})
+        breakdown = {
+            field.split(".", 1)[1]: amount
+            for field, amount in counters.items()
+            if field.startswith("command_breakdown.") and amount
+        }
+        return {
+            "date": date,
+            "total_messages": counters.get("total_messages", 0),
+            "total_dms": counters.get("total_dms", 0),
+            "total_commands": counters.get("total_commands", 0),
+            "command_breakdown": breakdown,
+        }
@@ -1,41 +1,584 @@
 """Business-logic wrapper around `deep_translator` for Discord messages."""
 
-from deep_translator import GoogleTranslator  # type: ignore[import-untyped]
+import asyncio
+import hashlib
+import random
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
 
-from discord_bot.contracts.ports import TranslatePort, DatabasePort
+from discord_bot.contracts.ports import TranslatePort, DatabasePort, TranslationBackendPort
+from discord_bot.adapters.translation_backends import create_translation_backend
 from discord_bot.business_logic.model import Model
-from discord_bot.init.config_loader import DiscordConfigLoader
+from discord_bot.business_logic.language_detector import LanguageDetector
+from discord_bot.init.config_loader import DiscordConfigLoader, TranslatorConfigLoader
+from discord_bot.init.metrics import METRICS
+
+CACHE_REQUESTS = METRICS.counter(
+    "discord_bot_cache_requests_total", "Cache lookups by cache and result (hit or miss).", ("cache", "result")
+)
+BACKEND_LATENCY = METRICS.histogram(
+    "discord_bot_translation_backend_seconds", "Latency of translation backend calls by outcome.", ("outcome",)
+)
+
+class TranslationCache:
+    """Bounded LRU cache of translation results keyed by ``(text, source, target)``.
+
+    Entries expire after `ttl` seconds; the least recently used entries are evicted once either
+    `max_entries` or `max_bytes` is exceeded. With a `dbms` the entries are also written to the
+    `translation_cache` table and loaded again on first use, so they survive restarts; a TTL index
+    on ``created_at`` (see `discord_bot.init.db_indexes`) deletes the stored entries once they expire.
+    """
+    TABLE_NAME = "translation_cache"
+    # Seconds to serve from memory only after loading the stored entries failed, before trying again.
+    LOAD_RETRY_SECONDS = 60.0
+
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        ttl: float | None = None,
+        dbms: DatabasePort | None = None,
+    ) -> None:
+        self.max_entries = TranslatorConfigLoader.CACHE_MAX_ENTRIES if max_entries is None else max_entries
+        self.max_bytes = TranslatorConfigLoader.CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        self.ttl = TranslatorConfigLoader.CACHE_TTL if ttl is None else ttl
+        self.dbms = dbms
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.size_bytes = 0
+        # Key -> (translation, created_at, size in bytes), ordered from least to most recently used.
+        self._entries: OrderedDict[tuple[str, str, str], tuple[str, float, int]] = OrderedDict()
+        self._loaded = dbms is None
+        self._next_load_attempt = 0.0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _size(key: tuple[str, str, str], translation: str) -> int:
+        return sum(len(part.encode("utf-8")) for part in key) + len(translation.encode("utf-8"))
+
+    @staticmethod
+    def _document_id(key: tuple[str, str, str]) -> str:
+        return hashlib.sha1("\x00".join(key).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _epoch(created_at) -> float:
+        """Return a stored ``created_at`` as epoch seconds; rows written before it became a date hold a float."""
+        if isinstance(created_at, datetime):
+            # PyMongo returns naive datetimes in UTC.
+            return (created_at if created_at.tzinfo else created_at.replace(tzinfo=timezone.utc)).timestamp()
+        return float(created_at or 0)
+
+    def _expired(self, created_at: float) -> bool:
+        return bool(self.ttl) and time.time() - created_at >= self.ttl
+
+    def _store(self, key: tuple[str, str, str], translation: str, created_at: float) -> None:
+        """Insert an entry and evict least recently used ones until the limits hold. Caller holds the lock."""
+        size = self._size(key, translation)
+        if size > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.size_bytes -= previous[2]
+        self._entries[key] = (translation, created_at, size)
+        self.size_bytes += size
+        while len(self._entries) > self.max_entries or self.size_bytes > self.max_bytes:
+            _, (_, _, evicted_size) = self._entries.popitem(last=False)
+            self.size_bytes -= evicted_size
+            self.evictions += 1
+
+    def load(self) -> int:
+        """Load the persisted, not yet expired entries, newest last so they survive eviction longest.
+
+        Expired rows the TTL index has not removed yet, including rows whose ``created_at`` is still
+        a float and which the TTL index therefore ignores, are deleted.
+
+        Returns:
+            int: Number of entries held in memory afterwards.
+        """
+        if self.dbms is None:
+            return 0
+        rows = [(self._epoch(row.get("created_at")), row) for row in self.dbms.get_data(self.TABLE_NAME, {})]
+        rows.sort(key=lambda item: item[0])
+        expired_ids = []
+        with self._lock:
+            for created_at, row in rows:
+                if self._expired(created_at):
+                    expired_ids.append(row["_id"])
+                    continue
+                key = (row["text"], row["source"], row["target"])
+                self._store(key, row["translation"], created_at)
+            self._loaded = True
+            loaded = len(self._entries)
+        if expired_ids:
+            self.dbms.delete_data(self.TABLE_NAME, {"_id": {"$in": expired_ids}})
+        return loaded
+
+    def get(self, text: str, source: str, target: str) -> str | None:
+        """Return the cached translation, or None on a miss or an expired entry.
+
+        Raises:
+            Exception: If loading the stored entries failed; lookups then use memory only for
+                `LOAD_RETRY_SECONDS` before the next attempt.
+        """
+        if not self._loaded and time.monotonic() >= self._next_load_attempt:
+            try:
+                self.load()
+            except Exception:
+                self._next_load_attempt = time.monotonic() + self.LOAD_RETRY_SECONDS
+                raise
+        key = (text, source, target)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry[1]):
+                del self._entries[key]
+                self.size_bytes -= entry[2]
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                CACHE_REQUESTS.inc("translations", "miss")
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        CACHE_REQUESTS.inc("translations", "hit")
+        return entry[0]
+
+    def put(self, text: str, source: str, target: str, translation: str) -> None:
+        """Cache a translation in memory and, when persistence is enabled, in the database."""
+        key = (text, source, target)
+        created_at = time.time()
+        with self._lock:
+            self._store(key, translation, created_at)
+
+        if self.dbms is not None:
+            document = {
+                "_id": self._document_id(key),
+                "text": text,
+                "source": source,
+                "target": target,
+                "translation": translation,
+                # A date, so the TTL index can expire the row.
+                "created_at": datetime.fromtimestamp(created_at, timezone.utc),
+            }
+            try:
+                self.dbms.insert_data(self.TABLE_NAME, document)
+            except Exception:
+                # An older copy of the entry (evicted or expired in memory) is still stored; replace it.
+                self.dbms.delete_data(self.TABLE_NAME, {"_id": document["_id"]})
+                self.dbms.insert_data(self.TABLE_NAME, document)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size_bytes = 0
+
+    def stats(self) -> dict:
+        """Return the counters and current size of the cache."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.size_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+class CircuitBreaker:
+    """Stop calling a failing backend once its recent error rate crosses a threshold.
+
+    The breaker is ``closed`` while calls go through, ``open`` while it rejects them for
+    `open_seconds`, and ``half_open`` while a single probe call decides whether it closes again.
+    """
+    def __init__(
+        self,
+        failure_rate: float | None = None,
+        min_calls: int | None = None,
+        window: int | None = None,
+        open_seconds: float | None = None,
+    ) -> None:
+        self.failure_rate = TranslatorConfigLoader.BREAKER_FAILURE_RATE if failure_rate is None else failure_rate
+        self.min_calls = TranslatorConfigLoader.BREAKER_MIN_CALLS if min_calls is None else min_calls
+        self.open_seconds = TranslatorConfigLoader.BREAKER_OPEN_SECONDS if open_seconds is None else open_seconds
+        self.state = "closed"
+        self.opened_at: float | None = None
+        self.rejected = 0
+        # True for a success, False for a failure; only the most recent `window` outcomes count.
+        self._outcomes: deque[bool] = deque(maxlen=window or TranslatorConfigLoader.BREAKER_WINDOW)
+        self._probe_running = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Return True if a backend call may be made now."""
+        with self._lock:
+            if self.state == "open" and time.monotonic() - (self.opened_at or 0) >= self.open_seconds:
+                self.state = "half_open"
+            if self.state == "closed":
+                return True
+            if self.state == "half_open" and not self._probe_running:
+                self._probe_running = True
+                return True
+            self.rejected += 1
+            return False
+
+    def record(self, success: bool) -> None:
+        """Record the outcome of an allowed call and open or close the breaker accordingly."""
+        with self._lock:
+            if self.state == "half_open":
+                self._probe_running = False
+                if success:
+                    self.state = "closed"
+                    self._outcomes.clear()
+                else:
+                    self.state = "open"
+                    self.opened_at = time.monotonic()
+                return
+
+            self._outcomes.append(success)
+            failures = self._outcomes.count(False)
+            if len(self._outcomes) >= self.min_calls and failures / len(self._outcomes) >= self.failure_rate:
+                self.state = "open"
+                self.opened_at = time.monotonic()
+
+    def status(self) -> dict:
+        """Return the state, recent error rate and number of rejected calls."""
+        with self._lock:
+            calls = len(self._outcomes)
+            return {
+                "state": self.state,
+                "recent_calls": calls,
+                "recent_failure_rate": round(self._outcomes.count(False) / calls, 3) if calls else 0.0,
+                "rejected": self.rejected,
+            }
 
 class Translator(Model, TranslatePort):
-    """Translate text using Google Translate with optional user-specific target languages."""
-    def __init__(self, dbms: DatabasePort | None = None, **kwargs):
+    """Translate text through a pluggable backend with optional user-specific target languages."""
+    def __init__(
+        self,
+        dbms: DatabasePort | None = None,
+        max_workers: int | None = None,
+        timeout: float | None = None,
+        cache: TranslationCache | None = None,
+        batch_size: int | None = None,
+        batch_window: float | None = None,
+        breaker: CircuitBreaker | None = None,
+        backend: TranslationBackendPort | None = None,
+        detector: LanguageDetector | None = None,
+        **kwargs,
+    ):
         super().__init__(**kwargs)
         self.dbms = dbms
+        self.backend = backend or create_translation_backend()
+        self.detector = detector or (LanguageDetector() if TranslatorConfigLoader.DETECT_LANGUAGE else None)
+        self.cache = cache or TranslationCache(dbms=dbms if TranslatorConfigLoader.CACHE_PERSIST else None)
+        # Target language per user, filled lazily or by warm_language_cache(); users without a
+        # saved preference are cached with the default language so they are not queried again.
+        self._user_languages: dict[int, str] = {}
+        self._user_languages_lock = threading.Lock()
+        self.timeout = timeout or TranslatorConfigLoader.TIMEOUT
+        # Bounded so a slow backend cannot pile up an unlimited number of blocked threads.
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers or TranslatorConfigLoader.MAX_WORKERS, thread_name_prefix="translator"
+        )
+        self.batch_size = batch_size or TranslatorConfigLoader.BATCH_SIZE
+        self.batch_window = TranslatorConfigLoader.BATCH_WINDOW if batch_window is None else batch_window
+        self.breaker = breaker or CircuitBreaker()
+        self.max_attempts = TranslatorConfigLoader.MAX_ATTEMPTS
+        self.backoff_base = TranslatorConfigLoader.BACKOFF_BASE
+        self.backoff_max = TranslatorConfigLoader.BACKOFF_MAX
+        self.backend_calls = 0
+        self.backend_failures = 0
+        self.retries = 0
+        self.skipped_same_language = 0
+        # Backend requests currently running, so concurrent callers asking for the same text share them.
+        self._in_flight: dict[tuple[str, str], Future] = {}
+        self._in_flight_lock = threading.Lock()
+        # Texts collected on the event loop per target language until the batch window closes.
+        self._pending_batches: dict[str, tuple[list[tuple[str, asyncio.Future]], asyncio.TimerHandle]] = {}
+        METRICS.gauge(
+            "discord_bot_translation_circuit_open",
+            "1 while the translation circuit breaker rejects backend calls.",
+            function=lambda: float(self.breaker.status()["state"] == "open"),
+        )
+
+    def warm_language_cache(self) -> int:
+        """Load every saved user language preference into memory, typically once at startup.
+
+        Returns:
+            int: Number of cached user languages.
+        """
+        if not self.dbms:
+            return 0
+        languages = {
+            user_data["user_id"]: user_data["target_language"]
+            for user_data in self.dbms.get_data("users", {})
+            if user_data.get("user_id") is not None and user_data.get("target_language")
+        }
+        with self._user_languages_lock:
+            self._user_languages.update(languages)
+            return len(self._user_languages)
+
+    def invalidate_user_language(self, user_id: int | None = None) -> None:
+        """Forget the cached language of one user, or of all users if ``user_id`` is None."""
+        with self._user_languages_lock:
+            if user_id is None:
+                self._user_languages.clear()
+            else:
+                self._user_languages.pop(user_id, None)
+
+    def get_target_languages(self, user_ids: list[int]) -> dict[int, str]:
+        with self._user_languages_lock:
+            languages = {
+                user_id: self._user_languages[user_id] for user_id in user_ids if user_id in self._user_languages
+            }
+        missing = [user_id for user_id in user_ids if user_id not in languages]
+        if not missing:
+            return languages
+        if not self.dbms:
+            return {**languages, **dict.fromkeys(missing, DiscordConfigLoader.TARGET_LANGUAGE)}
+
+        loaded = dict.fromkeys(missing, DiscordConfigLoader.TARGET_LANGUAGE)
+        # One query for every user not cached yet instead of one per user.
+        query = {"user_id": missing[0] if len(missing) == 1 else {"$in": missing}}
+        for user_data in self.dbms.get_data("users", query):
+            if user_data.get("user_id") in loaded and user_data.get("target_language"):
+                # Prefer the user's saved target language.
+                loaded[user_data["user_id"]] = user_data["target_language"]
+        with self._user_languages_lock:
+            for user_id, language in loaded.items():
+                # A concurrent set_user_language() wins over what this query read.
+                self._user_languages.setdefault(user_id, language)
+            return {**languages, **{user_id: self._user_languages[user_id] for user_id in missing}}
+
+    def set_user_language(self, user_id: int, target_language: str, user_name: str | None = None) -> bool:
+        target_language = target_language.strip().lower()
+        if not target_language:
+            return False
+
+        if self.dbms:
+            data = {"target_language": target_language}
+            if user_name:
+                data["user_name"] = user_name
+            if self.dbms.get_data("users", {"user_id": user_id}):
+                self.dbms.update_data("users", {"user_id": user_id}, data)
+            else:
+                self.dbms.insert_data("users", {"user_id": user_id, **data})
+
+        with self._user_languages_lock:
+            self._user_languages[user_id] = target_language
+        self.logging(f"Target language of user {user_id} set to {target_language}")
+        return True
 
     def execute_function(self, text: str, user_id: int | None = None) -> str:
         target_language = DiscordConfigLoader.TARGET_LANGUAGE
-        
-        if user_id and self.dbms:
-            user_data = self.dbms.get_data("users", {"user_id": user_id})
-            if user_data:
-                # Prefer the user's saved target language.
-                target_language = user_data[0].get("target_language", target_language)
-        
-        for attempt in range(10):
+        if user_id:
+            target_language = self.get_target_languages([user_id])[user_id]
+        return self.translate_to(text, target_language)
+
+    def translate_to(self, text: str, target_language: str) -> str:
+        """Translate text into an explicit target language, serving repeated texts from the cache.
+
+        Args:
+            text (str): Text to translate.
+            target_language (str): Language code to translate into.
+
+        Returns:
+            str: Translated message, or the original text if every attempt failed.
+        """
+        return self.translate_many([text], target_language)[0]
+
+    def _cached(self, text: str, target_language: str) -> str | None:
+        try:
+            return self.cache.get(text, "auto", target_language)
+        except Exception as error:
+            self.logging(f"Error reading translation cache: {error}", level="error")
+            return None
+
+    def _is_in_language(self, text: str, target_language: str) -> bool:
+        """Return True if the detector is confident ``text`` is already written in ``target_language``."""
+        language = target_language.lower().split("-")[0]
+        # Without a corpus for the target (uk, ja, ...) the detector can never confirm it.
+        if not self.detector or language not in self.detector.profiles:
+            return False
+        if self.detector.detect(text) != language:
+            return False
+        with self._in_flight_lock:
+            self.skipped_same_language += 1
+        return True
+
+    def _translate_chunk(self, chunk: list[str], target_language: str) -> list[str]:
+        """Translate one chunk with a single backend call, retrying on errors.
+
+        Args:
+            chunk (list[str]): Distinct texts that are neither cached nor in flight.
+            target_language (str): Language code to translate into.
+
+        Returns:
+            list[str]: Translations in chunk order; the original text for every failed entry.
+        """
+        for attempt in range(self.max_attempts):
+            if not self.breaker.allow():
+                self.logging(
+                    f"Translation backend unavailable (circuit open), returning original text: {chunk}", level="warning"
+                )
+                return list(chunk)
+            if attempt:
+                with self._in_flight_lock:
+                    self.retries += 1
+            started = time.perf_counter()
             try:
-                translator = GoogleTranslator(source="auto", target=target_language)
-                result = translator.translate(text)
-                if user_id:
-                    self.logging(f'Successfully auto-translated: \'{text}\' -> \'{result}\' (target: {target_language})')
+                with self._in_flight_lock:
+                    self.backend_calls += 1
+                if len(chunk) == 1:
+                    results = [self.backend.translate(chunk[0], target_language)]
                 else:
-                    self.logging(f'Successfully translated: \'{text}\' -> \'{result}\' (target: {target_language})')
-                return result
+                    results = self.backend.translate_batch(chunk, target_language)
+                BACKEND_LATENCY.observe(time.perf_counter() - started, "success")
+                self.breaker.record(True)
+                translations = [result if isinstance(result, str) else text for text, result in zip(chunk, results)]
+                for text, result in zip(chunk, translations):
+                    self.logging(
+                        lambda: f"Successfully translated: '{text}' -> '{result}' (target: {target_language})",
+                        sample="translator.success",
+                    )
+                    try:
+                        self.cache.put(text, "auto", target_language, result)
+                    except Exception as error:
+                        self.logging(f"Error writing translation cache: {error}", level="error")
+                return translations
             
             except Exception as error:
-                self.logging(f'Translation error (attempt {attempt + 1}/10): {error}')
-        
-        self.logging(f'Translation failed after 10 attempts, returning original text: \'{text}\'')
-        return text
+                BACKEND_LATENCY.observe(time.perf_counter() - started, "error")
+                self.breaker.record(False)
+                with self._in_flight_lock:
+                    self.backend_failures += 1
+                self.logging(f"Translation error (attempt {attempt + 1}/{self.max_attempts}): {error}", level="warning")
+                if attempt + 1 < self.max_attempts:
+                    time.sleep(self._backoff(attempt))
+
+        self.logging(
+            f"Translation failed after {self.max_attempts} attempts, returning original text: {chunk}", level="error"
+        )
+        return list(chunk)
+
+    def _backoff(self, attempt: int) -> float:
+        """Return the delay before retry ``attempt + 1``: exponential growth with full jitter."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def get_backend_status(self) -> dict:
+        with self._in_flight_lock:
+            counters = {
+                "backend_calls": self.backend_calls,
+                "backend_failures": self.backend_failures,
+                "retries": self.retries,
+                "skipped_same_language": self.skipped_same_language,
+            }
+        return {"breaker": self.breaker.status(), **counters, "cache": self.cache.stats()}
+
+    def translate_many(self, texts: list[str], target_language: str | None = None) -> list[str]:
+        target_language = target_language or DiscordConfigLoader.TARGET_LANGUAGE
+        results: dict[str, str] = {}
+        owned: dict[str, Future] = {}
+        waiting: dict[str, Future] = {}
+
+        for text in dict.fromkeys(texts):
+            cached = self._cached(text, target_language)
+            if cached is not None:
+                results[text] = cached
+                continue
+            if self._is_in_language(text, target_language):
+                results[text] = text
+                continue
+            with self._in_flight_lock:
+                future = self._in_flight.get((text, target_language))
+                if future is None:
+                    future = self._in_flight[(text, target_language)] = Future()
+                    owned[text] = future
+                else:
+                    waiting[text] = future
+
+        pending = list(owned)
+        try:
+            for start in range(0, len(pending), self.batch_size):
+                chunk = pending[start:start + self.batch_size]
+                for text, translation in zip(chunk, self._translate_chunk(chunk, target_language)):
+                    results[text] = translation
+                    owned[text].set_result(translation)
+        finally:
+            with self._in_flight_lock:
+                for text, future in owned.items():
+                    self._in_flight.pop((text, target_language), None)
+                    if not future.done():
+                        future.set_result(text)
+
+        for text, future in waiting.items():
+            results[text] = future.result()
+        return [results[text] for text in texts]
+
+    async def _run_with_timeout(self, fallback, timeout: float | None, function, *args):
+        """Run a blocking translation on the worker pool and return ``fallback`` after ``timeout`` seconds."""
+        timeout = timeout or self.timeout
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self.executor, function, *args)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            # The worker thread keeps running in the background; the caller gets the original text now.
+            self.logging(
+                f"Translation timed out after {timeout}s, returning original text: {fallback!r}", level="warning"
+            )
+            return fallback
+
+    async def execute_function_async(self, text: str, user_id: int | None = None, timeout: float | None = None) -> str:
+        return await self._run_with_timeout(text, timeout, self.execute_function, text, user_id)
+
+    async def translate_to_async(self, text: str, target_language: str, timeout: float | None = None) -> str:
+        # Bursts of messages are collected for `batch_window` seconds and sent as one translate_many call.
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        if target_language not in self._pending_batches:
+            handle = loop.call_later(self.batch_window, self._flush_batch, target_language)
+            self._pending_batches[target_language] = ([], handle)
+        batch, _ = self._pending_batches[target_language]
+        batch.append((text, future))
+        if len(batch) >= self.batch_size:
+            self._flush_batch(target_language)
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout or self.timeout)
+        except asyncio.TimeoutError:
+            self.logging(
+                f"Translation timed out after {timeout or self.timeout}s, returning original text: '{text}'",
+                level="warning",
+            )
+            return text
+
+    def _flush_batch(self, target_language: str) -> None:
+        """Send the texts collected for a language to the worker pool and resolve their futures."""
+        batch, handle = self._pending_batches.pop(target_language, ([], None))
+        if handle is not None:
+            handle.cancel()
+        if not batch:
+            return
+
+        texts = [text for text, _ in batch]
+        loop = asyncio.get_running_loop()
+        translated = loop.run_in_executor(self.executor, self.translate_many, texts, target_language)
+
+        def resolve(done: asyncio.Future) -> None:
+            error = done.exception()
+            for (text, future), result in zip(batch, texts if error else done.result()):
+                if not future.done():
+                    future.set_result(result)
+            if error:
+                self.logging(f"Batch translation failed, returning original texts: {error}", level="error")
+
+        translated.add_done_callback(resolve)
 
 if __name__ == "__main__":
     translator = Translator()
@@ -1,6 +1,8 @@
 """Define abstract base classes (ports) for the Discord bot architecture."""
 
+import asyncio
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
 from typing import overload, Callable
 
 class DatabasePort(ABC):
@@ -67,6 +69,22 @@ class DatabasePort(ABC):
         """
         ...
     
+    @abstractmethod
+    def insert_many(self, table_name: str, data: list[dict]) -> bool:
+        """Insert a batch of documents into a table with a single round trip.
+
+        Args:
+            table_name (str): Name of the table to insert data into.
+            data (list[dict]): Rows to insert.
+
+        Returns:
+            True if the insertion was acknowledged, False if nothing was inserted.
+
+        Raises:
+            RuntimeError: If the database connection is not available.
+        """
+        ...
+
     @abstractmethod
     def update_data(self, table_name: str, query: dict, data: dict) -> bool:
         """Update one or more rows in a table.
@@ -84,6 +102,63 @@ class DatabasePort(ABC):
         """
         ...
 
+    @abstractmethod
+    def increment_data(self, table_name: str, query: dict, counters: dict[str, int], upsert: bool = True) -> bool:
+        """Atomically increment numeric fields of the row matching a query.
+
+        The increment happens on the database server, so concurrent callers never lose updates.
+
+        Args:
+            table_name (str): Name of the table to update.
+            query (dict): Filter specifying which row to update.
+            counters (dict[str, int]): Field names (dotted paths allowed) mapped to the amount to add.
+            upsert (bool): Whether to create the row if no row matches the query.
+
+        Returns:
+            True if the update was acknowledged, otherwise False.
+
+        Raises:
+            RuntimeError: If the database connection is not available.
+        """
+        ...
+
+    @abstractmethod
+    def bulk_increment(
+        self, table_name: str, updates: list[tuple[dict, dict[str, int], dict]], upsert: bool = False
+    ) -> bool:
+        """Apply many atomic increments to a table in a single round trip.
+
+        Args:
+            table_name (str): Name of the table to update.
+            updates (list[tuple[dict, dict[str, int], dict]]): One ``(query, counters, values)`` entry per
+                row: the filter, the fields to increment and the fields to set.
+            upsert (bool): Whether to create rows that no query matches.
+
+        Returns:
+            True if the writes were acknowledged, otherwise False.
+
+        Raises:
+            RuntimeError: If the database connection is not available.
+        """
+        ...
+
+    @abstractmethod
+    def bulk_update(self, table_name: str, updates: list[tuple[dict, dict]]) -> bool:
+        """Set fields on many rows of a table in a single round trip.
+
+        Args:
+            table_name (str): Name of the table to update.
+            updates (list[tuple[dict, dict]]): One ``(query, values)`` entry per row: the filter and
+                the fields to set on the first row it matches.
+
+        Returns:
+            True if the writes were acknowledged, otherwise False.
+
+        Raises:
+            RuntimeError: If the database connection is not available.
+        """
+        ...
+
     @abstractmethod
     def delete_data(self, db_name: str, query: dict) -> bool:
         """Delete rows from a table based on a query.
@@ -150,16 +225,211 @@ class DatabasePort(ABC):
         """
         ...
 
+    @abstractmethod
+    def get_oldest_data(self, table_name: str, query: dict, field: str, limit: int) -> list[dict]:
+        """Read at most ``limit`` rows matching a query, in ascending order of one field.
+
+        Args:
+            table_name (str): Name of the table to read from.
+            query (dict): Filter specifying which rows to return.
+            field (str): Field to sort by, oldest (smallest) value first.
+            limit (int): Maximum number of rows to return.
+
+        Returns:
+            list[dict]: The matching rows.
+
+        Raises:
+            RuntimeError: If the database connection is not available.
+        """
+        ...
+
+    @abstractmethod
+    def create_table(self, table_name: str, capped_size: int | None = None) -> bool:
+        """Create a table unless it exists, optionally as a capped table.
+
+        A capped table has a fixed size in bytes and discards its oldest rows to make room for
+        new ones. An existing table keeps its options.
+
+        Args:
+            table_name (str): Name of the table to create.
+            capped_size (int | None): Maximum size of a capped table in bytes; uncapped if omitted.
+
+        Returns:
+            True if the table was created, False if it existed.
+
+        Raises:
+            RuntimeError: If the database connection is not available.
+        """
+        ...
+
+    @abstractmethod
+    def create_index(
+        self,
+        table_name: str,
+        keys: list[tuple[str, int]],
+        unique: bool = False,
+        expire_after_seconds: int | None = None,
+    ) -> str:
+        """Create an index on a table unless an identical one exists.
+
+        Args:
+            table_name (str): Name of the table to index.
+            keys (list[tuple[str, int]]): Indexed fields with direction (1 ascending, -1 descending).
+            unique (bool): Whether to reject rows that repeat the indexed values.
+            expire_after_seconds (int | None): Make this a TTL index on a single date field: the
+                database deletes rows once that date is older than the given number of seconds.
+
+        Returns:
+            str: Name of the index.
+
+        Raises:
+            RuntimeError: If the database connection is not available.
+            DuplicateKeyError: If ``unique`` is set and existing rows already repeat the values.
+        """
+        ...
+
+    @abstractmethod
+    def get_indexes(self, table_name: str) -> list[dict]:
+        """List the indexes of a table with their usage.
+
+        Args:
+            table_name (str): Name of the table.
+
+        Returns:
+            list[dict]: ``name``, ``keys`` (list of field and direction pairs), ``unique``,
+            ``expire_after_seconds`` (None unless a TTL index) and ``ops`` (queries that used the
+            index since the server started, None if the server does not report it) per index.
+
+        Raises:
+            RuntimeError: If the database connection is not available.
+        """
+        ...
+
+    def invalidate_cache(self, table_name: str | None = None) -> None:
+        """Drop cached rows after a table was changed outside of this port (e.g. by a CSV reload).
+
+        Adapters without a cache keep this default no-op.
+
+        Args:
+            table_name (str | None): Table to invalidate; all tables if omitted.
+        """
+        return None
+
+    async def get_data_async(self, table_name: str, query: dict) -> list[dict]:
+        """Asynchronous variant of `get_data` for callers running inside an event loop.
+
+        The default implementation runs `get_data` in a worker thread; adapters may override it.
+
+        Args:
+            table_name (str): Name of the table to fetch data from.
+            query (dict): Query parameters to filter the data.
+
+        Returns:
+            List of dictionaries representing the fetched rows.
+        """
+        return await asyncio.to_thread(self.get_data, table_name, query)
+
+    async def insert_data_async(self, table_name: str, data: dict) -> bool:
+        """Asynchronous variant of `insert_data` for callers running inside an event loop.
+
+        Args:
+            table_name (str): Name of the table to insert data into.
+            data (dict): Mapping representing the row to insert.
+
+        Returns:
+            True if the insertion was acknowledged, otherwise False.
+        """
+        return await asyncio.to_thread(self.insert_data, table_name, data)
+
+    async def insert_many_async(self, table_name: str, data: list[dict]) -> bool:
+        """Asynchronous variant of `insert_many` for callers running inside an event loop.
+
+        Args:
+            table_name (str): Name of the table to insert data into.
+            data (list[dict]): Rows to insert.
+
+        Returns:
+            True if the insertion was acknowledged, False if nothing was inserted.
+        """
+        return await asyncio.to_thread(self.insert_many, table_name, data)
+
+    async def update_data_async(self, table_name: str, query: dict, data: dict) -> bool:
+        """Asynchronous variant of `update_data` for callers running inside an event loop.
+
+        Args:
+            table_name (str): Name of the table to update.
+            query (dict): Filter specifying which rows to update.
+            data (dict): Fields to set on the matched rows.
+
+        Returns:
+            True if the update was acknowledged, otherwise False.
+        """
+        return await asyncio.to_thread(self.update_data, table_name, query, data)
+
+    async def increment_data_async(
+        self, table_name: str, query: dict, counters: dict[str, int], upsert: bool = True
+    ) -> bool:
+        """Asynchronous variant of `increment_data` for callers running inside an event loop.
+
+        Args:
+            table_name (str): Name of the table to update.
+            query (dict): Filter specifying which row to update.
+            counters (dict[str, int]): Field names (dotted paths allowed) mapped to the amount to add.
+            upsert (bool): Whether to create the row if no row matches the query.
+
+        Returns:
+            True if the update was acknowledged, otherwise False.
+        """
+        return await asyncio.to_thread(self.increment_data, table_name, query, counters, upsert)
+
+    async def bulk_increment_async(
+        self, table_name: str, updates: list[tuple[dict, dict[str, int], dict]], upsert: bool = False
+    ) -> bool:
+        """Asynchronous variant of `bulk_increment` for callers running inside an event loop.
+
+        Args:
+            table_name (str): Name of the table to update.
+            updates (list[tuple[dict, dict[str, int], dict]]): ``(query, counters, values)`` per row.
+            upsert (bool): Whether to create rows that no query matches.
+
+        Returns:
+            True if the writes were acknowledged, otherwise False.
+        """
+        return await asyncio.to_thread(self.bulk_increment, table_name, updates, upsert)
+
+    async def delete_data_async(self, db_name: str, query: dict) -> bool:
+        """Asynchronous variant of `delete_data` for callers running inside an event loop.
+
+        Args:
+            db_name (str): Name of the database containing the table to delete data from.
+            query (dict): Filter specifying which rows to delete.
+
+        Returns:
+            True if the deletion was acknowledged, otherwise False.
+        """
+        return await asyncio.to_thread(self.delete_data, db_name, query)
+
 class ModelPort(ABC):
     """Abstract interface for basic model behaviour."""
 
     @abstractmethod
-    def logging(self, message: str = "Model logging", log_file_name: str | None = None) -> None:
+    def logging(
+        self,
+        message: str | Callable[[], str] = "Model logging",
+        log_file_name: str | None = None,
+        level: str = "info",
+        sample: str | None = None,
+    ) -> None:
         """Write a log message for the current model.
 
         Args:
-            message (str): Message to log.
+            message (str | Callable[[], str]): Message to log, or a function building it that is only
+                called if the message is written.
             log_file_name (str | None): Optional explicit log file name; if omitted, the class name is used.
+            level (str): ``"debug"``, ``"info"``, ``"warning"`` or ``"error"``; levels below the configured
+                one are dropped.
+            sample (str | None): Sampling site such as ``"translator.success"``; only the configured share
+                of its calls is written. Warnings and errors are never sampled.
         """
         ...
 
@@ -168,6 +438,40 @@ class ModelPort(ABC):
         """Execute the primary domain-specific function of the model."""
         ...
 
+class TranslationBackendPort(ABC):
+    """Abstract interface for the service that performs the actual translation."""
+    @abstractmethod
+    def translate(self, text: str, target_language: str) -> str:
+        """Translate a single text.
+
+        Args:
+            text (str): Text to translate; the source language is detected automatically.
+            target_language (str): Language code to translate into.
+
+        Returns:
+            str: Translated text.
+
+        Raises:
+            Exception: Any backend error; callers retry according to their policy.
+        """
+        ...
+
+    @abstractmethod
+    def translate_batch(self, texts: list[str], target_language: str) -> list[str]:
+        """Translate several texts into the same language.
+
+        Args:
+            texts (list[str]): Texts to translate.
+            target_language (str): Language code to translate into.
+
+        Returns:
+            list[str]: Translations in the order of ``texts``.
+
+        Raises:
+            Exception: Any backend error; callers retry according to their policy.
+        """
+        ...
+
 class TranslatePort(ModelPort):
     """Abstract interface for translation models."""
     @overload
@@ -208,6 +512,84 @@ class TranslatePort(ModelPort):
         """
         ...
 
+    @abstractmethod
+    async def execute_function_async(self, text: str, user_id: int | None = None, timeout: float | None = None) -> str:
+        """Translate text without blocking the calling event loop.
+
+        Args:
+            text (str): Text to translate.
+            user_id (int | None): Optional user ID for language preference.
+            timeout (float | None): Seconds to wait before giving up; a configured default if omitted.
+
+        Returns:
+            str: Translated message, or the original text if the translation failed or timed out.
+        """
+        ...
+
+    @abstractmethod
+    def translate_many(self, texts: list[str], target_language: str | None = None) -> list[str]:
+        """Translate several texts into one language with as few backend calls as possible.
+
+        Duplicates are translated once and requests for texts already in flight are shared.
+
+        Args:
+            texts (list[str]): Texts to translate.
+            target_language (str | None): Language code to translate into; the default language if omitted.
+
+        Returns:
+            list[str]: Translations in the order of ``texts``; the original text for failed entries.
+        """
+        ...
+
+    @abstractmethod
+    def get_backend_status(self) -> dict:
+        """Report the health of the translation backend.
+
+        Returns:
+            dict: Circuit breaker state, call, failure and retry counters, and cache statistics.
+        """
+        ...
+
+    @abstractmethod
+    def get_target_languages(self, user_ids: list[int]) -> dict[int, str]:
+        """Resolve the preferred target language of several users at once.
+
+        Args:
+            user_ids (list[int]): Users to look up.
+
+        Returns:
+            dict[int, str]: Every given user mapped to a language code; the default language if none is saved.
+        """
+        ...
+
+    @abstractmethod
+    def set_user_language(self, user_id: int, target_language: str, user_name: str | None = None) -> bool:
+        """Save a user's preferred target language and update any cached copy of it.
+
+        Args:
+            user_id (int): User whose preference changes.
+            target_language (str): Language code to translate into for this user.
+            user_name (str | None): Optional display name stored alongside the preference.
+
+        Returns:
+            bool: True if the preference was saved, False for an empty language code.
+        """
+        ...
+
+    @abstractmethod
+    async def translate_to_async(self, text: str, target_language: str, timeout: float | None = None) -> str:
+        """Translate text into an explicit target language without blocking the calling event loop.
+
+        Args:
+            text (str): Text to translate.
+            target_language (str): Language code to translate into.
+            timeout (float | None): Seconds to wait before giving up; a configured default if omitted.
+
+        Returns:
+            str: Translated message, or the original text if the translation failed or timed out.
+        """
+        ...
+
 class FunFactPort(ModelPort):
     """Abstract interface for fun-fact providers."""
 
@@ -348,6 +730,83 @@ class DiscordLogicPort(ABC):
         """
         ...
 
+    @abstractmethod
+    def submit_message(self, guild_id: int, channel_id: int, message: str) -> Future:
+        """Schedule a message on the bot's event loop without waiting for it to be sent.
+
+        Args:
+            guild_id (int): ID of the Discord guild.
+            channel_id (int): ID of the channel to send the message to.
+            message (str): Message to be sent.
+
+        Returns:
+            Future: Resolves to True if the message was sent, False otherwise; already resolved to
+            False if the bot is not connected.
+        """
+        ...
+
+    @abstractmethod
+    def submit_broadcast(
+        self, targets: list[tuple[int, int]], message: str, max_concurrency: int | None = None
+    ) -> dict[tuple[int, int], Future]:
+        """Send a message to many channels with a bounded number of sends in flight.
+
+        Args:
+            targets (list[tuple[int, int]]): ``(guild_id, channel_id)`` pairs; duplicates are sent once.
+            message (str): Message to be sent.
+            max_concurrency (int | None): Sends running at the same time; a configured default if omitted.
+
+        Returns:
+            dict[tuple[int, int], Future]: One future per target that resolves to True or False as
+            soon as that channel is done.
+        """
+        ...
+
+    @abstractmethod
+    def select_broadcast_channels(
+        self, guild_ids: list[int] | None = None, name_pattern: str | None = None
+    ) -> list[dict]:
+        """List the text channels the bot may write to, filtered by guild and channel name.
+
+        Args:
+            guild_ids (list[int] | None): Only channels of these guilds; all guilds if empty.
+            name_pattern (str | None): Shell-style pattern for the channel name, e.g. ``"announce*"``.
+
+        Returns:
+            list[dict]: ``guild_id``, ``guild_name``, ``channel_id`` and ``channel_name`` per channel.
+        """
+        ...
+
+    @abstractmethod
+    def start_broadcast_job(self, channels: list[dict], message: str) -> str | None:
+        """Start a stored broadcast job that survives restarts of the bot.
+
+        Args:
+            channels (list[dict]): Targets as returned by `select_broadcast_channels`.
+            message (str): Message to be sent.
+
+        Returns:
+            str | None: ID of the job, or None without a database.
+        """
+        ...
+
+    @abstractmethod
+    def get_broadcast_jobs(self) -> list[dict]:
+        """Return progress, retries and failed channels of all broadcast jobs, newest first."""
+        ...
+
+    @abstractmethod
+    def cancel_broadcast_job(self, job_id: str) -> bool:
+        """Stop a running broadcast job.
+
+        Args:
+            job_id (str): ID of the job.
+
+        Returns:
+            bool: True if the job was running.
+        """
+        ...
+
     @abstractmethod
     def run(self) -> None:
         """Start the Discord bot and connect to Discord guilds.
@@ -411,6 +870,87 @@ class DiscordLogicPort(ABC):
         """
         ...
     
+    @abstractmethod
+    def get_auto_translate_counters(self) -> dict:
+        """Return how auto-translations were delivered under the send limits.
+
+        Returns:
+            dict: ``sent`` (sent on their own), ``merged`` (added to a digest), ``dropped``
+            (digest full or too long) and ``digests`` (digest messages sent).
+        """
+        ...
+
+    @abstractmethod
+    def get_diagnostics(self) -> dict:
+        """Return event-loop health for spotting handlers that block the bot.
+
+        Returns:
+            dict: ``loop_lag_ms`` (last and max), ``threshold_ms``, ``handlers`` (calls, avg_ms,
+            max_ms and stalls per command or event handler) and ``stalls`` (recent blocked periods
+            with handler name and stack trace, newest first).
+        """
+        ...
+
+    @abstractmethod
+    def profile_command(self, command: str, runs: int = 1, mode: str = "cprofile") -> bool:
+        """Profile the next invocations of a registered command.
+
+        Args:
+            command (str): Registered command name.
+            runs (int): Number of upcoming invocations to profile.
+            mode (str): ``cprofile`` (deterministic) or ``sampling`` (periodic stack samples).
+
+        Returns:
+            bool: True if the command was armed, False for an unknown command, mode or run count.
+        """
+        ...
+
+    @abstractmethod
+    def cancel_command_profiling(self, command: str) -> bool:
+        """Stop profiling a command before its armed invocations have run.
+
+        Args:
+            command (str): Armed command name.
+
+        Returns:
+            bool: True if the command was armed.
+        """
+        ...
+
+    @abstractmethod
+    def get_command_profiles(self) -> dict:
+        """Return the profiling state of all commands.
+
+        Returns:
+            dict: ``commands`` (profilable command names), ``armed`` (remaining runs and mode per
+            command) and ``results`` (time, mode, duration_ms and summary of the stored profiles per
+            command, oldest first).
+        """
+        ...
+
+    @abstractmethod
+    def export_command_profile(self, command: str, index: int = -1) -> str | None:
+        """Write a stored profile of a command to a file for download.
+
+        Args:
+            command (str): Profiled command name.
+            index (int): Position in the command's stored profiles; ``-1`` is the latest.
+
+        Returns:
+            str | None: Path of the ``.prof`` (cProfile) or ``.folded`` (sampling) file, or None.
+        """
+        ...
+
+    @abstractmethod
+    def get_live_statistics(self) -> dict:
+        """Get today's message, DM and command counters including not yet persisted updates.
+
+        Returns:
+            dict: A dictionary with 'date', 'total_messages', 'total_dms', 'total_commands'
+                and 'command_breakdown' keys, or an empty dict without a database.
+        """
+        ...
+
     @abstractmethod
     def get_bot_stats(self) -> dict:
         """Get bot statistics: status, guild count, and total user count.
@@ -10,6 +10,18 @@ config_path = project_root / "config.ini"
 config = configparser.ConfigParser()
 files_read = config.read(config_path)
 
+def _one_of(setting: str, value: str, choices: tuple[str, ...]) -> str:
+    """Return a setting that must be one of ``choices``, with an error naming the allowed values otherwise."""
+    if value not in choices:
+        raise ValueError(f'{setting} must be one of {", ".join(choices)}, got {value!r}')
+    return value
+
+def _positive_rate(setting: str, value: float) -> float:
+    """Return a token-bucket rate, rejecting values that would never refill the bucket."""
+    if value <= 0:
+        raise ValueError(f"{setting} must be greater than 0, got {value}")
+    return value
+
 class DBConfigLoader:
     """Load database configuration values from `config.ini` and environment variables."""
     IN_DOCKER = os.path.exists("/.dockerenv")
@@ -29,6 +41,8 @@ class DBConfigLoader:
     
     CV_DB_NAME = os.getenv("CV_DB_NAME", config.get("database", "cv_db_name", fallback="constant_values"))
     DISCORD_DB_NAME = os.getenv("DISCORD_DB_NAME", config.get("database", "discord_db_name", fallback="discord"))
+
+    ASYNC_WORKERS = int(os.getenv("DB_ASYNC_WORKERS", config.getint("database", "async_workers", fallback=8)))
     
     @staticmethod
     def generate_env() -> None:
@@ -71,6 +85,191 @@ class DiscordConfigLoader:
     _token = config.get("discord", "discord_token", fallback="")
     DISCORD_TOKEN = os.getenv("DISCORD_TOKEN", _token.split()[0] if _token else "")
 
+class TranslatorConfigLoader:
+    """Load translator settings from `config.ini` and environment variables."""
+    MAX_WORKERS = int(os.getenv("TRANSLATOR_MAX_WORKERS", config.getint("translator", "max_workers", fallback=4)))
+    TIMEOUT = float(os.getenv("TRANSLATOR_TIMEOUT", config.getfloat("translator", "timeout", fallback=10.0)))
+    BACKEND = os.getenv("TRANSLATOR_BACKEND", config.get("translator", "backend", fallback="google"))
+    LOCAL_LATENCY = float(
+        os.getenv("TRANSLATOR_LOCAL_LATENCY", config.getfloat("translator", "local_latency", fallback=0.0))
+    )
+    LOCAL_ERROR_RATE = float(
+        os.getenv("TRANSLATOR_LOCAL_ERROR_RATE", config.getfloat("translator", "local_error_rate", fallback=0.0))
+    )
+    DETECT_LANGUAGE = os.getenv(
+        "TRANSLATOR_DETECT_LANGUAGE", str(config.getboolean("translator", "detect_language", fallback=True))
+    ).lower() in ("1", "true", "yes")
+    DETECT_MIN_CHARS = int(
+        os.getenv("TRANSLATOR_DETECT_MIN_CHARS", config.getint("translator", "detect_min_chars", fallback=15))
+    )
+    DETECT_MIN_MARGIN = float(
+        os.getenv("TRANSLATOR_DETECT_MIN_MARGIN", config.getfloat("translator", "detect_min_margin", fallback=0.05))
+    )
+    DETECT_MIN_COVERAGE = float(
+        os.getenv("TRANSLATOR_DETECT_MIN_COVERAGE", config.getfloat("translator", "detect_min_coverage", fallback=0.6))
+    )
+    MAX_ATTEMPTS = int(os.getenv("TRANSLATOR_MAX_ATTEMPTS", config.getint("translator", "max_attempts", fallback=4)))
+    BACKOFF_BASE = float(
+        os.getenv("TRANSLATOR_BACKOFF_BASE", config.getfloat("translator", "backoff_base", fallback=0.5))
+    )
+    BACKOFF_MAX = float(os.getenv("TRANSLATOR_BACKOFF_MAX", config.getfloat("translator", "backoff_max", fallback=4.0)))
+    BREAKER_FAILURE_RATE = float(
+        os.getenv(
+            "TRANSLATOR_BREAKER_FAILURE_RATE", config.getfloat("translator", "breaker_failure_rate", fallback=0.5)
+        )
+    )
+    BREAKER_MIN_CALLS = int(
+        os.getenv("TRANSLATOR_BREAKER_MIN_CALLS", config.getint("translator", "breaker_min_calls", fallback=10))
+    )
+    BREAKER_WINDOW = int(
+        os.getenv("TRANSLATOR_BREAKER_WINDOW", config.getint("translator", "breaker_window", fallback=20))
+    )
+    BREAKER_OPEN_SECONDS = float(
+        os.getenv(
+            "TRANSLATOR_BREAKER_OPEN_SECONDS", config.getfloat("translator", "breaker_open_seconds", fallback=30.0)
+        )
+    )
+    BATCH_SIZE = int(os.getenv("TRANSLATOR_BATCH_SIZE", config.getint("translator", "batch_size", fallback=25)))
+    BATCH_WINDOW = float(
+        os.getenv("TRANSLATOR_BATCH_WINDOW", config.getfloat("translator", "batch_window", fallback=0.05))
+    )
+    CACHE_MAX_ENTRIES = int(
+        os.getenv("TRANSLATOR_CACHE_MAX_ENTRIES", config.getint("translator", "cache_max_entries", fallback=10000))
+    )
+    CACHE_MAX_BYTES = int(
+        os.getenv("TRANSLATOR_CACHE_MAX_BYTES", config.getint("translator", "cache_max_bytes", fallback=4194304))
+    )
+    CACHE_TTL = float(os.getenv("TRANSLATOR_CACHE_TTL", config.getfloat("translator", "cache_ttl", fallback=86400.0)))
+    _language_choices = os.getenv(
+        "TRANSLATOR_LANGUAGE_CHOICES", config.get("translator", "language_choices", fallback="de, en, fr, es, it")
+    )
+    LANGUAGE_CHOICES = tuple(language.strip() for language in _language_choices.split(",") if language.strip())
+    CACHE_PERSIST = os.getenv(
+        "TRANSLATOR_CACHE_PERSIST", str(config.getboolean("translator", "cache_persist", fallback=False))
+    ).lower() in ("1", "true", "yes")
+
+class MessageBufferConfigLoader:
+    """Load write-behind message buffer settings from `config.ini` and environment variables."""
+    FLUSH_SIZE = int(
+        os.getenv("MESSAGE_BUFFER_FLUSH_SIZE", config.getint("message_buffer", "flush_size", fallback=100))
+    )
+    FLUSH_INTERVAL = float(
+        os.getenv("MESSAGE_BUFFER_FLUSH_INTERVAL", config.getfloat("message_buffer", "flush_interval", fallback=2.0))
+    )
+    MAX_QUEUE_SIZE = int(
+        os.getenv("MESSAGE_BUFFER_MAX_QUEUE_SIZE", config.getint("message_buffer", "max_queue_size", fallback=10000))
+    )
+
+class StatisticsConfigLoader:
+    """Load in-memory statistics aggregation settings from `config.ini` and environment variables."""
+    FLUSH_INTERVAL = float(
+        os.getenv("STATISTICS_FLUSH_INTERVAL", config.getfloat("statistics", "flush_interval", fallback=10.0))
+    )
+    MAX_UNFLUSHED_INTERVAL = float(
+        os.getenv(
+            "STATISTICS_MAX_UNFLUSHED_INTERVAL", config.getfloat("statistics", "max_unflushed_interval", fallback=30.0)
+        )
+    )
+    MAX_PENDING_EVENTS = int(
+        os.getenv("STATISTICS_MAX_PENDING_EVENTS", config.getint("statistics", "max_pending_events", fallback=500))
+    )
+
+class RateLimitConfigLoader:
+    """Load auto-translate send limits from `config.ini` and environment variables."""
+    CHANNEL_RATE = _positive_rate(
+        "[rate_limit] channel_rate",
+        float(os.getenv("RATE_LIMIT_CHANNEL_RATE", config.getfloat("rate_limit", "channel_rate", fallback=1.0))),
+    )
+    CHANNEL_BURST = float(
+        os.getenv("RATE_LIMIT_CHANNEL_BURST", config.getfloat("rate_limit", "channel_burst", fallback=5))
+    )
+    GUILD_RATE = _positive_rate(
+        "[rate_limit] guild_rate",
+        float(os.getenv("RATE_LIMIT_GUILD_RATE", config.getfloat("rate_limit", "guild_rate", fallback=5.0))),
+    )
+    GUILD_BURST = float(os.getenv("RATE_LIMIT_GUILD_BURST", config.getfloat("rate_limit", "guild_burst", fallback=20)))
+    MAX_DIGEST_ENTRIES = int(
+        os.getenv("RATE_LIMIT_MAX_DIGEST_ENTRIES", config.getint("rate_limit", "max_digest_entries", fallback=20))
+    )
+
+class BroadcastConfigLoader:
+    """Load settings for admin messages and broadcasts from `config.ini` and environment variables."""
+    MAX_CONCURRENCY = int(
+        os.getenv("BROADCAST_MAX_CONCURRENCY", config.getint("broadcast", "max_concurrency", fallback=5))
+    )
+    SEND_TIMEOUT = float(
+        os.getenv("BROADCAST_SEND_TIMEOUT", config.getfloat("broadcast", "send_timeout", fallback=10.0))
+    )
+    RATE = _positive_rate(
+        "[broadcast] rate", float(os.getenv("BROADCAST_RATE", config.getfloat("broadcast", "rate", fallback=5.0)))
+    )
+    MAX_RETRIES = int(os.getenv("BROADCAST_MAX_RETRIES", config.getint("broadcast", "max_retries", fallback=3)))
+    PERSIST_EVERY = int(os.getenv("BROADCAST_PERSIST_EVERY", config.getint("broadcast", "persist_every", fallback=10)))
+
+class CacheConfigLoader:
+    """Load settings of the in-memory constant-value table cache from `config.ini` and environment variables."""
+    _tables = os.getenv("CACHED_TABLES", config.get("cache", "cached_tables", fallback="dishes, fun_facts"))
+    CACHED_TABLES = tuple(table.strip() for table in _tables.split(",") if table.strip())
+    TABLE_TTL = float(os.getenv("CACHE_TABLE_TTL", config.getfloat("cache", "table_ttl", fallback=300.0)))
+
+class LogConfigLoader:
+    """Load log file format, rotation and buffering settings from `config.ini` and environment variables."""
+    FORMAT = os.getenv("LOG_FORMAT", config.get("logging", "format", fallback="text"))
+    ROTATE_WHEN = os.getenv("LOG_ROTATE_WHEN", config.get("logging", "rotate_when", fallback="size"))
+    MAX_BYTES = int(os.getenv("LOG_MAX_BYTES", config.getint("logging", "max_bytes", fallback=10485760)))
+    BACKUP_COUNT = int(os.getenv("LOG_BACKUP_COUNT", config.getint("logging", "backup_count", fallback=5)))
+    QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", config.getint("logging", "queue_size", fallback=10000)))
+    LEVEL = _one_of(
+        "[logging] level",
+        os.getenv("LOG_LEVEL", config.get("logging", "level", fallback="info")).lower(),
+        ("debug", "info", "warning", "error"),
+    )
+    _sample_rates = os.getenv("LOG_SAMPLE_RATES", config.get("logging", "sample_rates", fallback=""))
+    SAMPLE_RATES = {
+        site.strip(): float(rate)
+        for site, rate in (entry.split(":") for entry in _sample_rates.split(",") if entry.strip())
+    }
+
+class MetricsConfigLoader:
+    """Load the metrics endpoint settings from `config.ini` and environment variables."""
+    ENABLED = os.getenv(
+        "METRICS_ENABLED", str(config.getboolean("metrics", "enabled", fallback=True))
+    ).lower() in ("1", "true", "yes")
+    HOST = os.getenv("METRICS_HOST", config.get("metrics", "host", fallback="127.0.0.1"))
+    PORT = int(os.getenv("METRICS_PORT", config.getint("metrics", "port", fallback=9464)))
+
+class WatchdogConfigLoader:
+    """Load event-loop watchdog settings from `config.ini` and environment variables."""
+    INTERVAL = float(os.getenv("WATCHDOG_INTERVAL", config.getfloat("watchdog", "interval", fallback=0.1)))
+    THRESHOLD = float(os.getenv("WATCHDOG_THRESHOLD", config.getfloat("watchdog", "threshold", fallback=0.25)))
+    MAX_STALLS = int(os.getenv("WATCHDOG_MAX_STALLS", config.getint("watchdog", "max_stalls", fallback=50)))
+
+class ProfilingConfigLoader:
+    """Load on-demand command profiling settings from `config.ini` and environment variables."""
+    MAX_RESULTS = int(os.getenv("PROFILING_MAX_RESULTS", config.getint("profiling", "max_results", fallback=10)))
+    SAMPLE_INTERVAL = float(
+        os.getenv("PROFILING_SAMPLE_INTERVAL", config.getfloat("profiling", "sample_interval", fallback=0.005))
+    )
+    TOP_FUNCTIONS = int(os.getenv("PROFILING_TOP_FUNCTIONS", config.getint("profiling", "top_functions", fallback=30)))
+
+class RetentionConfigLoader:
+    """Load message retention, archival and capped collection settings from `config.ini` and environment variables."""
+    _collections = os.getenv("RETENTION_COLLECTIONS", config.get("retention", "collections", fallback=""))
+    # Table name mapped to (retention days, archive before deleting).
+    COLLECTIONS = {
+        table.strip(): (float(rule.split()[0]), "archive" in rule.split()[1:])
+        for table, rule in (entry.split(":") for entry in _collections.split(",") if entry.strip())
+    }
+    INTERVAL = float(os.getenv("RETENTION_INTERVAL", config.getfloat("retention", "interval", fallback=3600.0)))
+    BATCH_SIZE = int(os.getenv("RETENTION_BATCH_SIZE", config.getint("retention", "batch_size", fallback=1000)))
+    ARCHIVE_DIR = Path(os.getenv("RETENTION_ARCHIVE_DIR", config.get("retention", "archive_dir", fallback="archive")))
+    if not ARCHIVE_DIR.is_absolute():
+        ARCHIVE_DIR = project_root / ARCHIVE_DIR
+    _capped = os.getenv("RETENTION_CAPPED", config.get("retention", "capped", fallback=""))
+    CAPPED = {
+        table.strip(): int(size) for table, size in (entry.split(":") for entry in _capped.split(",") if entry.strip())
+    }
+
 class SettingsConfigLoader:
     """Load runtime settings from `config.ini` and environment variables."""
     DEV_MODE = os.getenv("DEV_MODE", config.getboolean("settings", "dev_mode", fallback=True))
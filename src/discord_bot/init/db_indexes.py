@@ -0,0 +1,165 @@
+"""Declare the indexes of both databases, apply them at startup and report missing or unused ones.
+
+Run from the project root to print the report, or to apply the declared indexes first:
+
+    python -m discord_bot.init.db_indexes [report|apply]
+"""
+
+import argparse
+from dataclasses import dataclass
+
+from discord_bot.adapters.db import DBMS
+from discord_bot.contracts.ports import DatabasePort
+from discord_bot.init.config_loader import DBConfigLoader, RetentionConfigLoader, TranslatorConfigLoader
+
+@dataclass(frozen=True)
+class IndexSpec:
+    """Fields of one index with their direction, whether its values must be unique, and the TTL of a TTL index."""
+    keys: tuple[tuple[str, int], ...]
+    unique: bool = False
+    expire_after_seconds: int | None = None
+
+    @property
+    def name(self) -> str:
+        """MongoDB's default name for these keys, e.g. ``guild_id_1_timestamp_-1``."""
+        return "_".join(f"{field}_{direction}" for field, direction in self.keys)
+
+# Unique where the code looks a row up before inserting it, so a race cannot create a second row.
+DISCORD_INDEXES: dict[str, list[IndexSpec]] = {
+    "messages": [IndexSpec((("guild_id", 1), ("timestamp", -1)))],
+    "direct_messages": [IndexSpec((("user_id", 1), ("timestamp", -1)))],
+    "commands": [IndexSpec((("command_name", 1),), unique=True)],
+    # Counters are upserted by date; the unique index turns concurrent upserts into one row.
+    "statistics": [IndexSpec((("date", 1),), unique=True)],
+    "auto_translate": [IndexSpec((("target_user_id", 1), ("subscriber_user_id", 1)), unique=True)],
+    "users": [IndexSpec((("user_id", 1),), unique=True)],
+    "broadcast_jobs": [IndexSpec((("job_id", 1),), unique=True), IndexSpec((("status", 1),))],
+}
+
+# Persisted translations expire with the cache TTL; a TTL of 0 keeps them forever.
+if TranslatorConfigLoader.CACHE_TTL > 0:
+    DISCORD_INDEXES["translation_cache"] = [
+        IndexSpec((("created_at", 1),), expire_after_seconds=int(TranslatorConfigLoader.CACHE_TTL))
+    ]
+
+def retention_indexes(collections: dict[str, tuple[float, bool]], capped: dict[str, int]) -> dict[str, list[IndexSpec]]:
+    """Index the ``created_at`` field of every table with a retention period.
+
+    Tables the archival job cleans up get a plain index for its range scans; the others get a TTL
+    index, so MongoDB deletes their expired rows itself. Capped tables limit their size instead.
+
+    Args:
+        collections (dict[str, tuple[float, bool]]): Retention days and whether to archive, per table.
+        capped (dict[str, int]): Size in bytes per capped table.
+
+    Returns:
+        dict[str, list[IndexSpec]]: The ``created_at`` index per table.
+    """
+    return {
+        table: [IndexSpec((("created_at", 1),), expire_after_seconds=None if archive else int(days * 86400))]
+        for table, (days, archive) in collections.items()
+        if days > 0 and table not in capped
+    }
+
+for _table, _specs in retention_indexes(RetentionConfigLoader.COLLECTIONS, RetentionConfigLoader.CAPPED).items():
+    DISCORD_INDEXES.setdefault(_table, []).extend(_specs)
+
+CV_INDEXES: dict[str, list[IndexSpec]] = {
+    "dishes": [IndexSpec((("id", 1),), unique=True), IndexSpec((("category", 1),))],
+    "fun_facts": [IndexSpec((("id", 1),), unique=True)],
+}
+
+class IndexManager:
+    """Apply declared index specs to the tables of one database and compare them with what exists."""
+    def __init__(self, dbms: DatabasePort, specs: dict[str, list[IndexSpec]]) -> None:
+        self.dbms = dbms
+        self.specs = specs
+
+    def apply(self, table_name: str | None = None) -> dict[str, dict[str, list[str]]]:
+        """Create the declared indexes that are missing; existing indexes are left untouched.
+
+        An index whose keys exist with a different ``unique`` or TTL option is reported as a conflict
+        instead of being dropped, and a unique index that existing duplicates prevent is reported as
+        failed, so startup never loses data or stops on an index.
+
+        Args:
+            table_name (str | None): Only apply the specs of this table; all tables if omitted.
+
+        Returns:
+            dict[str, dict[str, list[str]]]: ``created``, ``existing``, ``conflicts`` and ``failed``
+                index names (failures with their error) per table.
+        """
+        tables = [table_name] if table_name else list(self.specs)
+        results: dict[str, dict[str, list[str]]] = {}
+        for table in tables:
+            result: dict[str, list[str]] = {"created": [], "existing": [], "conflicts": [], "failed": []}
+            results[table] = result
+            try:
+                existing = {tuple(index["keys"]): index for index in self.dbms.get_indexes(table)}
+            except Exception as error:
+                result["failed"].append(f"{table}: {error}")
+                continue
+            for spec in self.specs.get(table, []):
+                index = existing.get(spec.keys)
+                if index is None:
+                    try:
+                        self.dbms.create_index(
+                            table, list(spec.keys), unique=spec.unique, expire_after_seconds=spec.expire_after_seconds
+                        )
+                        result["created"].append(spec.name)
+                    except Exception as error:
+                        result["failed"].append(f"{spec.name}: {error}")
+                elif index["unique"] != spec.unique:
+                    result["conflicts"].append(
+                        f"{index['name']} (unique={index['unique']}, declared unique={spec.unique})"
+                    )
+                elif index.get("expire_after_seconds") != spec.expire_after_seconds:
+                    # A changed retention period can be applied in place with collMod instead of a rebuild.
+                    result["conflicts"].append(
+                        f"{index['name']} (expire_after_seconds={index.get('expire_after_seconds')}, "
+                        f"declared {spec.expire_after_seconds})"
+                    )
+                else:
+                    result["existing"].append(spec.name)
+        return results
+
+    def report(self) -> dict[str, dict[str, list[str]]]:
+        """Compare the declared indexes of every table with the indexes in the database.
+
+        Returns:
+            dict[str, dict[str, list[str]]]: Per table ``missing`` (declared, not present),
+                ``unused`` (present, not used by any query since the server started) and
+                ``undeclared`` (present, not declared) index names. The ``_id_`` index is ignored.
+        """
+        report: dict[str, dict[str, list[str]]] = {}
+        for table, specs in self.specs.items():
+            indexes = [index for index in self.dbms.get_indexes(table) if index["name"] != "_id_"]
+            present = {tuple(index["keys"]) for index in indexes}
+            declared = {spec.keys for spec in specs}
+            report[table] = {
+                "missing": [spec.name for spec in specs if spec.keys not in present],
+                "unused": [index["name"] for index in indexes if index["ops"] == 0],
+                "undeclared": [index["name"] for index in indexes if tuple(index["keys"]) not in declared],
+            }
+        return report
+
+def _print_results(title: str, results: dict[str, dict[str, list[str]]]) -> None:
+    print(title)
+    for table, result in results.items():
+        details = ", ".join(f'{key}: {", ".join(names)}' for key, names in result.items() if names)
+        print(f'  {table}: {details or "ok"}')
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Apply the declared MongoDB indexes or report missing and unused ones."
+    )
+    parser.add_argument("command", nargs="?", choices=["report", "apply"], default="report")
+    args = parser.parse_args()
+
+    for db_name, specs in ((DBConfigLoader.DISCORD_DB_NAME, DISCORD_INDEXES), (DBConfigLoader.CV_DB_NAME, CV_INDEXES)):
+        dbms = DBMS(db_name=db_name)
+        dbms.connect()
+        manager = IndexManager(dbms, specs)
+        if args.command == "apply":
+            _print_results(f'Applied indexes of "{db_name}"', manager.apply())
+        _print_results(f'Index report of "{db_name}" (unused = no queries since the server started)', manager.report())
@@ -5,7 +5,8 @@ from pathlib import Path
 from datetime import datetime
 
 from discord_bot.adapters.db import DBMS
-from discord_bot.init.config_loader import DBConfigLoader
+from discord_bot.init.config_loader import DBConfigLoader, RetentionConfigLoader
+from discord_bot.init.db_indexes import CV_INDEXES, DISCORD_INDEXES, IndexManager
 
 class DBLoader:
     """Load initial data from CSV files into MongoDB-backed tables."""
@@ -13,6 +14,8 @@ class DBLoader:
         self.cv_dbms = DBMS(db_name=DBConfigLoader.CV_DB_NAME)
         self.discord_dbms = DBMS(db_name=DBConfigLoader.DISCORD_DB_NAME)
         self.db_data_path = Path(__file__).parent / "db_data"
+        self.cv_indexes = IndexManager(self.cv_dbms, CV_INDEXES)
+        self.discord_indexes = IndexManager(self.discord_dbms, DISCORD_INDEXES)
     
     def import_tables(self, force_reload: bool = False, specific_table: str | None = None) -> None:
         """Import constant-value tables from CSV files into the CV database.
@@ -60,6 +63,8 @@ class DBLoader:
 
             self.cv_dbms.upload_table(DBConfigLoader.CV_DB_NAME, table_name, data)
             print(f'Imported "{table_name}" - {len(data)} documents')
+            # Uploading drops the collection together with its indexes.
+            self._print_index_results(self.cv_indexes.apply(table_name))
     
         print("Constant values database initialization complete")
     
@@ -71,7 +76,14 @@ class DBLoader:
 
         for table_name in tables:
             existing_count = self.discord_dbms.get_table_size(table_name)
-            if existing_count == 0:
+            if existing_count == 0 and table_name in RetentionConfigLoader.CAPPED:
+                # A table can only be made capped when it is created.
+                size = RetentionConfigLoader.CAPPED[table_name]
+                if self.discord_dbms.create_table(table_name, capped_size=size):
+                    print(f'Initialized capped table "{table_name}" ({size} bytes)')
+                else:
+                    print(f'Table "{table_name}" already exists and is left as it is, not capped to {size} bytes')
+            elif existing_count == 0:
                 self.discord_dbms.insert_data(table_name, {"_init": True})
                 self.discord_dbms.delete_data(table_name, {"_init": True})
                 print(f'Initialized empty table "{table_name}"')
@@ -95,7 +107,23 @@ class DBLoader:
         
         print("Discord database initialization complete")
 
+    def apply_indexes(self) -> None:
+        """Create the declared indexes of both databases that do not exist yet."""
+        self.cv_dbms.connect()
+        self.discord_dbms.connect()
+        self._print_index_results(self.cv_indexes.apply())
+        self._print_index_results(self.discord_indexes.apply())
+
+    @staticmethod
+    def _print_index_results(results: dict[str, dict[str, list[str]]]) -> None:
+        for table_name, result in results.items():
+            if result["created"]:
+                print(f'Created indexes on "{table_name}": {", ".join(result["created"])}')
+            for problem in result["conflicts"] + result["failed"]:
+                print(f'Index problem on "{table_name}": {problem}')
+
 if __name__ == "__main__":
     loader = DBLoader()
     loader.import_tables()
     loader.initialize_discord_tables()
+    loader.apply_indexes()
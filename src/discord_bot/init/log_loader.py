@@ -1,13 +1,25 @@
-"""Provide utilities for locating and preparing log files for models."""
+"""Provide utilities for locating, preparing and writing log files for models."""
 
-from pathlib import Path
+import atexit
+import itertools
+import json
+import logging
+import os
+import queue
 import re
+import threading
+from datetime import datetime
+from logging.handlers import QueueListener, RotatingFileHandler, TimedRotatingFileHandler
+from pathlib import Path
+
+from discord_bot.init.config_loader import LogConfigLoader
 
 class LogLoader:
     """Utilities for locating and preparing log files for models."""
     def __init__(self):
         self.log_dir = Path(__file__).parent.parent / "logs"
         self.business_logic_dir = Path(__file__).parent.parent / "business_logic"
+        self._paths: dict[tuple[str, bool], Path] = {}
     
     def setup_log_files(self) -> None:
         """Create empty log files for each business-logic module if missing."""
@@ -36,13 +48,225 @@ class LogLoader:
         Returns:
             Path: Fully-qualified path to the log file.
         """
+        path = self._paths.get((name, treat_as_filename))
+        if path is not None:
+            return path
+
         if treat_as_filename:
             filename = name if name.endswith(".log") else f'{name}.log'
-            return self.log_dir / filename
+        else:
+            # Convert CamelCase class names to snake_case filenames for log files.
+            filename = f'{re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()}.log'
+        path = self._paths[(name, treat_as_filename)] = self.log_dir / filename
+        return path
+
+class JsonLineFormatter(logging.Formatter):
+    """Format a record as one JSON object per line."""
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        entry.update(getattr(record, "fields", None) or {})
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+class _DeferredFlush:
+    """Skip the flush after every record; `LogWriter` flushes once its queue is drained."""
+    def flush(self) -> None:
+        pass
+
+    def flush_buffer(self) -> None:
+        super().flush()  # type: ignore[misc]
+
+class BufferedRotatingFileHandler(_DeferredFlush, RotatingFileHandler):
+    """`RotatingFileHandler` that tracks the file size in memory.
+
+    The standard handler formats every record twice and stats, seeks and flushes the file for each
+    line; here the size is counted in characters, which is exact for ASCII log lines.
+    """
+    def __init__(self, filename: Path, max_bytes: int, backup_count: int) -> None:
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+        self._size = os.path.getsize(filename)
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        """Emit without the handler lock: only the listener thread writes, and `flush` waits for it,
+        so holding the lock there (as `logging.shutdown` does) must not block the listener."""
+        self.emit(record)
+        return True
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            line = f"{self.format(record)}\n"
+            if self.maxBytes and self._size and self._size + len(line) >= self.maxBytes:
+                self.doRollover()
+                self._size = 0
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(line)
+            self._size += len(line)
+        except Exception:
+            self.handleError(record)
+
+class BufferedTimedRotatingFileHandler(_DeferredFlush, TimedRotatingFileHandler):
+    """`TimedRotatingFileHandler` without a flush after every record."""
+
+class LogWriter(logging.Handler):
+    """Write log lines from any thread to log files that one background thread keeps open.
+
+    `write` only puts a record on a bounded queue; a `QueueListener` thread hands it to this
+    handler, which formats it, opens the file on first use and rotates it by size or time. Lines
+    are dropped and counted in `dropped` while the queue is full, so logging never blocks the event loop.
+    """
+    def __init__(
+        self,
+        log_format: str | None = None,
+        rotate_when: str | None = None,
+        max_bytes: int | None = None,
+        backup_count: int | None = None,
+        queue_size: int | None = None,
+    ) -> None:
+        super().__init__()
+        self.log_format = log_format or LogConfigLoader.FORMAT
+        self.rotate_when = rotate_when or LogConfigLoader.ROTATE_WHEN
+        self.max_bytes = LogConfigLoader.MAX_BYTES if max_bytes is None else max_bytes
+        self.backup_count = LogConfigLoader.BACKUP_COUNT if backup_count is None else backup_count
+        self.queue: queue.Queue = queue.Queue(maxsize=LogConfigLoader.QUEUE_SIZE if queue_size is None else queue_size)
+        self.dropped = 0
+        self._handlers: dict[Path, logging.Handler] = {}
+        self._unflushed: set = set()
+        self._listener: QueueListener | None = None
+        self._lock = threading.Lock()
+        self._atexit_registered = False
+
+    def write(self, log_file: Path, message: str, **fields) -> None:
+        """Queue one log line for ``log_file``.
+
+        Args:
+            log_file (Path): Target log file; created with its directory on first use.
+            message (str): Log message.
+            **fields: Extra keys written to JSON lines; ignored by the text format.
+        """
+        if self._listener is None:
+            self._start()
+        levelno = LogFilter.LEVELS.get(str(fields.get("level", "info")), logging.INFO)
+        record = logging.makeLogRecord({
+            "name": log_file.stem, "msg": message, "levelno": levelno, "levelname": logging.getLevelName(levelno),
+            "log_file": log_file, "fields": fields,
+        })
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self) -> None:
+        """Block until every queued line is written to its file."""
+        if self._listener is None:
+            return
+        self.queue.join()
+
+    def close(self) -> None:
+        """Write the queued lines, stop the writer thread and close all files; `write` restarts it."""
+        with self._lock:
+            if self._listener is None:
+                return
+            self._listener.stop()
+            self._listener = None
+            for handler in self._handlers.values():
+                handler.close()
+            self._handlers.clear()
+        super().close()
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._listener is not None:
+                return
+            self._listener = QueueListener(self.queue, self)
+            self._listener.start()
+            if not self._atexit_registered:
+                atexit.register(self.close)
+                self._atexit_registered = True
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        """Emit without the handler lock: only the listener thread writes, and `flush` waits for it,
+        so holding the lock there (as `logging.shutdown` does) must not block the listener."""
+        self.emit(record)
+        return True
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write a record on the listener thread (called through `handle` by `QueueListener`)."""
+        try:
+            # Set by `write` through makeLogRecord, so it is not a declared LogRecord attribute.
+            log_file: Path = getattr(record, "log_file")
+            handler = self._handlers.get(log_file)
+            if handler is None:
+                handler = self._handlers[log_file] = self._open(log_file)
+            handler.handle(record)
+            self._unflushed.add(handler)
+            # Batch writes while lines keep coming; flush as soon as the writer has caught up.
+            if self.queue.empty():
+                for unflushed in self._unflushed:
+                    unflushed.flush_buffer()
+                self._unflushed.clear()
+        except Exception as error:
+            # An exception would end the listener thread and with it all logging.
+            print(f"Logging failed: {error}")
+
+    def _open(self, log_file: Path) -> logging.Handler:
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        if self.rotate_when == "size":
+            handler: logging.Handler = BufferedRotatingFileHandler(log_file, self.max_bytes, self.backup_count)
+        else:
+            handler = BufferedTimedRotatingFileHandler(
+                log_file, when=self.rotate_when, backupCount=self.backup_count, encoding="utf-8"
+            )
+        if self.log_format == "json":
+            handler.setFormatter(JsonLineFormatter())
+        else:
+            handler.setFormatter(
+                logging.Formatter("[%(asctime)s] %(levelname)s %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
+            )
+        return handler
+
+class LogFilter:
+    """Decide before any formatting whether a log call is written.
+
+    Calls below `level` are dropped. A call that names a sampling site is written once every
+    ``round(1 / rate)`` calls of that site; warnings and errors are always written.
+    """
+    LEVELS = {"debug": logging.DEBUG, "info": logging.INFO, "warning": logging.WARNING, "error": logging.ERROR}
+
+    def __init__(self, level: str | None = None, sample_rates: dict[str, float] | None = None) -> None:
+        self.level = self.LEVELS[level or LogConfigLoader.LEVEL]
+        self.intervals: dict[str, int] = {}
+        self._counters: dict[str, itertools.count] = {}
+        self.suppressed = 0
+        for site, rate in (LogConfigLoader.SAMPLE_RATES if sample_rates is None else sample_rates).items():
+            self.set_sample_rate(site, rate)
+
+    def set_sample_rate(self, site: str, rate: float) -> None:
+        """Write a share of ``rate`` (0 to 1) of the calls of ``site``; 0 silences the site."""
+        self.intervals[site] = round(1 / rate) if rate > 0 else 0
+        self._counters[site] = itertools.count()
+
+    def enabled(self, level: str, sample: str | None = None) -> bool:
+        """Return True if a call with this level and sampling site should be written; unknown levels count as info."""
+        number = self.LEVELS.get(level, logging.INFO)
+        if number < self.level:
+            self.suppressed += 1
+            return False
+        if sample is None or number >= logging.WARNING:
+            return True
+        interval = self.intervals.get(sample, 1)
+        # next() on itertools.count is atomic, so concurrent callers never share a slot.
+        if interval == 1 or (interval and next(self._counters[sample]) % interval == 0):
+            return True
+        self.suppressed += 1
+        return False
 
-        # Convert CamelCase class names to snake_case filenames for log files.
-        filename = re.sub(r'(?<!^)(?=[A-Z])', '_', name).lower()
-        return self.log_dir / f'{filename}.log'
+# Shared by all models so every log file is opened once per process.
+LOG_WRITER = LogWriter()
+LOG_FILTER = LogFilter()
 
 if __name__ == "__main__":
     log_loader = LogLoader()
@@ -0,0 +1,256 @@
+"""In-process metrics registry and a Prometheus text exposition endpoint."""
+
+import bisect
+import threading
+from abc import ABC, abstractmethod
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from discord_bot.init.config_loader import MetricsConfigLoader
+
+# Seconds; covers sub-millisecond cache hits up to slow translation backends.
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+def _escape(value: object) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+class Metric(ABC):
+    """Base class of a named metric with a fixed set of label names."""
+    TYPE = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _labels(self, values: tuple, extra: str = "") -> str:
+        pairs = [f'{name}="{_escape(value)}"' for name, value in zip(self.labelnames, values)]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    @abstractmethod
+    def samples(self) -> list[str]:
+        """Return the sample lines of this metric."""
+        ...
+
+    def render(self) -> list[str]:
+        """Return the HELP, TYPE and sample lines of this metric."""
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.TYPE}", *self.samples()]
+
+class Counter(Metric):
+    """Monotonically increasing value per label combination."""
+    TYPE = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        """Add ``amount`` to the series identified by the label values."""
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            values = list(self._values.items())
+        return [f"{self.name}{self._labels(labels)} {_number(value)}" for labels, value in values]
+
+class Gauge(Metric):
+    """Value that goes up and down; either set directly or read from ``function`` on every scrape."""
+    TYPE = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        function: Callable[[], float] | None = None,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.function = function
+        self._values: dict[tuple, float] = {}
+
+    def set(self, value: float, *labels: str) -> None:
+        with self._lock:
+            self._values[labels] = value
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+    def samples(self) -> list[str]:
+        if self.function is not None:
+            try:
+                return [f"{self.name} {_number(self.function())}"]
+            except Exception:
+                return []
+        with self._lock:
+            values = list(self._values.items())
+        return [f"{self.name}{self._labels(labels)} {_number(value)}" for labels, value in values]
+
+class _HistogramSeries:
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self, size: int) -> None:
+        self.counts = [0] * size
+        self.total = 0.0
+        self.count = 0
+
+class Histogram(Metric):
+    """Distribution of observed values in cumulative buckets, plus their sum and count."""
+    TYPE = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series: dict[tuple, _HistogramSeries] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        """Record one value for the series identified by the label values."""
+        # Per-bucket counts are kept non-cumulative so an observation touches a single slot.
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = _HistogramSeries(len(self.buckets) + 1)
+            series.counts[index] += 1
+            series.total += value
+            series.count += 1
+
+    @contextmanager
+    def time(self, *labels: str) -> Iterator[None]:
+        """Observe the duration of the ``with`` block in seconds."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, *labels)
+
+    def count(self, *labels: str) -> int:
+        series = self._series.get(labels)
+        return series.count if series else 0
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            series_list = [
+                (labels, list(series.counts), series.total, series.count) for labels, series in self._series.items()
+            ]
+        lines: list[str] = []
+        for labels, counts, total, count in series_list:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                bucket_labels = self._labels(labels, 'le="' + _number(bound) + '"')
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            bucket_labels = self._labels(labels, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{bucket_labels} {count}")
+            lines.append(f"{self.name}_sum{self._labels(labels)} {_number(total)}")
+            lines.append(f"{self.name}_count{self._labels(labels)} {count}")
+        return lines
+
+class MetricsRegistry:
+    """Named metrics of the process; asking for an existing name returns the registered metric."""
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, metric_type: type, name: str, factory: Callable[[], Metric]) -> Metric:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = factory()
+            elif not isinstance(metric, metric_type):
+                raise ValueError(f"Metric {name} is already registered as {metric.TYPE}")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        counter = self._get_or_create(Counter, name, lambda: Counter(name, documentation, labelnames))
+        return counter  # type: ignore[return-value]
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        function: Callable[[], float] | None = None,
+    ) -> Gauge:
+        gauge = self._get_or_create(Gauge, name, lambda: Gauge(name, documentation, labelnames, function))
+        if function is not None:
+            # The latest owner (e.g. a recreated Translator) reports the value.
+            gauge.function = function  # type: ignore[attr-defined]
+        return gauge  # type: ignore[return-value]
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        histogram = self._get_or_create(Histogram, name, lambda: Histogram(name, documentation, labelnames, buckets))
+        return histogram  # type: ignore[return-value]
+
+    def render(self) -> str:
+        """Return all metrics in the Prometheus text exposition format (version 0.0.4)."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "\n".join(line for metric in metrics for line in metric.render()) + "\n"
+
+class MetricsServer:
+    """Serve `MetricsRegistry.render()` at ``/metrics`` from a background HTTP server thread."""
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(
+        self, registry: MetricsRegistry | None = None, host: str | None = None, port: int | None = None
+    ) -> None:
+        self.registry = registry or METRICS
+        self.host = host or MetricsConfigLoader.HOST
+        self.port = MetricsConfigLoader.PORT if port is None else port
+        self.server: ThreadingHTTPServer | None = None
+
+    def start(self) -> None:
+        registry = self.registry
+        content_type = self.CONTENT_TYPE
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        self.server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self.port = self.server.server_address[1]
+        threading.Thread(target=self.server.serve_forever, name="metrics-server", daemon=True).start()
+
+    def stop(self) -> None:
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+# Shared by all modules of the process and rendered by `MetricsServer`.
+METRICS = MetricsRegistry()
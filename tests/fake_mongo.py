@@ -0,0 +1,248 @@
+"""In-memory stand-in for the small subset of PyMongo used by `DBMS` (tests and benchmarks)."""
+
+import copy
+import threading
+import time
+from dataclasses import dataclass
+from itertools import count
+
+from pymongo.errors import DuplicateKeyError
+
+
+@dataclass
+class FakeResult:
+    """Mimic the acknowledged write results returned by PyMongo."""
+    acknowledged: bool = True
+    inserted_count: int = 0
+    modified_count: int = 0
+    deleted_count: int = 0
+
+
+_OPERATORS = {
+    "$lt": lambda value, operand: value is not None and value < operand,
+    "$lte": lambda value, operand: value is not None and value <= operand,
+    "$gt": lambda value, operand: value is not None and value > operand,
+    "$gte": lambda value, operand: value is not None and value >= operand,
+    "$in": lambda value, operand: value in operand,
+    "$exists": lambda value, operand: (value is not None) == operand,
+}
+
+
+def _matches(document: dict, query: dict) -> bool:
+    """Return True if ``document`` satisfies an equality / comparison / ``$in`` / ``$exists`` / ``$or`` query."""
+    for key, expected in query.items():
+        if key == "$or":
+            if not any(_matches(document, sub_query) for sub_query in expected):
+                return False
+        elif isinstance(expected, dict) and expected and all(operator in _OPERATORS for operator in expected):
+            if not all(_OPERATORS[operator](document.get(key), operand) for operator, operand in expected.items()):
+                return False
+        elif document.get(key) != expected:
+            return False
+    return True
+
+
+def _apply_update(document: dict, update: dict) -> None:
+    """Apply ``$set`` and ``$inc`` operators (with dotted paths) to ``document`` in place."""
+    for operator, fields in update.items():
+        for path, value in fields.items():
+            *parents, leaf = path.split(".")
+            target = document
+            for parent in parents:
+                target = target.setdefault(parent, {})
+            if operator == "$set":
+                target[leaf] = copy.deepcopy(value)
+            elif operator == "$inc":
+                target[leaf] = target.get(leaf, 0) + value
+            else:
+                raise NotImplementedError(operator)
+
+
+class FakeCollection:
+    """Thread-safe in-memory collection with an optional artificial latency per operation."""
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency = latency
+        self.documents: list[dict] = []
+        self.calls = 0
+        self.indexes: dict[str, dict] = {"_id_": {"key": [("_id", 1)], "v": 2}}
+        # Accesses per index name as reported by $indexStats; tests set them to simulate queries.
+        self.index_ops: dict[str, int] = {}
+        self._ids = count(1)
+        self._lock = threading.Lock()
+
+    def _round_trip(self) -> None:
+        """Simulate the network round trip of a real MongoDB call."""
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def find(self, query: dict | None = None, sort: list[tuple[str, int]] | None = None, limit: int = 0) -> list[dict]:
+        self._round_trip()
+        with self._lock:
+            documents = [copy.deepcopy(document) for document in self.documents if _matches(document, query or {})]
+        for field, direction in reversed(sort or []):
+            documents.sort(key=lambda document: document.get(field), reverse=direction < 0)
+        return documents[:limit] if limit else documents
+
+    def count_documents(self, query: dict) -> int:
+        self._round_trip()
+        with self._lock:
+            return sum(1 for document in self.documents if _matches(document, query))
+
+    def distinct(self, field: str) -> list:
+        self._round_trip()
+        with self._lock:
+            return list({document.get(field) for document in self.documents})
+
+    def _unique_keys(self) -> list[list[str]]:
+        return [
+            [field for field, _ in index["key"]]
+            for name, index in self.indexes.items()
+            if name == "_id_" or index.get("unique")
+        ]
+
+    def _check_unique(self, document: dict) -> None:
+        for fields in self._unique_keys():
+            values = [document.get(field) for field in fields]
+            if any([existing.get(field) for field in fields] == values for existing in self.documents):
+                raise DuplicateKeyError(f"E11000 duplicate key error: {dict(zip(fields, values))!r}")
+
+    def insert_one(self, document: dict) -> FakeResult:
+        self._round_trip()
+        with self._lock:
+            document.setdefault("_id", next(self._ids))
+            self._check_unique(document)
+            self.documents.append(copy.deepcopy(document))
+        return FakeResult(inserted_count=1)
+
+    def insert_many(self, documents: list[dict], ordered: bool = True) -> FakeResult:
+        self._round_trip()
+        with self._lock:
+            for document in documents:
+                document.setdefault("_id", next(self._ids))
+                self._check_unique(document)
+                self.documents.append(copy.deepcopy(document))
+        return FakeResult(inserted_count=len(documents))
+
+    def update_one(self, query: dict, update: dict, upsert: bool = False) -> FakeResult:
+        self._round_trip()
+        with self._lock:
+            return FakeResult(modified_count=self._update_one(query, update, upsert))
+
+    def _update_one(self, query: dict, update: dict, upsert: bool) -> int:
+        for document in self.documents:
+            if _matches(document, query):
+                _apply_update(document, update)
+                return 1
+        if upsert:
+            document = {"_id": next(self._ids), **copy.deepcopy(query)}
+            _apply_update(document, update)
+            self.documents.append(document)
+        return 0
+
+    def bulk_write(self, requests: list, ordered: bool = True) -> FakeResult:
+        """Apply PyMongo ``UpdateOne`` requests in one simulated round trip."""
+        self._round_trip()
+        modified = 0
+        with self._lock:
+            for request in requests:
+                modified += self._update_one(request._filter, request._doc, request._upsert)
+        return FakeResult(modified_count=modified)
+
+    def update_many(self, query: dict, update: dict) -> FakeResult:
+        self._round_trip()
+        modified = 0
+        with self._lock:
+            for document in self.documents:
+                if _matches(document, query):
+                    _apply_update(document, update)
+                    modified += 1
+        return FakeResult(modified_count=modified)
+
+    def delete_many(self, query: dict) -> FakeResult:
+        self._round_trip()
+        with self._lock:
+            kept = [document for document in self.documents if not _matches(document, query)]
+            deleted = len(self.documents) - len(kept)
+            self.documents = kept
+        return FakeResult(deleted_count=deleted)
+
+    def create_index(
+        self, keys: list[tuple[str, int]], unique: bool = False, expireAfterSeconds: int | None = None
+    ) -> str:
+        self._round_trip()
+        name = "_".join(f"{field}_{direction}" for field, direction in keys)
+        with self._lock:
+            if name in self.indexes:
+                return name
+            if unique:
+                seen = set()
+                for document in self.documents:
+                    values = tuple(repr(document.get(field)) for field, _ in keys)
+                    if values in seen:
+                        raise DuplicateKeyError(f"E11000 duplicate key error building index {name}")
+                    seen.add(values)
+            self.indexes[name] = {"key": list(keys), "v": 2, **({"unique": True} if unique else {})}
+            if expireAfterSeconds is not None:
+                self.indexes[name]["expireAfterSeconds"] = expireAfterSeconds
+        return name
+
+    def index_information(self) -> dict:
+        self._round_trip()
+        with self._lock:
+            return copy.deepcopy(self.indexes)
+
+    def aggregate(self, pipeline: list[dict]) -> list[dict]:
+        """Support only ``$indexStats``, which reports `index_ops` per index."""
+        if pipeline != [{"$indexStats": {}}]:
+            raise NotImplementedError(pipeline)
+        self._round_trip()
+        with self._lock:
+            return [{"name": name, "accesses": {"ops": self.index_ops.get(name, 0)}} for name in self.indexes]
+
+    def drop(self) -> None:
+        with self._lock:
+            self.documents = []
+            self.indexes = {"_id_": {"key": [("_id", 1)], "v": 2}}
+            self.index_ops = {}
+
+
+class FakeDatabase(dict):
+    """Dictionary of `FakeCollection` objects created on first access."""
+    def __init__(self, latency: float = 0.0) -> None:
+        super().__init__()
+        self.latency = latency
+        # Options passed to create_collection per table, e.g. {"capped": True, "size": 4096}.
+        self.collection_options: dict[str, dict] = {}
+
+    def list_collection_names(self) -> list[str]:
+        """Like MongoDB, list only collections that were created or written to, not merely read."""
+        return [
+            name for name, collection in self.items()
+            if collection.documents or len(collection.indexes) > 1 or name in self.collection_options
+        ]
+
+    def create_collection(self, table_name: str, **options) -> FakeCollection:
+        self.collection_options[table_name] = options
+        return self[table_name]
+
+    def __missing__(self, table_name: str) -> FakeCollection:
+        collection = FakeCollection(latency=self.latency)
+        self[table_name] = collection
+        return collection
+
+
+def connect_fake(dbms, latency: float = 0.0) -> FakeDatabase:
+    """Attach a `FakeDatabase` to a `DBMS` instance instead of a real MongoDB connection.
+
+    Args:
+        dbms: `DBMS` (or subclass) instance to wire up.
+        latency (float): Seconds each collection operation should take.
+
+    Returns:
+        FakeDatabase: The attached in-memory database.
+    """
+    database = FakeDatabase(latency=latency)
+    dbms.client = {dbms.db_name: database}
+    dbms.db = database
+    return database
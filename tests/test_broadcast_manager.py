@@ -0,0 +1,216 @@
+"""Unit tests for resumable broadcast jobs."""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import asyncio
+import unittest
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from discord_bot.adapters.db import DBMS
+from discord_bot.business_logic.broadcast_manager import BroadcastManager
+from tests.fake_mongo import connect_fake
+
+
+def make_channel(channel_id: int, name: str, can_send: bool = True) -> Mock:
+    channel = Mock(id=channel_id)
+    channel.name = name
+    channel.permissions_for.return_value = SimpleNamespace(send_messages=can_send)
+    return channel
+
+
+def make_guild(guild_id: int, name: str, channels: list[Mock]) -> Mock:
+    guild = Mock(id=guild_id, text_channels=channels)
+    guild.name = name
+    return guild
+
+
+class FakeBot:
+    """Records sends and fails the channels listed in ``failing`` a given number of times."""
+    def __init__(self, guilds: list | None = None, failing: dict[int, int] | None = None, delay: float = 0.0) -> None:
+        self.client = SimpleNamespace(guilds=guilds or [])
+        self.loop = None
+        self.failing = dict(failing or {})
+        self.delay = delay
+        self.sent: list[int] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def send_message_async(self, guild_id: int, channel_id: int, message: str) -> bool:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        if self.failing.get(channel_id, 0) > 0:
+            self.failing[channel_id] -= 1
+            return False
+        self.sent.append(channel_id)
+        return True
+
+
+def targets(count: int) -> list[dict]:
+    return [
+        {"guild_id": 1, "guild_name": "Guild", "channel_id": index, "channel_name": f"channel-{index}"}
+        for index in range(count)
+    ]
+
+
+class TestBroadcastManager(unittest.IsolatedAsyncioTestCase):
+    """Test channel selection, bounded delivery, retries, persistence and resuming of jobs."""
+
+    async def asyncSetUp(self):
+        """Set up test fixtures."""
+        self.dbms = DBMS(db_name="test")
+        self.database = connect_fake(self.dbms)
+        self.bot = FakeBot()
+        self.bot.loop = asyncio.get_running_loop()
+
+    def make_manager(self, **kwargs) -> BroadcastManager:
+        options = {"max_concurrency": 3, "rate": 1000, "max_retries": 2, "persist_every": 2}
+        options.update(kwargs)
+        manager = BroadcastManager(self.bot, self.dbms, **options)
+        manager.retry_delay = 0
+        return manager
+
+    async def wait_for_job(self, manager: BroadcastManager, job_id: str) -> dict:
+        for _ in range(200):
+            if job_id not in manager._tasks and manager.jobs[job_id]["status"] != "running":
+                break
+            await asyncio.sleep(0.01)
+        return self.dbms.get_data(BroadcastManager.TABLE_NAME, {"job_id": job_id})[0]
+
+    def test_select_channels_by_guild_and_pattern(self):
+        """Test only writable channels of the chosen guilds whose name matches are selected."""
+        # Arrange
+        self.bot.client.guilds = [
+            make_guild(
+                1,
+                "One",
+                [
+                    make_channel(10, "announcements"),
+                    make_channel(11, "general"),
+                    make_channel(12, "announce-de", can_send=False),
+                ],
+            ),
+            make_guild(2, "Two", [make_channel(20, "announce-en")]),
+        ]
+        manager = self.make_manager()
+
+        # Act
+        all_announce = manager.select_channels(None, "announce*")
+        first_guild = manager.select_channels([1], None)
+
+        # Assert
+        self.assertEqual([channel["channel_id"] for channel in all_announce], [10, 20])
+        self.assertEqual([channel["channel_id"] for channel in first_guild], [10, 11])
+        self.assertEqual(
+            all_announce[1], {"guild_id": 2, "guild_name": "Two", "channel_id": 20, "channel_name": "announce-en"}
+        )
+
+    async def test_job_sends_to_every_channel_with_bounded_concurrency(self):
+        """Test a job reaches all channels, never exceeds max_concurrency and is stored as completed."""
+        # Arrange
+        self.bot.delay = 0.01
+        manager = self.make_manager()
+
+        # Act
+        job_id = manager.create_job(targets(10), "Hello")
+        stored = await self.wait_for_job(manager, job_id)
+
+        # Assert
+        self.assertEqual(sorted(self.bot.sent), list(range(10)))
+        self.assertLessEqual(self.bot.max_in_flight, 3)
+        self.assertEqual(stored["status"], "completed")
+        self.assertEqual((stored["sent"], stored["failed"], stored["pending"]), (10, 0, 0))
+
+    async def test_failed_sends_are_retried_then_reported(self):
+        """Test a flaky channel is retried and a broken channel is failed after max_retries."""
+        # Arrange
+        self.bot.failing = {0: 1, 1: 100}
+        manager = self.make_manager(max_retries=2)
+
+        # Act
+        job_id = manager.create_job(targets(3), "Hello")
+        await self.wait_for_job(manager, job_id)
+        summary = manager.get_job(job_id)
+
+        # Assert
+        self.assertEqual((summary["sent"], summary["failed"]), (2, 1))
+        self.assertEqual(summary["retries"], 1 + 2)
+        self.assertEqual(summary["failed_channels"], ["Guild / #channel-1"])
+
+    async def test_resume_sends_only_pending_targets(self):
+        """Test a job stored as running continues after a restart without resending delivered channels."""
+        # Arrange
+        job_targets = [
+            {
+                **target,
+                "status": "sent" if target["channel_id"] < 2 else "pending",
+                "attempts": 1 if target["channel_id"] < 2 else 0,
+            }
+            for target in targets(5)
+        ]
+        self.dbms.insert_data(
+            BroadcastManager.TABLE_NAME,
+            {
+                "job_id": "job",
+                "message": "Hello",
+                "status": "running",
+                "created_at": "2024-01-01",
+                "targets": job_targets,
+            },
+        )
+        manager = self.make_manager()
+
+        # Act
+        resumed = await manager.resume_jobs()
+        stored = await self.wait_for_job(manager, "job")
+
+        # Assert
+        self.assertEqual(resumed, 1)
+        self.assertEqual(sorted(self.bot.sent), [2, 3, 4])
+        self.assertEqual((stored["status"], stored["sent"]), ("completed", 5))
+
+    async def test_stop_keeps_job_resumable_and_cancel_does_not(self):
+        """Test stop() stores progress of a running job while a cancelled job is not resumed."""
+        # Arrange
+        self.bot.delay = 0.05
+        manager = self.make_manager(max_concurrency=1)
+        job_id = manager.create_job(targets(10), "Hello")
+        await asyncio.sleep(0.12)
+
+        # Act
+        await manager.stop()
+        stored = self.dbms.get_data(BroadcastManager.TABLE_NAME, {"job_id": job_id})[0]
+        restarted = self.make_manager()
+        restarted.jobs[job_id] = {**stored, "status": "running"}
+        cancelled = restarted.cancel_job(job_id)
+
+        # Assert
+        self.assertEqual(stored["status"], "running")
+        self.assertGreater(stored["pending"], 0)
+        self.assertEqual(stored["sent"], len(self.bot.sent))
+        self.assertTrue(cancelled)
+        self.assertEqual(await self.make_manager().resume_jobs(), 0)
+
+    async def test_cancel_before_the_task_starts_sends_nothing(self):
+        """Test a job cancelled before its scheduled task ran is stored as cancelled without sending."""
+        # Arrange
+        manager = self.make_manager()
+        job_id = manager.create_job(targets(5), "Hello")
+
+        # Act
+        cancelled = manager.cancel_job(job_id)
+        await asyncio.sleep(0.05)  # Let the scheduled task run
+        stored = await self.wait_for_job(manager, job_id)
+
+        # Assert
+        self.assertTrue(cancelled)
+        self.assertEqual(self.bot.sent, [])
+        self.assertEqual((stored["status"], stored["pending"]), ("cancelled", 5))
+
+
+if __name__ == "__main__":
+    unittest.main()
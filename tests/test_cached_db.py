@@ -0,0 +1,128 @@
+"""Unit tests for the CachedDBMS read-through cache."""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import unittest
+from unittest.mock import Mock, patch
+
+from discord_bot.adapters.cached_db import CachedDBMS
+from discord_bot.business_logic.dish_selector import DishSelector
+
+DISHES = [
+    {"id": 1, "category": "Italian", "dish": "Pizza"},
+    {"id": 2, "category": "Italian", "dish": "Pasta"},
+    {"id": 3, "category": "Japanese", "dish": "Sushi"},
+]
+
+
+class TestCachedDBMS(unittest.TestCase):
+    """Test that constant tables are served from memory and invalidated on writes."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.mock_dbms = Mock()
+        self.mock_dbms.get_data.return_value = list(DISHES)
+        self.cache = CachedDBMS(self.mock_dbms, cached_tables=("dishes", "fun_facts"), ttl=0)
+
+    def test_random_entries_load_table_only_once(self):
+        """Test many random picks cause a single database read."""
+        # Act
+        results = [self.cache.get_random_entry("dishes", "Italian") for _ in range(100)]
+
+        # Assert
+        self.mock_dbms.get_data.assert_called_once_with("dishes", {})
+        self.mock_dbms.get_random_entry.assert_not_called()
+        self.assertTrue(all(result["category"] == "Italian" for result in results))
+        self.assertEqual(self.cache.misses, 1)
+        self.assertEqual(self.cache.hits, 99)
+
+    def test_random_entry_without_category_and_unknown_category(self):
+        """Test picks across the whole table and empty result for unknown categories."""
+        # Act & Assert
+        self.assertIn(self.cache.get_random_entry("dishes", None), DISHES)
+        self.assertEqual(self.cache.get_random_entry("dishes", "Mexican"), {})
+
+    def test_returned_entry_is_a_copy(self):
+        """Test callers cannot modify the cached rows."""
+        # Act
+        entry = self.cache.get_random_entry("dishes", "Japanese")
+        entry["dish"] = "Changed"
+
+        # Assert
+        self.assertEqual(self.cache.get_random_entry("dishes", "Japanese")["dish"], "Sushi")
+
+    def test_writes_invalidate_the_table(self):
+        """Test insert, delete and upload reload the table on the next read."""
+        # Arrange
+        self.cache.get_random_entry("dishes", None)
+
+        for write in (
+            lambda: self.cache.insert_data("dishes", {"id": 4, "category": "Italian", "dish": "Risotto"}),
+            lambda: self.cache.delete_data("dishes", {"id": 4}),
+            lambda: self.cache.upload_table("constant_values", "dishes", DISHES),
+        ):
+            with self.subTest(write=write):
+                calls_before = self.mock_dbms.get_data.call_count
+
+                # Act
+                write()
+                self.cache.get_random_entry("dishes", None)
+
+                # Assert
+                self.assertEqual(self.mock_dbms.get_data.call_count, calls_before + 1)
+
+    def test_invalidate_cache_after_external_reload(self):
+        """Test explicit invalidation, as used after a CSV reset through DBLoader."""
+        # Arrange
+        self.cache.get_table_size("dishes")
+        self.mock_dbms.get_data.return_value = DISHES[:1]
+
+        # Act
+        self.cache.invalidate_cache("dishes")
+
+        # Assert
+        self.assertEqual(self.cache.get_table_size("dishes"), 1)
+
+    def test_uncached_tables_are_delegated(self):
+        """Test tables outside cached_tables go straight to the wrapped port."""
+        # Arrange
+        self.mock_dbms.get_random_entry.return_value = {"user_id": 1}
+
+        # Act
+        result = self.cache.get_random_entry("users", None)
+
+        # Assert
+        self.assertEqual(result, {"user_id": 1})
+        self.mock_dbms.get_data.assert_not_called()
+
+    @patch("discord_bot.adapters.cached_db.time.monotonic")
+    def test_ttl_expiry_reloads_table(self, mock_monotonic):
+        """Test a cached table is reloaded after the TTL to pick up out-of-band edits."""
+        # Arrange
+        cache = CachedDBMS(self.mock_dbms, cached_tables=("dishes",), ttl=300)
+        mock_monotonic.return_value = 1000.0
+        cache.get_random_entry("dishes", None)
+
+        # Act
+        mock_monotonic.return_value = 1301.0
+        cache.get_random_entry("dishes", None)
+
+        # Assert
+        self.assertEqual(self.mock_dbms.get_data.call_count, 2)
+
+    def test_dish_selector_works_unchanged_behind_cache(self):
+        """Test DishSelector uses the cache through the plain DatabasePort interface."""
+        # Arrange
+        selector = DishSelector(dbms=self.cache)
+
+        # Act
+        result = selector.execute_function("Japanese")
+
+        # Assert
+        self.assertEqual(result, "Sushi")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+"""Unit tests for on-demand command profiling."""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import asyncio
+import pstats
+import tempfile
+import time
+import unittest
+from unittest.mock import AsyncMock, Mock
+
+from discord_bot.business_logic.command_profiler import CommandProfiler
+from discord_bot.business_logic.discord_logic import DiscordLogic
+
+
+def build_dish_list() -> list[str]:
+    return sorted(f"dish {index}" for index in range(2000))
+
+
+async def dish_command() -> str:
+    build_dish_list()
+    return "Pizza"
+
+
+async def slow_translate() -> str:
+    """Stand-in for a command that blocks the loop in a synchronous call."""
+    time.sleep(0.05)
+    return "Hallo"
+
+
+class TestCommandProfiler(unittest.IsolatedAsyncioTestCase):
+    """Test arming, both profilers, result storage and export."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.profiler = CommandProfiler(max_results=2, sample_interval=0.002, top_functions=10)
+        self.profiler.logging = Mock()
+
+    async def test_only_the_next_armed_invocations_are_profiled(self):
+        """Test an armed command is profiled for its remaining runs and other commands pass through."""
+        # Arrange
+        self.profiler.arm("dish", runs=2)
+
+        # Act
+        results = [await self.profiler.run("dish", dish_command()) for _ in range(3)]
+        await self.profiler.run("funfact", dish_command())
+
+        # Assert
+        self.assertEqual(results, ["Pizza"] * 3)
+        report = self.profiler.get_results()
+        self.assertEqual(report["armed"], {})
+        self.assertEqual(list(report["results"]), ["dish"])
+        self.assertEqual(len(report["results"]["dish"]), 2)
+        self.assertIn("build_dish_list", report["results"]["dish"][0]["summary"])
+
+    async def test_cprofile_export_is_readable_by_pstats(self):
+        """Test a cProfile result is written as a pstats file containing the command's calls."""
+        # Arrange
+        self.profiler.arm("dish")
+        await self.profiler.run("dish", dish_command())
+
+        # Act
+        with tempfile.TemporaryDirectory() as directory:
+            path = self.profiler.export("dish", directory=Path(directory))
+            functions = {name for _, _, name in pstats.Stats(str(path)).stats}
+
+        # Assert
+        self.assertEqual(path.suffix, ".prof")
+        self.assertIn("build_dish_list", functions)
+        self.assertIsNone(self.profiler.export("dish", index=5))
+        self.assertIsNone(self.profiler.export("funfact"))
+
+    async def test_sampling_profiler_records_blocking_frames(self):
+        """Test the sampling profiler captures the stack of a command blocking the loop."""
+        # Arrange
+        self.profiler.arm("Translate", mode="sampling")
+
+        # Act
+        result = await self.profiler.run("Translate", slow_translate())
+        with tempfile.TemporaryDirectory() as directory:
+            folded = self.profiler.export("Translate", directory=Path(directory)).read_text(encoding="utf-8")
+
+        # Assert
+        self.assertEqual(result, "Hallo")
+        self.assertIn("slow_translate", folded)
+        self.assertIn("slow_translate", self.profiler.get_results()["results"]["Translate"][0]["summary"])
+
+    async def test_overlapping_invocation_runs_unprofiled(self):
+        """Test only one invocation is profiled at a time and the other keeps its armed run."""
+        # Arrange
+        self.profiler.arm("dish", runs=2)
+
+        # Act
+        async def slow_dish() -> str:
+            await asyncio.sleep(0.02)
+            return "Pizza"
+        await asyncio.gather(self.profiler.run("dish", slow_dish()), self.profiler.run("dish", slow_dish()))
+
+        # Assert
+        self.assertEqual(len(self.profiler.get_results()["results"]["dish"]), 1)
+        self.assertEqual(self.profiler.armed["dish"]["runs"], 1)
+
+    async def test_discord_logic_profiles_registered_commands_only(self):
+        """Test the bot arms registered commands and profiles them in the command wrapper."""
+        # Arrange
+        bot = DiscordLogic(dbms=None)
+        bot.profiler = self.profiler
+        bot._update_command_usage = Mock()
+        bot.commands = {"dish": Mock(), "context_Translate": Mock()}
+
+        # Act
+        armed = bot.profile_command("dish")
+        unknown = bot.profile_command("missing")
+        invalid_mode = bot.profile_command("Translate", mode="perf")
+        await bot._run_command("dish", AsyncMock(return_value=None), Mock())
+        profiles = bot.get_command_profiles()
+
+        # Assert
+        self.assertEqual((armed, unknown, invalid_mode), (True, False, False))
+        self.assertEqual(profiles["commands"], ["Translate", "dish"])
+        self.assertEqual(len(profiles["results"]["dish"]), 1)
+        self.assertNotIn("data", profiles["results"]["dish"][0])
+
+    async def test_disarmed_command_is_no_longer_profiled(self):
+        """Test cancelling the profiling of an armed command, as the Disarm button does, skips its next runs."""
+        # Arrange
+        bot = DiscordLogic(dbms=None)
+        bot.profiler = self.profiler
+        bot._update_command_usage = Mock()
+        bot.commands = {"dish": Mock()}
+        bot.profile_command("dish", runs=3)
+
+        # Act
+        cancelled = bot.cancel_command_profiling("dish")
+        cancelled_again = bot.cancel_command_profiling("dish")
+        await bot._run_command("dish", AsyncMock(return_value=None), Mock())
+
+        # Assert
+        self.assertEqual((cancelled, cancelled_again), (True, False))
+        self.assertEqual(bot.get_command_profiles()["armed"], {})
+        self.assertEqual(bot.get_command_profiles()["results"], {})
+
+
+if __name__ == "__main__":
+    unittest.main()
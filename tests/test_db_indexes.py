@@ -0,0 +1,119 @@
+"""Unit tests for the declared indexes, their idempotent application and the index report."""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import unittest
+from unittest.mock import MagicMock, patch
+from pymongo.errors import OperationFailure
+
+from discord_bot.adapters.db import DBMS
+from discord_bot.init.db_indexes import CV_INDEXES, DISCORD_INDEXES, IndexManager, IndexSpec
+from discord_bot.init.db_loader import DBLoader
+from tests.fake_mongo import connect_fake
+
+
+class TestIndexManager(unittest.TestCase):
+    """Test applying index specs and reporting missing, unused and undeclared indexes."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.dbms = DBMS(db_name="test_db")
+        self.database = connect_fake(self.dbms)
+        self.manager = IndexManager(self.dbms, DISCORD_INDEXES)
+
+    def test_apply_creates_declared_indexes_once(self):
+        """Test a first apply creates every declared index and a second one only finds them."""
+        # Act
+        first = self.manager.apply()
+        second = self.manager.apply()
+
+        # Assert
+        self.assertEqual(first["commands"]["created"], ["command_name_1"])
+        self.assertIn("guild_id_1_timestamp_-1", first["messages"]["created"])
+        self.assertTrue(self.database["auto_translate"].indexes["target_user_id_1_subscriber_user_id_1"]["unique"])
+        self.assertTrue(all(not result["created"] and result["existing"] for result in second.values()))
+
+    def test_duplicates_and_conflicting_options_are_reported_not_fixed(self):
+        """Test existing duplicates fail the unique index and a differing index is left in place."""
+        # Arrange
+        self.dbms.insert_many("users", [{"user_id": 1}, {"user_id": 1}])
+        self.dbms.create_index("commands", [("command_name", 1)], unique=False)
+
+        # Act
+        results = self.manager.apply()
+
+        # Assert
+        self.assertEqual(results["users"]["created"], [])
+        self.assertIn("user_id_1", results["users"]["failed"][0])
+        self.assertEqual(len(results["commands"]["conflicts"]), 1)
+        self.assertNotIn("unique", self.database["commands"].indexes["command_name_1"])
+        self.assertEqual(results["statistics"]["created"], ["date_1"])
+
+    def test_report_lists_missing_unused_and_undeclared_indexes(self):
+        """Test the report compares the declared specs with the indexes and their usage."""
+        # Arrange
+        manager = IndexManager(self.dbms, {"dishes": CV_INDEXES["dishes"]})
+        self.dbms.create_index("dishes", [("id", 1)], unique=True)
+        self.dbms.create_index("dishes", [("dish", 1)])
+        self.database["dishes"].index_ops["id_1"] = 12
+
+        # Act
+        report = manager.report()
+
+        # Assert
+        self.assertEqual(report["dishes"], {"missing": ["category_1"], "unused": ["dish_1"], "undeclared": ["dish_1"]})
+
+    def test_index_spec_name_matches_mongodb_default(self):
+        """Test spec names follow MongoDB's <field>_<direction> naming."""
+        self.assertEqual(IndexSpec((("guild_id", 1), ("timestamp", -1))).name, "guild_id_1_timestamp_-1")
+
+
+class TestIndexAdapter(unittest.TestCase):
+    """Test the DBMS index methods against PyMongo's return values."""
+
+    def test_get_indexes_without_index_stats_privilege(self):
+        """Test index usage is None when $indexStats is not allowed and directions become ints."""
+        # Arrange
+        dbms = DBMS(db_name="test_db")
+        dbms.db = MagicMock()
+        collection = dbms.db.__getitem__.return_value
+        collection.aggregate.side_effect = OperationFailure("not authorized")
+        collection.index_information.return_value = {
+            "_id_": {"key": [("_id", 1)]},
+            "date_1": {"key": [("date", 1.0)], "unique": True},
+        }
+
+        # Act
+        indexes = dbms.get_indexes("statistics")
+
+        # Assert
+        self.assertEqual(
+            indexes[1],
+            {"name": "date_1", "keys": [("date", 1)], "unique": True, "expire_after_seconds": None, "ops": None},
+        )
+
+
+class TestDBLoaderIndexes(unittest.TestCase):
+    """Test indexes survive a CSV reload, which drops the collection."""
+
+    @patch("discord_bot.init.db_loader.DBMS.connect")
+    def test_import_tables_reapplies_indexes_after_upload(self, mock_connect):
+        """Test a forced reload of a table recreates its declared indexes."""
+        # Arrange
+        loader = DBLoader()
+        database = connect_fake(loader.cv_dbms)
+        loader.cv_indexes.apply()
+
+        # Act
+        with patch("builtins.print"):
+            loader.import_tables(force_reload=True, specific_table="dishes")
+
+        # Assert
+        self.assertEqual(set(database["dishes"].indexes), {"_id_", "id_1", "category_1"})
+        self.assertGreater(len(database["dishes"].documents), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,11 +4,16 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+import os
+import threading
 import unittest
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, MagicMock, patch
 from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError, DuplicateKeyError
 
-from discord_bot.adapters.db import DBMS
+from discord_bot.adapters.db import DBMS, AsyncDBMS
+from tests.fake_mongo import connect_fake
 
 
 class TestCriticalDBMSOperations(unittest.TestCase):
@@ -235,6 +240,91 @@ class TestCriticalDBMSOperations(unittest.TestCase):
         with self.assertRaises(DuplicateKeyError):
             self.dbms.insert_data("users", {"_id": "existing_id"})
 
+    @patch("discord_bot.adapters.db.MongoClient")
+    def test_insert_many_uses_single_unordered_round_trip(self, mock_mongo_client):
+        """Test insert_many writes a whole batch with one unordered insert_many call."""
+        # Arrange
+        mock_client = MagicMock()
+        mock_mongo_client.return_value = mock_client
+        self.dbms.connect()
+
+        mock_collection = MagicMock()
+        mock_collection.insert_many.return_value.acknowledged = True
+        self.dbms.db.__getitem__.return_value = mock_collection
+        batch = [{"message_id": 1}, {"message_id": 2}]
+
+        # Act
+        result = self.dbms.insert_many("messages", batch)
+
+        # Assert
+        self.assertTrue(result)
+        mock_collection.insert_many.assert_called_once_with(batch, ordered=False)
+
+    @patch("discord_bot.adapters.db.MongoClient")
+    def test_insert_many_with_empty_batch_skips_database(self, mock_mongo_client):
+        """Test insert_many returns False without calling Mongo for an empty batch."""
+        # Arrange
+        mock_client = MagicMock()
+        mock_mongo_client.return_value = mock_client
+        self.dbms.connect()
+
+        # Act
+        result = self.dbms.insert_many("messages", [])
+
+        # Assert
+        self.assertFalse(result)
+        self.dbms.db.__getitem__.assert_not_called()
+
+    # ==================== get_random_entry() ====================
+
+    def test_get_random_entry_uses_single_sample_aggregation(self):
+        """Test get_random_entry picks a document with $sample and no count/skip queries."""
+        # Arrange
+        self.dbms.db = MagicMock()
+        mock_collection = MagicMock()
+        mock_collection.aggregate.return_value = iter([{"dish": "Pizza", "category": "Italian"}])
+        self.dbms.db.__getitem__.return_value = mock_collection
+
+        # Act
+        result = self.dbms.get_random_entry("dishes", "Italian")
+
+        # Assert
+        self.assertEqual(result, {"dish": "Pizza", "category": "Italian"})
+        mock_collection.aggregate.assert_called_once_with(
+            [{"$match": {"category": "Italian"}}, {"$sample": {"size": 1}}]
+        )
+        mock_collection.count_documents.assert_not_called()
+        mock_collection.find.assert_not_called()
+
+    def test_get_random_entry_without_category_samples_whole_table(self):
+        """Test get_random_entry without a category starts the pipeline with $sample."""
+        # Arrange
+        self.dbms.db = MagicMock()
+        mock_collection = MagicMock()
+        mock_collection.aggregate.return_value = iter([{"fun_fact": "Honey never spoils"}])
+        self.dbms.db.__getitem__.return_value = mock_collection
+
+        # Act
+        result = self.dbms.get_random_entry("fun_facts", None)
+
+        # Assert
+        self.assertEqual(result, {"fun_fact": "Honey never spoils"})
+        mock_collection.aggregate.assert_called_once_with([{"$sample": {"size": 1}}])
+
+    def test_get_random_entry_returns_empty_dict_for_empty_table(self):
+        """Test get_random_entry returns {} when nothing matches."""
+        # Arrange
+        self.dbms.db = MagicMock()
+        mock_collection = MagicMock()
+        mock_collection.aggregate.return_value = iter([])
+        self.dbms.db.__getitem__.return_value = mock_collection
+
+        # Act
+        result = self.dbms.get_random_entry("dishes", "Unknown")
+
+        # Assert
+        self.assertEqual(result, {})
+
     # ==================== CRITICAL FUNCTION 4: update_data() ====================
 
     @patch('discord_bot.adapters.db.MongoClient')
@@ -373,5 +463,160 @@ class TestCriticalDBMSOperations(unittest.TestCase):
         mock_collection.delete_many.assert_called_once_with({})
 
 
+class TestAtomicCounters(unittest.TestCase):
+    """Test the server-side counter API used for statistics."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.dbms = DBMS(uri="mongodb://test-uri", db_name="test_db")
+
+    def test_increment_data_uses_inc_with_upsert(self):
+        """Test increment_data issues a single $inc update with upsert."""
+        # Arrange
+        self.dbms.db = MagicMock()
+        mock_collection = MagicMock()
+        mock_collection.update_one.return_value.acknowledged = True
+        self.dbms.db.__getitem__.return_value = mock_collection
+
+        # Act
+        result = self.dbms.increment_data(
+            "statistics", {"date": "2026-01-09"}, {"total_commands": 1, "command_breakdown.dish": 1}
+        )
+
+        # Assert
+        self.assertTrue(result)
+        mock_collection.update_one.assert_called_once_with(
+            {"date": "2026-01-09"}, {"$inc": {"total_commands": 1, "command_breakdown.dish": 1}}, upsert=True
+        )
+        mock_collection.find.assert_not_called()
+
+    def test_bulk_increment_sends_one_unordered_bulk_write(self):
+        """Test bulk_increment combines $inc and $set per row into a single bulk_write."""
+        # Arrange
+        database = connect_fake(self.dbms)
+        self.dbms.insert_many(
+            "commands", [{"command_name": "dish", "usage_count": 4}, {"command_name": "funfact", "usage_count": 0}]
+        )
+        calls_before = database["commands"].calls
+
+        # Act
+        result = self.dbms.bulk_increment("commands", [
+            ({"command_name": "dish"}, {"usage_count": 2}, {"last_used": "2026-01-09T12:00:00"}),
+            ({"command_name": "funfact"}, {"usage_count": 1}, {}),
+            ({"command_name": "missing"}, {"usage_count": 1}, {}),
+        ])
+
+        # Assert
+        self.assertTrue(result)
+        self.assertEqual(database["commands"].calls, calls_before + 1)
+        rows = {row["command_name"]: row for row in self.dbms.get_data("commands", {})}
+        self.assertEqual(set(rows), {"dish", "funfact"})  # No upsert by default
+        self.assertEqual((rows["dish"]["usage_count"], rows["dish"]["last_used"]), (6, "2026-01-09T12:00:00"))
+        self.assertEqual(rows["funfact"]["usage_count"], 1)
+
+    def test_bulk_update_sets_fields_in_one_bulk_write(self):
+        """Test bulk_update sets the given fields per row in a single bulk_write."""
+        # Arrange
+        database = connect_fake(self.dbms)
+        self.dbms.insert_many("messages", [{"message_id": 1}, {"message_id": 2}])
+        calls_before = database["messages"].calls
+
+        # Act
+        result = self.dbms.bulk_update("messages", [
+            ({"message_id": 1}, {"created_at": "2026-01-09"}),
+            ({"message_id": 2}, {"created_at": "2026-01-10"}),
+        ])
+
+        # Assert
+        self.assertTrue(result)
+        self.assertEqual(database["messages"].calls, calls_before + 1)
+        rows = {row["message_id"]: row["created_at"] for row in self.dbms.get_data("messages", {})}
+        self.assertEqual(rows, {1: "2026-01-09", 2: "2026-01-10"})
+
+    @unittest.skipUnless(os.getenv("MONGO_TEST_URI"), "needs a real mongod in MONGO_TEST_URI")
+    def test_concurrent_increments_are_not_lost(self):
+        """Test thousands of $inc upserts from many threads produce exact totals on a real server."""
+        # Arrange
+        dbms = DBMS(uri=os.getenv("MONGO_TEST_URI"), db_name=f"discord_bot_test_{uuid.uuid4().hex[:8]}")
+        dbms.connect(max_attempts=1)
+        self.addCleanup(dbms.client.drop_database, dbms.db_name)
+        threads, increments_per_thread = 16, 500
+        query = {"date": "2026-01-09"}
+
+        def worker(index: int) -> None:
+            command = "dish" if index % 2 else "funfact"
+            for _ in range(increments_per_thread):
+                dbms.increment_data("statistics", query, {"total_messages": 1})
+                dbms.increment_data("statistics", query, {"total_commands": 1, f"command_breakdown.{command}": 1})
+
+        # Act
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            list(executor.map(worker, range(threads)))
+
+        # Assert
+        stats = dbms.get_data("statistics", {})
+        self.assertEqual(len(stats), 1)  # Upserted exactly once
+        self.assertEqual(stats[0]["total_messages"], threads * increments_per_thread)
+        self.assertEqual(stats[0]["total_commands"], threads * increments_per_thread)
+        self.assertEqual(
+            stats[0]["command_breakdown"],
+            {"dish": threads // 2 * increments_per_thread, "funfact": threads // 2 * increments_per_thread},
+        )
+
+
+class TestAsyncDBMS(unittest.IsolatedAsyncioTestCase):
+    """Test the asyncio bridge of the DBMS adapter."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.dbms = AsyncDBMS(uri="mongodb://test-uri", db_name="test_db", max_workers=2)
+        self.dbms.db = MagicMock()
+
+    def tearDown(self):
+        """Release the worker pool."""
+        self.dbms.executor.shutdown(wait=True)
+
+    async def test_insert_data_async_runs_on_worker_thread(self):
+        """Test insert_data_async delegates to PyMongo from an executor thread, not the event loop."""
+        # Arrange
+        loop_thread = threading.get_ident()
+        calling_threads: list[int] = []
+        mock_collection = MagicMock()
+        mock_collection.insert_one.side_effect = lambda data: (
+            calling_threads.append(threading.get_ident()) or MagicMock(acknowledged=True)
+        )
+        self.dbms.db.__getitem__.return_value = mock_collection
+
+        # Act
+        result = await self.dbms.insert_data_async("messages", {"content": "hi"})
+
+        # Assert
+        self.assertTrue(result)
+        mock_collection.insert_one.assert_called_once_with({"content": "hi"})
+        self.assertNotEqual(calling_threads[0], loop_thread)
+
+    async def test_get_data_async_returns_documents(self):
+        """Test get_data_async returns the same rows as the sync method."""
+        # Arrange
+        mock_collection = MagicMock()
+        mock_collection.find.return_value = [{"date": "2026-01-09", "total_messages": 3}]
+        self.dbms.db.__getitem__.return_value = mock_collection
+
+        # Act
+        result = await self.dbms.get_data_async("statistics", {"date": "2026-01-09"})
+
+        # Assert
+        self.assertEqual(result, [{"date": "2026-01-09", "total_messages": 3}])
+
+    async def test_async_methods_propagate_errors(self):
+        """Test errors raised in the worker thread reach the awaiting coroutine."""
+        # Arrange
+        self.dbms.db = None  # Not connected
+
+        # Act & Assert
+        with self.assertRaises(RuntimeError):
+            await self.dbms.update_data_async("statistics", {}, {"connected_guilds": 1})
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,336 @@
+"""Unit tests for DiscordLogic message handling and statistics."""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import Future
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from discord_bot.business_logic.discord_logic import AUTO_TRANSLATIONS, DiscordLogic
+from discord_bot.business_logic.rate_limiter import TokenBucket
+
+
+def make_message(content: str = "Hello", author_id: int = 42) -> SimpleNamespace:
+    """Build a minimal guild message object accepted by `DiscordLogic.on_message`."""
+    return SimpleNamespace(
+        id=1,
+        author=SimpleNamespace(id=author_id, display_name="Author"),
+        guild=SimpleNamespace(id=10),
+        channel=SimpleNamespace(id=20, send=AsyncMock()),
+        content=content,
+        created_at=SimpleNamespace(isoformat=lambda: "2026-01-09T12:00:00"),
+    )
+
+
+class TestDiscordLogicMessages(unittest.IsolatedAsyncioTestCase):
+    """Test that message handling awaits the async database port."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.mock_dbms = MagicMock()
+        self.mock_dbms.get_data.return_value = []
+        self.mock_dbms.get_data_async = AsyncMock(return_value=[{"date": "2026-01-09", "total_messages": 1}])
+        self.mock_dbms.insert_many_async = AsyncMock(return_value=True)
+        self.mock_dbms.update_data_async = AsyncMock(return_value=True)
+        self.mock_dbms.increment_data_async = AsyncMock(return_value=True)
+        self.bot = DiscordLogic(dbms=self.mock_dbms)
+
+    async def test_on_message_buffers_message_until_shutdown(self):
+        """Test on_message queues guild messages and shutdown writes them with insert_many_async."""
+        # Arrange
+        message = make_message()
+
+        # Act
+        await self.bot.on_message(message)
+        await self.bot.message_buffer.stop()
+
+        # Assert
+        self.mock_dbms.insert_many_async.assert_awaited_once()
+        table_name, documents = self.mock_dbms.insert_many_async.await_args[0]
+        self.assertEqual(table_name, "messages")
+        self.assertEqual(documents[0]["guild_id"], 10)
+        self.assertIs(documents[0]["created_at"], message.created_at)
+        self.mock_dbms.insert_data.assert_not_called()
+
+    async def test_client_close_flushes_buffered_messages(self):
+        """Test closing the client, as discord.py does on Ctrl-C, writes buffered messages once."""
+        # Arrange
+        await self.bot.on_message(make_message())
+
+        # Act
+        await self.bot.client.close()
+        await self.bot.client.close()
+
+        # Assert
+        self.mock_dbms.insert_many_async.assert_awaited_once()
+        self.assertTrue(self.bot.client.is_closed())
+
+    async def test_client_close_flushes_pending_statistics(self):
+        """Test closing the client writes the counters that the periodic flush has not written yet."""
+        # Arrange
+        await self.bot.on_message(make_message())
+        await self.bot.on_message(make_message())
+
+        # Act
+        await self.bot.client.close()
+
+        # Assert
+        self.mock_dbms.increment_data_async.assert_awaited_once()
+        self.assertEqual(self.mock_dbms.increment_data_async.await_args[0][2], {"total_messages": 2})
+
+    async def test_on_message_counts_statistics_in_memory(self):
+        """Test on_message counts messages in memory and only writes them on flush."""
+        # Act
+        await self.bot.on_message(make_message())
+        await self.bot.on_message(make_message())
+
+        # Assert
+        self.mock_dbms.increment_data_async.assert_not_awaited()
+        self.assertEqual(self.bot.get_live_statistics()["total_messages"], 2)
+
+        await self.bot.stats_aggregator.flush()
+        self.mock_dbms.increment_data_async.assert_awaited_once()
+        table_name, _query, counters = self.mock_dbms.increment_data_async.await_args[0]
+        self.assertEqual(table_name, "statistics")
+        self.assertEqual(counters, {"total_messages": 2})
+        self.mock_dbms.get_data_async.assert_not_awaited()
+
+    async def test_on_message_survives_database_errors(self):
+        """Test on_message logs and swallows database failures."""
+        # Arrange
+        self.mock_dbms.increment_data_async.side_effect = Exception("Mongo down")
+        self.mock_dbms.insert_many_async.side_effect = Exception("Mongo down")
+
+        # Act & Assert (no exception)
+        await self.bot.on_message(make_message())
+        await self.bot.message_buffer.stop()
+
+    async def test_command_invocation_does_not_wait_for_database(self):
+        """Test a command is counted once in memory and written to commands and statistics on flush."""
+        # Arrange
+        self.mock_dbms.bulk_increment_async = AsyncMock(return_value=True)
+        callback = AsyncMock()
+
+        # Act
+        await self.bot._run_command("dish", callback, MagicMock(), "Italian")
+
+        # Assert
+        callback.assert_awaited_once()
+        self.mock_dbms.get_data_async.assert_not_awaited()
+        self.mock_dbms.update_data_async.assert_not_awaited()
+        self.assertEqual(self.bot.get_live_statistics()["command_breakdown"], {"dish": 1})
+
+        await self.bot.stats_aggregator.flush()
+        self.mock_dbms.bulk_increment_async.assert_awaited_once()
+        self.assertEqual(
+            self.mock_dbms.bulk_increment_async.await_args[0][1][0][:2], ({"command_name": "dish"}, {"usage_count": 1})
+        )
+
+
+class TestDiscordLogicAutoTranslate(unittest.IsolatedAsyncioTestCase):
+    """Test the auto-translate fan-out to subscribers."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.bot = DiscordLogic()
+        self.bot.logging = MagicMock()
+        self.translator = MagicMock()
+        self.translator.translate_to_async = AsyncMock(side_effect=lambda text, language: f"{text} ({language})")
+        self.bot.set_translator(self.translator)
+
+    async def test_subscribers_are_grouped_by_target_language(self):
+        """Test one translation and one message per language instead of per subscriber."""
+        # Arrange
+        subscribers = set(range(100, 120))
+        self.bot.auto_translate_targets = {42: subscribers}
+        self.translator.get_target_languages.return_value = {
+            subscriber_id: "fr" if subscriber_id == 100 else "de" for subscriber_id in subscribers
+        }
+        message = make_message("Hello")
+
+        # Act
+        await self.bot.on_message(message)
+
+        # Assert
+        self.translator.get_target_languages.assert_called_once()
+        self.assertEqual(self.translator.translate_to_async.await_count, 2)
+        self.assertEqual(message.channel.send.await_count, 2)
+        sent = [call.args[0] for call in message.channel.send.await_args_list]
+        german = next(text for text in sent if "Hello (de)" in text)
+        self.assertEqual(german.count("<@1"), 19)
+        self.assertIn("<@100>", next(text for text in sent if "Hello (fr)" in text))
+
+    async def test_language_lookup_failure_skips_translation(self):
+        """Test a failing language lookup is logged and nothing is sent."""
+        # Arrange
+        self.bot.auto_translate_targets = {42: {100}}
+        self.translator.get_target_languages.side_effect = Exception("Mongo down")
+        message = make_message("Hello")
+
+        # Act
+        await self.bot.on_message(message)
+
+        # Assert
+        self.translator.translate_to_async.assert_not_awaited()
+        message.channel.send.assert_not_awaited()
+
+
+@patch.multiple("discord_bot.business_logic.discord_logic.RateLimitConfigLoader",
+                CHANNEL_RATE=20.0, CHANNEL_BURST=3, GUILD_RATE=100.0, GUILD_BURST=100, MAX_DIGEST_ENTRIES=4)
+class TestDiscordLogicAutoTranslateRateLimit(unittest.IsolatedAsyncioTestCase):
+    """Test the per-channel send limit merges bursts into digests."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.bot = DiscordLogic()
+        self.bot.logging = MagicMock()
+        translator = MagicMock()
+        translator.get_target_languages.return_value = {100: "de"}
+        translator.translate_to_async = AsyncMock(side_effect=lambda text, language: f"{text} ({language})")
+        self.bot.set_translator(translator)
+        self.bot.auto_translate_targets = {42: {100}}
+        self.channel = SimpleNamespace(id=20, send=AsyncMock())
+
+    async def send_burst(self, count: int) -> None:
+        """Feed ``count`` messages of the chatty target user into on_message."""
+        for index in range(count):
+            message = make_message(f"message {index}")
+            message.channel = self.channel
+            await self.bot.on_message(message)
+
+    async def test_burst_beyond_limit_is_merged_into_one_digest(self):
+        """Test sends above the channel burst are combined and sent once tokens refill."""
+        # Act
+        await self.send_burst(6)
+        await asyncio.gather(*self.bot._digest_tasks.values())
+
+        # Assert
+        sent = [call.args[0] for call in self.channel.send.await_args_list]
+        self.assertEqual(len(sent), 4)
+        self.assertTrue(sent[-1].startswith("**Auto-translate digest** (3 messages)"))
+        self.assertIn("message 5 (de)", sent[-1])
+        self.assertEqual(self.bot.get_auto_translate_counters(), {"sent": 3, "merged": 3, "dropped": 0, "digests": 1})
+
+    async def test_full_digest_drops_further_translations(self):
+        """Test translations beyond max_digest_entries are dropped and counted, also in the metrics."""
+        # Arrange
+        dropped_before = AUTO_TRANSLATIONS.value("dropped")
+
+        # Act
+        await self.send_burst(10)
+        await asyncio.gather(*self.bot._digest_tasks.values())
+
+        # Assert
+        counters = self.bot.get_auto_translate_counters()
+        self.assertEqual((counters["sent"], counters["merged"], counters["dropped"]), (3, 4, 3))
+        self.assertEqual(AUTO_TRANSLATIONS.value("dropped"), dropped_before + 3)
+        self.assertEqual(self.channel.send.await_count, 4)
+
+    def test_zero_rate_is_rejected(self):
+        """Test a bucket that would never refill is refused instead of dividing by zero later."""
+        with self.assertRaises(ValueError):
+            TokenBucket(0, 5)
+
+
+class TestDiscordLogicSending(unittest.TestCase):
+    """Test the future-based send API used from admin panel worker threads."""
+
+    def setUp(self):
+        """Run the bot's event loop in a background thread like discord.py does."""
+        self.bot = DiscordLogic()
+        self.bot.logging = MagicMock()
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        self.bot.loop = self.loop
+        self.bot.client.is_ready = MagicMock(return_value=True)
+
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+        async def slow_send(content: str) -> None:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0.05)
+            self.in_flight -= 1
+
+        self.channels = {
+            channel_id: SimpleNamespace(id=channel_id, send=AsyncMock(side_effect=slow_send))
+            for channel_id in range(1, 7)
+        }
+        self.bot._resolve_channel = lambda guild_id, channel_id: self.channels.get(channel_id)
+
+    def tearDown(self):
+        """Let pending tasks finish, then stop the background event loop."""
+        async def drain() -> None:
+            # A broadcast resolves its futures before its task returns; closing the loop in between destroys the task.
+            pending = asyncio.all_tasks() - {asyncio.current_task()}
+            if pending:
+                await asyncio.wait(pending, timeout=1)
+
+        asyncio.run_coroutine_threadsafe(drain(), self.loop).result(timeout=2)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(1)
+        self.loop.close()
+
+    def test_submit_message_returns_immediately(self):
+        """Test the caller gets a future instead of blocking until the send finished."""
+        # Act
+        started = time.perf_counter()
+        future = self.bot.submit_message(10, 1, "Hello")
+        submitted_after = time.perf_counter() - started
+
+        # Assert
+        self.assertLess(submitted_after, 0.05)
+        self.assertTrue(future.result(timeout=1))
+        self.channels[1].send.assert_awaited_once_with("Hello")
+
+    def test_submit_message_when_offline(self):
+        """Test a disconnected bot returns an already failed future."""
+        # Arrange
+        self.bot.client.is_ready.return_value = False
+
+        # Act
+        future = self.bot.submit_message(10, 1, "Hello")
+
+        # Assert
+        self.assertTrue(future.done())
+        self.assertFalse(future.result())
+
+    def test_broadcast_bounds_parallel_sends(self):
+        """Test a broadcast reports every channel and never exceeds max_concurrency sends."""
+        # Arrange
+        targets = [(10, channel_id) for channel_id in range(1, 7)] + [(10, 99)]
+
+        # Act
+        futures = self.bot.submit_broadcast(targets, "Announcement", max_concurrency=2)
+        results = {target: future.result(timeout=2) for target, future in futures.items()}
+
+        # Assert
+        self.assertEqual(sum(results.values()), 6)
+        self.assertFalse(results[(10, 99)])  # Unknown channel
+        self.assertEqual(self.max_in_flight, 2)
+
+    def test_cancelled_broadcast_resolves_remaining_channels(self):
+        """Test cancelling a broadcast at shutdown fails the unsent channels instead of leaving callers waiting."""
+        # Arrange
+        futures = {(10, channel_id): Future() for channel_id in range(1, 7)}
+        broadcast = asyncio.run_coroutine_threadsafe(self.bot._broadcast(futures, "Announcement", 2), self.loop)
+        time.sleep(0.01)
+
+        # Act
+        broadcast.cancel()
+        results = [future.result(timeout=1) for future in futures.values()]
+
+        # Assert
+        self.assertEqual(results, [False] * 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
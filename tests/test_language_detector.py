@@ -0,0 +1,144 @@
+"""Unit tests for the offline LanguageDetector and the same-language short-circuit."""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import unittest
+from unittest.mock import Mock
+
+from discord_bot.adapters.translation_backends import LocalTranslationBackend
+from discord_bot.business_logic.language_detector import LanguageDetector
+from discord_bot.business_logic.translator import Translator
+
+SAMPLES = {
+    "en": "Can someone help me with the boss fight?",
+    "de": "Kann mir jemand bei dem Bosskampf helfen?",
+    "fr": "Quelqu'un peut m'aider avec le boss ?",
+    "es": "¿Alguien me puede ayudar con el jefe final?",
+    "it": "Qualcuno mi può aiutare con il boss?",
+    "pt": "Alguém pode me ajudar com o chefe?",
+    "nl": "Kan iemand me helpen met de eindbaas?",
+    "pl": "Czy ktoś może mi pomóc z bossem?",
+    "tr": "Biri bana boss savaşında yardım edebilir mi?",
+    "ru": "Кто-нибудь может помочь мне с боссом?",
+}
+
+# Languages without a corpus next to the closest shipped language they used to be mistaken for.
+NEIGHBOURS = {
+    "sv": ("de", "Kan någon hjälpa mig med bossen?"),
+    "da": ("nl", "Jeg har ikke tid i aften, vi ses i morgen i stedet."),
+    "uk": ("ru", "Хтось може допомогти мені з босом?"),
+    "ro": ("it", "Nu am timp în seara asta, ne vedem mâine."),
+    "gl": ("es", "Alguén pode axudarme co xefe final?"),
+    "af": ("nl", "Kan iemand my help met die eindbaas?"),
+}
+
+
+
+class TestLanguageDetector(unittest.TestCase):
+    """Test language identification from the shipped n-gram profiles."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Build the profiles once for all tests."""
+        cls.detector = LanguageDetector(min_chars=15, min_margin=0.05, min_coverage=0.6)
+
+    def test_detects_every_shipped_language(self):
+        """Test one chat-style sentence per profile is identified correctly."""
+        for language, text in SAMPLES.items():
+            with self.subTest(language=language):
+                # Act & Assert
+                self.assertEqual(self.detector.detect(text), language)
+
+    def test_short_texts_are_unknown(self):
+        """Test short chatter is not guessed, so it still gets translated."""
+        for text in ("ok", "lol", "gg wp", "hello there"):
+            with self.subTest(text=text):
+                # Act & Assert
+                self.assertIsNone(self.detector.detect(text))
+
+    def test_related_languages_without_corpus_are_unknown(self):
+        """Test texts in languages without a profile are not reported as their closest shipped neighbour."""
+        for language, (_neighbour, text) in NEIGHBOURS.items():
+            with self.subTest(language=language):
+                # Act & Assert
+                self.assertIsNone(self.detector.detect(text))
+
+    def test_mentions_and_urls_are_ignored(self):
+        """Test Discord markup does not count towards the text length."""
+        # Act
+        result = self.detector.detect("<@123456789> <:pepe:987654321> https://example.com/some/long/path")
+
+        # Assert
+        self.assertIsNone(result)
+
+
+class TestTranslatorSkipsSameLanguage(unittest.TestCase):
+    """Test the translator returns texts already in the target language without a backend call."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.backend = LocalTranslationBackend(latency=0, error_rate=0)
+        self.translator = Translator(
+            backend=self.backend, detector=LanguageDetector(min_chars=15, min_margin=0.05, min_coverage=0.6)
+        )
+        self.translator.logging = Mock()
+
+    def tearDown(self):
+        """Release the worker pool."""
+        self.translator.executor.shutdown(wait=True)
+
+    def test_same_language_skips_backend(self):
+        """Test a German message for a German reader is returned unchanged and counted."""
+        # Act
+        result = self.translator.translate_to(SAMPLES["de"], "de")
+
+        # Assert
+        self.assertEqual(result, SAMPLES["de"])
+        self.assertEqual(self.backend.calls, 0)
+        self.assertEqual(self.translator.get_backend_status()["skipped_same_language"], 1)
+
+    def test_region_suffix_of_target_is_ignored(self):
+        """Test targets like pt-BR match the detected base language."""
+        # Act
+        self.translator.translate_to(SAMPLES["pt"], "pt-BR")
+
+        # Assert
+        self.assertEqual(self.backend.calls, 0)
+
+    def test_other_language_is_translated(self):
+        """Test a French message for a German reader still reaches the backend."""
+        # Act
+        result = self.translator.translate_to(SAMPLES["fr"], "de")
+
+        # Assert
+        self.assertEqual(result, f'[de] {SAMPLES["fr"]}')
+        self.assertEqual(self.backend.calls, 1)
+
+    def test_related_languages_reach_the_backend(self):
+        """Test a Swedish text for a German reader, a Ukrainian one for a Russian reader etc. are translated."""
+        for language, (neighbour, text) in NEIGHBOURS.items():
+            with self.subTest(language=language):
+                # Act
+                result = self.translator.translate_to(text, neighbour)
+
+                # Assert
+                self.assertEqual(result, f"[{neighbour}] {text}")
+        self.assertEqual(self.backend.calls, len(NEIGHBOURS))
+
+    def test_target_without_corpus_skips_detection(self):
+        """Test targets the detector has no profile for always reach the backend."""
+        # Arrange
+        self.translator.detector.detect = Mock()
+
+        # Act
+        self.translator.translate_to(SAMPLES["ru"], "uk")
+
+        # Assert
+        self.translator.detector.detect.assert_not_called()
+        self.assertEqual(self.backend.calls, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,202 @@
+"""Unit tests for the buffered log writer behind Model.logging."""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import json
+import logging
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from discord_bot.business_logic.model import Model
+from discord_bot.init.log_loader import LogFilter, LogWriter
+
+
+class DemoModel(Model):
+    def execute_function(self) -> None:
+        pass
+
+
+class TestLogWriter(unittest.TestCase):
+    """Test file output, formats, rotation and backpressure of the background log writer."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.log_dir = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        """Remove the temporary log directory."""
+        self.temp_dir.cleanup()
+
+    def test_text_lines_show_time_and_level(self):
+        """Test lines are written as "[timestamp] LEVEL message" and the directory is created."""
+        # Arrange
+        writer = LogWriter(log_format="text", rotate_when="size", max_bytes=0, backup_count=0, queue_size=100)
+        log_file = self.log_dir / "nested" / "demo.log"
+
+        # Act
+        writer.write(log_file, "first")
+        writer.write(log_file, "second", level="error")
+        writer.write(log_file, "third", level="informational")
+        writer.close()
+
+        # Assert
+        lines = log_file.read_text(encoding="utf-8").splitlines()
+        self.assertEqual([line.split("] ", 1)[1] for line in lines], ["INFO first", "ERROR second", "INFO third"])
+        self.assertRegex(lines[0], r"^\[\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\] ")
+
+    def test_json_lines_include_extra_fields(self):
+        """Test the JSON format writes one parseable object per line."""
+        # Arrange
+        writer = LogWriter(log_format="json", rotate_when="size", max_bytes=0, backup_count=0, queue_size=100)
+        log_file = self.log_dir / "translator.log"
+
+        # Act
+        writer.write(log_file, "Translated", language="de")
+        writer.flush()
+
+        # Assert
+        entry = json.loads(log_file.read_text(encoding="utf-8"))
+        self.assertEqual((entry["logger"], entry["message"], entry["language"]), ("translator", "Translated", "de"))
+        writer.close()
+
+    def test_rotates_by_size(self):
+        """Test a full log file is rotated into numbered backups."""
+        # Arrange
+        writer = LogWriter(log_format="text", rotate_when="size", max_bytes=200, backup_count=2, queue_size=1000)
+        log_file = self.log_dir / "demo.log"
+
+        # Act
+        for index in range(50):
+            writer.write(log_file, f"line {index:03d}")
+        writer.close()
+
+        # Assert
+        self.assertTrue((self.log_dir / "demo.log.1").exists())
+        self.assertTrue((self.log_dir / "demo.log.2").exists())
+        self.assertFalse((self.log_dir / "demo.log.3").exists())
+        self.assertIn("line 049", log_file.read_text(encoding="utf-8"))
+
+    def test_full_queue_drops_lines_instead_of_blocking(self):
+        """Test writes while the queue is full are counted and dropped."""
+        # Arrange
+        writer = LogWriter(log_format="text", rotate_when="size", max_bytes=0, backup_count=0, queue_size=2)
+        log_file = self.log_dir / "demo.log"
+
+        # Act
+        with patch.object(writer, "_start"):
+            for index in range(5):
+                writer.write(log_file, f"line {index}")
+
+        # Assert
+        self.assertEqual(writer.dropped, 3)
+        self.assertEqual(writer.queue.qsize(), 2)
+
+    def test_flush_with_handler_lock_held_does_not_block(self):
+        """Test logging.shutdown's acquire-then-flush on the handler still drains the queue."""
+        # Arrange
+        writer = LogWriter(log_format="text", rotate_when="size", max_bytes=0, backup_count=0, queue_size=100)
+        log_file = self.log_dir / "demo.log"
+        for index in range(3):
+            writer.write(log_file, f"line {index}")
+
+        # Act
+        writer.acquire()
+        try:
+            writer.flush()
+        finally:
+            writer.release()
+        writer.close()
+
+        # Assert
+        self.assertIsInstance(writer, logging.Handler)
+        self.assertEqual(len(log_file.read_text(encoding="utf-8").splitlines()), 3)
+
+    def test_model_logging_keeps_its_signature(self):
+        """Test Model.logging writes to the class log file or to an explicit file name."""
+        # Arrange
+        writer = LogWriter(log_format="text", rotate_when="size", max_bytes=0, backup_count=0, queue_size=100)
+        model = DemoModel()
+        model.log_loader.log_dir = self.log_dir
+
+        # Act
+        with patch("discord_bot.business_logic.model.LOG_WRITER", writer):
+            model.logging("class file")
+            model.logging("explicit file", "custom")
+        writer.close()
+
+        # Assert
+        self.assertIn("class file", (self.log_dir / "demo_model.log").read_text(encoding="utf-8"))
+        self.assertIn("explicit file", (self.log_dir / "custom.log").read_text(encoding="utf-8"))
+
+
+class TestLogFilter(unittest.TestCase):
+    """Test level filtering, per-site sampling and lazy messages."""
+
+    def test_levels_below_threshold_are_dropped(self):
+        """Test only calls at or above the configured level pass."""
+        # Arrange
+        log_filter = LogFilter(level="warning", sample_rates={})
+
+        # Act & Assert
+        self.assertFalse(log_filter.enabled("info"))
+        self.assertTrue(log_filter.enabled("warning"))
+        self.assertTrue(log_filter.enabled("error"))
+        self.assertEqual(log_filter.suppressed, 1)
+
+    def test_sampling_writes_one_call_per_interval(self):
+        """Test a site sampled at 10% passes every tenth call, other sites pass every call."""
+        # Arrange
+        log_filter = LogFilter(level="info", sample_rates={"translator.success": 0.1, "muted": 0})
+
+        # Act
+        passed = sum(log_filter.enabled("info", "translator.success") for _ in range(100))
+
+        # Assert
+        self.assertEqual(passed, 10)
+        self.assertTrue(log_filter.enabled("info", "unknown.site"))
+        self.assertFalse(log_filter.enabled("info", "muted"))
+
+    def test_errors_are_never_sampled(self):
+        """Test warnings and errors of a sampled site are always written."""
+        # Arrange
+        log_filter = LogFilter(level="info", sample_rates={"translator.success": 0})
+
+        # Act & Assert
+        self.assertTrue(all(log_filter.enabled("error", "translator.success") for _ in range(10)))
+
+    def test_unknown_level_is_written_as_info(self):
+        """Test a mistyped level neither raises in the caller nor bypasses the threshold."""
+        # Arrange
+        log_filter = LogFilter(level="warning", sample_rates={})
+
+        # Act & Assert
+        self.assertFalse(log_filter.enabled("informational"))
+        self.assertTrue(LogFilter(level="info", sample_rates={}).enabled("informational"))
+
+    def test_filtered_lazy_message_is_never_built(self):
+        """Test a callable message is not called when the call is filtered out."""
+        # Arrange
+        model = DemoModel()
+        build_message = Mock(return_value="expensive")
+        writer = Mock()
+
+        # Act
+        with (
+            patch("discord_bot.business_logic.model.LOG_FILTER", LogFilter(level="info", sample_rates={"demo": 0})),
+            patch("discord_bot.business_logic.model.LOG_WRITER", writer),
+        ):
+            model.logging(build_message, sample="demo")
+            model.logging(lambda: "built", level="error", sample="demo")
+
+        # Assert
+        build_message.assert_not_called()
+        self.assertEqual(writer.write.call_args.args[1], "built")
+        self.assertEqual(writer.write.call_args.kwargs, {"level": "error"})
+
+
+if __name__ == "__main__":
+    unittest.main()
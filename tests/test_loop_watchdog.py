@@ -0,0 +1,85 @@
+"""Unit tests for the event-loop watchdog."""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import asyncio
+import time
+import unittest
+from unittest.mock import Mock
+
+from discord_bot.business_logic.loop_watchdog import LoopWatchdog
+
+
+async def blocking_translate() -> str:
+    """Stand-in for a command that calls a synchronous API on the event loop."""
+    time.sleep(0.3)
+    return "done"
+
+
+async def quick_reply() -> str:
+    await asyncio.sleep(0.01)
+    return "ok"
+
+
+class TestLoopWatchdog(unittest.IsolatedAsyncioTestCase):
+    """Test stall detection with handler attribution and per-handler timings."""
+
+    async def asyncSetUp(self):
+        """Set up test fixtures."""
+        self.watchdog = LoopWatchdog(interval=0.02, threshold=0.1, max_stalls=5)
+        self.watchdog.logging = Mock()
+        self.watchdog.start()
+
+    async def asyncTearDown(self):
+        """Stop the heartbeat and the monitor thread."""
+        self.watchdog.stop()
+
+    async def test_blocking_handler_is_reported_with_name_and_stack(self):
+        """Test a handler blocking the loop is recorded once with its name and its stack."""
+        # Act
+        result = await self.watchdog.run("command:Translate", blocking_translate())
+        await asyncio.sleep(0.1)
+        report = self.watchdog.get_report()
+
+        # Assert
+        self.assertEqual(result, "done")
+        self.assertEqual(len(report["stalls"]), 1)
+        stall = report["stalls"][0]
+        self.assertEqual(stall["handler"], "command:Translate")
+        self.assertIn("blocking_translate", stall["stack"])
+        self.assertGreaterEqual(stall["blocked_seconds"], 0.25)
+        self.assertEqual(report["handlers"]["command:Translate"]["stalls"], 1)
+        self.assertGreaterEqual(report["loop_lag_ms"]["max"], 250)
+        self.watchdog.logging.assert_called_once()
+
+    async def test_awaiting_handler_is_timed_without_stall(self):
+        """Test handlers that only await are counted but never reported as stalls."""
+        # Act
+        for _ in range(3):
+            await self.watchdog.run("on_message", quick_reply())
+        await asyncio.sleep(0.05)
+        report = self.watchdog.get_report()
+
+        # Assert
+        self.assertEqual(report["stalls"], [])
+        self.assertEqual(report["handlers"]["on_message"]["calls"], 3)
+        self.assertGreaterEqual(report["handlers"]["on_message"]["avg_ms"], 10)
+
+    async def test_handler_exceptions_are_still_timed(self):
+        """Test a failing handler propagates its exception and is counted."""
+        # Arrange
+        async def failing() -> None:
+            raise RuntimeError("boom")
+
+        # Act
+        with self.assertRaises(RuntimeError):
+            await self.watchdog.run("on_guild_join", failing())
+
+        # Assert
+        self.assertEqual(self.watchdog.get_report()["handlers"]["on_guild_join"]["calls"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+"""Unit tests for the write-behind MessageBuffer."""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, Mock
+
+from discord_bot.business_logic.message_buffer import MessageBuffer
+
+
+class TestMessageBuffer(unittest.IsolatedAsyncioTestCase):
+    """Test batching, time-based flushing, backpressure and shutdown of the buffer."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.mock_dbms = Mock()
+        self.mock_dbms.insert_many_async = AsyncMock(return_value=True)
+
+    async def test_flushes_full_batches_with_insert_many(self):
+        """Test documents are written in batches of flush_size."""
+        # Arrange
+        buffer = MessageBuffer(self.mock_dbms, flush_size=10, flush_interval=60, max_queue_size=100)
+
+        # Act
+        for index in range(25):
+            await buffer.put("messages", {"message_id": index})
+        await asyncio.sleep(0.05)
+
+        # Assert
+        batch_sizes = [len(call.args[1]) for call in self.mock_dbms.insert_many_async.await_args_list]
+        self.assertEqual(batch_sizes, [10, 10])
+        await buffer.stop()
+
+    async def test_flushes_partial_batch_after_interval(self):
+        """Test a partial batch is written once flush_interval has elapsed."""
+        # Arrange
+        buffer = MessageBuffer(self.mock_dbms, flush_size=100, flush_interval=0.05, max_queue_size=100)
+
+        # Act
+        await buffer.put("messages", {"message_id": 1})
+        await asyncio.sleep(0.2)
+
+        # Assert
+        self.mock_dbms.insert_many_async.assert_awaited_once_with("messages", [{"message_id": 1}])
+        await buffer.stop()
+
+    async def test_stop_flushes_everything(self):
+        """Test stop() writes all queued documents, grouped by table."""
+        # Arrange
+        buffer = MessageBuffer(self.mock_dbms, flush_size=100, flush_interval=60, max_queue_size=100)
+        await buffer.put("messages", {"message_id": 1})
+        await buffer.put("direct_messages", {"message_id": 2})
+        await buffer.put("messages", {"message_id": 3})
+
+        # Act
+        await buffer.stop()
+
+        # Assert
+        written = {call.args[0]: call.args[1] for call in self.mock_dbms.insert_many_async.await_args_list}
+        self.assertEqual(written["messages"], [{"message_id": 1}, {"message_id": 3}])
+        self.assertEqual(written["direct_messages"], [{"message_id": 2}])
+        self.assertEqual(buffer.flushed_documents, 3)
+
+    async def test_put_applies_backpressure_when_full(self):
+        """Test producers wait while the queue is full and the database is slow."""
+        # Arrange
+        release = asyncio.Event()
+
+        async def slow_insert(table_name, documents):
+            await release.wait()
+            return True
+
+        self.mock_dbms.insert_many_async = AsyncMock(side_effect=slow_insert)
+        buffer = MessageBuffer(self.mock_dbms, flush_size=2, flush_interval=60, max_queue_size=2)
+        for index in range(4):  # 2 in the stalled write, 2 in the queue
+            await buffer.put("messages", {"message_id": index})
+        await asyncio.sleep(0.01)
+
+        # Act
+        blocked_put = asyncio.create_task(buffer.put("messages", {"message_id": 99}))
+        await asyncio.sleep(0.05)
+
+        # Assert
+        self.assertFalse(blocked_put.done())
+        release.set()
+        await asyncio.wait_for(blocked_put, timeout=1)
+        await buffer.stop()
+        self.assertEqual(buffer.flushed_documents, 5)
+
+    async def test_failed_flush_is_logged_not_raised(self):
+        """Test a database error during a flush does not kill the buffer and is reported at shutdown."""
+        # Arrange
+        self.mock_dbms.insert_many_async = AsyncMock(side_effect=Exception("Mongo down"))
+        buffer = MessageBuffer(self.mock_dbms, flush_size=1, flush_interval=60, max_queue_size=10)
+        buffer.logging = Mock()
+
+        # Act
+        await buffer.put("messages", {"message_id": 1})
+        await buffer.stop()
+
+        # Assert
+        self.assertEqual(buffer.flushed_documents, 0)
+        self.assertEqual(buffer.dropped_documents, 1)
+        self.assertEqual(buffer.logging.call_args.kwargs["level"], "error")
+
+    async def test_failed_batch_is_retried_without_new_documents(self):
+        """Test documents of a failed write are written again after flush_interval."""
+        # Arrange
+        self.mock_dbms.insert_many_async = AsyncMock(side_effect=[Exception("Mongo down"), True])
+        buffer = MessageBuffer(self.mock_dbms, flush_size=2, flush_interval=0.05, max_queue_size=10)
+        buffer.logging = Mock()
+
+        # Act
+        await buffer.put("messages", {"message_id": 1})
+        await buffer.put("messages", {"message_id": 2})
+        await asyncio.sleep(0.2)
+
+        # Assert
+        self.assertEqual(self.mock_dbms.insert_many_async.await_count, 2)
+        self.mock_dbms.insert_many_async.assert_awaited_with("messages", [{"message_id": 1}, {"message_id": 2}])
+        self.assertEqual(buffer.flushed_documents, 2)
+        await buffer.stop()
+
+    async def test_retried_documents_are_bounded_by_max_queue_size(self):
+        """Test a long outage keeps only the newest max_queue_size documents for the retry."""
+        # Arrange
+        self.mock_dbms.insert_many_async = AsyncMock(side_effect=Exception("Mongo down"))
+        buffer = MessageBuffer(self.mock_dbms, flush_size=2, flush_interval=60, max_queue_size=3)
+        buffer.logging = Mock()
+
+        # Act
+        for index in range(6):
+            await buffer.put("messages", {"message_id": index})
+        await asyncio.sleep(0.05)
+
+        # Assert
+        self.assertEqual([document["message_id"] for _table, document in buffer._retry], [3, 4, 5])
+        self.assertEqual(buffer.dropped_documents, 3)
+        await buffer.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+"""Unit tests for the metrics registry, the exposition endpoint and the hot-path instrumentation."""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import unittest
+import urllib.error
+import urllib.request
+from unittest.mock import AsyncMock, Mock
+
+from discord_bot.adapters.db import DB_ERRORS, DB_LATENCY, DBMS
+from discord_bot.business_logic.discord_logic import COMMAND_LATENCY, DiscordLogic
+from discord_bot.init.metrics import MetricsRegistry, MetricsServer
+from tests.fake_mongo import connect_fake
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    """Test counters, gauges, histograms and the text exposition format."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.registry = MetricsRegistry()
+
+    def test_counter_and_gauge_render_with_labels(self):
+        """Test labelled counters and callback gauges are rendered with HELP and TYPE lines."""
+        # Arrange
+        counter = self.registry.counter("requests_total", "Requests.", ("cache", "result"))
+        self.registry.gauge("queue_size", "Queued items.", function=lambda: 3)
+
+        # Act
+        counter.inc("tables", "hit")
+        counter.inc("tables", "hit")
+        counter.inc("tables", "miss")
+        output = self.registry.render()
+
+        # Assert
+        self.assertIn("# TYPE requests_total counter", output)
+        self.assertIn('requests_total{cache="tables",result="hit"} 2', output)
+        self.assertIn('requests_total{cache="tables",result="miss"} 1', output)
+        self.assertIn("queue_size 3", output)
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Test observations land in the first bucket whose bound is not smaller and sum up."""
+        # Arrange
+        histogram = self.registry.histogram("latency_seconds", "Latency.", ("operation",), buckets=(0.1, 1.0))
+
+        # Act
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value, "get_data")
+        output = self.registry.render()
+
+        # Assert
+        self.assertIn('latency_seconds_bucket{operation="get_data",le="0.1"} 2', output)
+        self.assertIn('latency_seconds_bucket{operation="get_data",le="1"} 3', output)
+        self.assertIn('latency_seconds_bucket{operation="get_data",le="+Inf"} 4', output)
+        self.assertIn('latency_seconds_sum{operation="get_data"} 2.65', output)
+        self.assertIn('latency_seconds_count{operation="get_data"} 4', output)
+
+    def test_registry_returns_existing_metric_and_rejects_type_clash(self):
+        """Test a name maps to one metric and cannot be registered with another type."""
+        # Act
+        first = self.registry.counter("events_total", "Events.")
+        second = self.registry.counter("events_total", "Events.")
+
+        # Assert
+        self.assertIs(first, second)
+        with self.assertRaises(ValueError):
+            self.registry.histogram("events_total", "Events.")
+
+    def test_server_exposes_metrics_endpoint(self):
+        """Test /metrics serves the registry and other paths return 404."""
+        # Arrange
+        self.registry.counter("events_total", "Events.").inc()
+        server = MetricsServer(self.registry, host="127.0.0.1", port=0)
+        server.start()
+        self.addCleanup(server.stop)
+
+        # Act
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.port}/metrics") as response:
+            body = response.read().decode("utf-8")
+            content_type = response.headers["Content-Type"]
+
+        # Assert
+        self.assertIn("events_total 1", body)
+        self.assertTrue(content_type.startswith("text/plain; version=0.0.4"))
+        with self.assertRaises(urllib.error.HTTPError):
+            urllib.request.urlopen(f"http://127.0.0.1:{server.port}/other")
+
+
+class TestInstrumentation(unittest.IsolatedAsyncioTestCase):
+    """Test DBMS and command latencies are recorded."""
+
+    def test_dbms_records_latency_and_errors_per_collection(self):
+        """Test every DBMS call is observed with its method and collection."""
+        # Arrange
+        dbms = DBMS(db_name="test")
+        connect_fake(dbms)
+        before = DB_LATENCY.count("insert_data", "metrics_test")
+        errors_before = DB_ERRORS.value("get_data", "metrics_test")
+
+        # Act
+        dbms.insert_data("metrics_test", {"value": 1})
+        dbms.db = None
+        with self.assertRaises(RuntimeError):
+            dbms.get_data("metrics_test", {})
+
+        # Assert
+        self.assertEqual(DB_LATENCY.count("insert_data", "metrics_test"), before + 1)
+        self.assertEqual(DB_ERRORS.value("get_data", "metrics_test"), errors_before + 1)
+
+    async def test_command_latency_recorded_with_outcome(self):
+        """Test command callbacks are timed and failures are labelled as errors."""
+        # Arrange
+        bot = DiscordLogic(dbms=None)
+        bot._update_command_usage = Mock()
+        failing = AsyncMock(side_effect=RuntimeError("boom"))
+        before = (COMMAND_LATENCY.count("dish", "success"), COMMAND_LATENCY.count("dish", "error"))
+
+        # Act
+        await bot._run_command("dish", AsyncMock(), Mock(), "Italian")
+        with self.assertRaises(RuntimeError):
+            await bot._run_command("dish", failing, Mock())
+
+        # Assert
+        self.assertEqual(COMMAND_LATENCY.count("dish", "success"), before[0] + 1)
+        self.assertEqual(COMMAND_LATENCY.count("dish", "error"), before[1] + 1)
+        bot._update_command_usage.assert_called_once_with("dish")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+"""Unit tests for message retention: archival to gzipped JSON Lines, TTL indexes and capped tables."""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import gzip
+import json
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+from discord_bot.adapters.db import DBMS
+from discord_bot.business_logic.retention_manager import RetentionManager
+from discord_bot.init.db_indexes import IndexManager, retention_indexes
+from discord_bot.init.db_loader import DBLoader
+from tests.fake_mongo import connect_fake
+
+NOW = datetime(2026, 3, 10, tzinfo=timezone.utc)
+
+
+class TestRetentionManager(unittest.TestCase):
+    """Test the archival pass writes expired rows to monthly files before deleting them."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.dbms = DBMS(db_name="test_db")
+        self.database = connect_fake(self.dbms)
+        self.directory = tempfile.TemporaryDirectory()
+        self.manager = RetentionManager(
+            self.dbms, collections={"messages": (30, True), "direct_messages": (30, False)},
+            batch_size=2, archive_dir=Path(self.directory.name),
+        )
+        self.manager.logging = Mock()
+        ages = [90, 45, 31, 29, 1]
+        self.dbms.insert_many("messages", [
+            {"message_id": age, "content": f"{age} days old", "created_at": NOW - timedelta(days=age)} for age in ages
+        ])
+
+    def tearDown(self):
+        """Remove the archive directory."""
+        self.directory.cleanup()
+
+    def read_archive(self) -> list[dict]:
+        lines = []
+        for path in sorted(Path(self.directory.name, "messages").glob("*.jsonl.gz")):
+            with gzip.open(path, "rt", encoding="utf-8") as archive:
+                lines.extend(json.loads(line) for line in archive)
+        return lines
+
+    def test_expired_messages_are_archived_by_month_then_deleted(self):
+        """Test rows older than the retention period move to one file per month in batches."""
+        # Act
+        archived = self.manager.run_once(now=NOW)
+
+        # Assert
+        self.assertEqual(archived, {"messages": 3})
+        self.assertEqual(sorted(document["message_id"] for document in self.dbms.get_data("messages", {})), [1, 29])
+        files = sorted(path.name for path in Path(self.directory.name, "messages").iterdir())
+        self.assertEqual(files, ["messages-2025-12.jsonl.gz", "messages-2026-01.jsonl.gz", "messages-2026-02.jsonl.gz"])
+        lines = self.read_archive()
+        self.assertEqual(sorted(line["message_id"] for line in lines), [31, 45, 90])
+        self.assertEqual(lines[0]["created_at"], "2025-12-10T00:00:00+00:00")
+
+    def test_second_run_appends_to_the_monthly_file(self):
+        """Test a later pass adds a gzip member to an existing file that reads back as one stream."""
+        # Arrange
+        self.manager.run_once(now=NOW)
+
+        # Act
+        archived = self.manager.run_once(now=NOW + timedelta(days=28))
+
+        # Assert
+        self.assertEqual(archived, {"messages": 1})
+        self.assertEqual(sorted(line["message_id"] for line in self.read_archive()), [29, 31, 45, 90])
+        self.assertEqual(self.manager.get_status()["archived"], {"messages": 4})
+
+    def test_rows_are_kept_when_the_archive_cannot_be_written(self):
+        """Test a failed write deletes nothing and is reported in the status."""
+        # Arrange
+        with patch.object(self.manager, "_write_archive", side_effect=OSError("disk full")):
+            # Act
+            archived = self.manager.run_once(now=NOW)
+
+        # Assert
+        self.assertEqual(archived, {"messages": 0})
+        self.assertEqual(len(self.database["messages"].documents), 5)
+        self.assertIn("disk full", self.manager.get_status()["last_error"])
+
+    def test_legacy_rows_get_created_at_from_their_timestamp(self):
+        """Test rows without created_at are backfilled from timestamp and then expire like the others."""
+        # Arrange
+        self.dbms.insert_many("messages", [
+            {"message_id": 100, "timestamp": (NOW - timedelta(days=100)).isoformat()},
+            {"message_id": 101, "timestamp": (NOW - timedelta(days=2)).isoformat()},
+            {"message_id": 102, "timestamp": "not a date"},
+        ])
+        self.dbms.insert_many("direct_messages", [
+            {"message_id": 200, "timestamp": (NOW - timedelta(days=60)).replace(tzinfo=None).isoformat()},
+        ])
+
+        # Act
+        archived = self.manager.run_once(now=NOW)
+
+        # Assert
+        self.assertEqual(archived, {"messages": 4})
+        rows = {document["message_id"]: document for document in self.dbms.get_data("messages", {})}
+        self.assertEqual(sorted(rows), [1, 29, 101, 102])
+        self.assertEqual(rows[101]["created_at"], NOW - timedelta(days=2))
+        self.assertEqual(rows[102]["created_at"], NOW)
+        direct_message = self.dbms.get_data("direct_messages", {})[0]
+        self.assertEqual(direct_message["created_at"], NOW - timedelta(days=60))
+        self.assertEqual(self.manager._unbackfilled, set())
+
+
+class TestRetentionIndexes(unittest.TestCase):
+    """Test the created_at indexes and capped tables derived from the retention settings."""
+
+    def test_ttl_index_only_for_tables_without_archive(self):
+        """Test TTL tables get expireAfterSeconds, archived tables a plain index and capped or unlimited tables none."""
+        # Arrange
+        dbms = DBMS(db_name="test_db")
+        database = connect_fake(dbms)
+        specs = retention_indexes(
+            {"messages": (90, True), "direct_messages": (7, False), "commands": (0, False), "audit": (30, False)},
+            capped={"audit": 1 << 20},
+        )
+
+        # Act
+        IndexManager(dbms, specs).apply()
+        changed = IndexManager(dbms, retention_indexes({"direct_messages": (14, False)}, capped={})).apply()
+
+        # Assert
+        self.assertEqual(list(specs), ["messages", "direct_messages"])
+        self.assertNotIn("expireAfterSeconds", database["messages"].indexes["created_at_1"])
+        self.assertEqual(database["direct_messages"].indexes["created_at_1"]["expireAfterSeconds"], 7 * 86400)
+        self.assertEqual(len(changed["direct_messages"]["conflicts"]), 1)
+
+    @patch("discord_bot.init.db_loader.RetentionConfigLoader.CAPPED", {"messages": 4096})
+    @patch("discord_bot.init.db_loader.DBMS.connect")
+    def test_initialize_creates_configured_capped_table(self, mock_connect):
+        """Test an empty capped table is created with its size and other tables keep the usual setup."""
+        # Arrange
+        loader = DBLoader()
+        database = connect_fake(loader.discord_dbms)
+
+        # Act
+        with patch("builtins.print"):
+            loader.initialize_discord_tables()
+
+        # Assert
+        self.assertEqual(database.collection_options, {"messages": {"capped": True, "size": 4096}})
+        self.assertIn("commands", database)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,212 @@
+"""Unit tests for the in-memory StatsAggregator."""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, Mock
+
+from discord_bot.business_logic.stats_aggregator import StatsAggregator
+
+
+class TestStatsAggregator(unittest.IsolatedAsyncioTestCase):
+    """Test aggregation, flushing and live reporting of daily statistics."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.mock_dbms = Mock()
+        self.mock_dbms.increment_data_async = AsyncMock(return_value=True)
+        self.mock_dbms.bulk_increment_async = AsyncMock(return_value=True)
+        self.mock_dbms.get_data_async = AsyncMock(return_value=[])
+        self.aggregator = StatsAggregator(
+            self.mock_dbms, flush_interval=60, max_unflushed_interval=60, max_pending_events=1000
+        )
+        self.aggregator.logging = Mock()
+
+    async def test_record_does_not_touch_database(self):
+        """Test recording counters only updates memory."""
+        # Act
+        for _ in range(50):
+            self.aggregator.record({"total_messages": 1}, date="2026-01-09")
+
+        # Assert
+        self.mock_dbms.increment_data_async.assert_not_awaited()
+        self.assertEqual(self.aggregator.get_live_statistics("2026-01-09")["total_messages"], 50)
+
+    async def test_flush_writes_one_increment_per_day(self):
+        """Test flush sends the summed deltas with a single increment per date."""
+        # Arrange
+        self.aggregator.record({"total_messages": 1}, date="2026-01-09")
+        self.aggregator.record({"total_messages": 1}, date="2026-01-09")
+        self.aggregator.record({"total_commands": 1, "command_breakdown.dish": 1}, date="2026-01-09")
+
+        # Act
+        await self.aggregator.flush()
+
+        # Assert
+        self.mock_dbms.increment_data_async.assert_awaited_once_with(
+            "statistics",
+            {"date": "2026-01-09"},
+            {"total_messages": 2, "total_commands": 1, "command_breakdown.dish": 1},
+        )
+
+    async def test_failed_flush_keeps_deltas_for_retry(self):
+        """Test deltas survive a failed flush and are written by the next one."""
+        # Arrange
+        self.mock_dbms.increment_data_async.side_effect = [Exception("Mongo down"), True]
+        self.aggregator.record({"total_dms": 3}, date="2026-01-09")
+
+        # Act
+        await self.aggregator.flush()
+        await self.aggregator.flush()
+
+        # Assert
+        self.assertEqual(self.mock_dbms.increment_data_async.await_count, 2)
+        self.assertEqual(self.mock_dbms.increment_data_async.await_args[0][2], {"total_dms": 3})
+        self.assertEqual(self.aggregator.get_live_statistics("2026-01-09")["total_dms"], 3)
+
+    async def test_live_statistics_merge_persisted_and_pending(self):
+        """Test live statistics combine the loaded document with unflushed deltas."""
+        # Arrange
+        self.mock_dbms.get_data_async.return_value = [
+            {"date": "2026-01-09", "total_messages": 100, "total_commands": 5, "command_breakdown": {"dish": 5}}
+        ]
+        await self.aggregator.load("2026-01-09")
+        self.aggregator.record(
+            {"total_commands": 1, "command_breakdown.dish": 1, "command_breakdown.funfact": 1}, date="2026-01-09"
+        )
+
+        # Act
+        live = self.aggregator.get_live_statistics("2026-01-09")
+
+        # Assert
+        self.assertEqual(live["total_messages"], 100)
+        self.assertEqual(live["total_commands"], 6)
+        self.assertEqual(live["command_breakdown"], {"dish": 6, "funfact": 1})
+
+    async def test_pending_event_limit_forces_flush(self):
+        """Test reaching max_pending_events flushes without waiting for the interval."""
+        # Arrange
+        aggregator = StatsAggregator(self.mock_dbms, flush_interval=60, max_unflushed_interval=60, max_pending_events=3)
+
+        # Act
+        for _ in range(3):
+            aggregator.record({"total_messages": 1}, date="2026-01-09")
+        await asyncio.sleep(0)
+
+        # Assert
+        self.mock_dbms.increment_data_async.assert_awaited_once_with(
+            "statistics", {"date": "2026-01-09"}, {"total_messages": 3}
+        )
+
+    async def test_stop_flushes_pending_deltas(self):
+        """Test stop() persists everything recorded so far."""
+        # Arrange
+        self.aggregator.start()
+        self.aggregator.record({"total_messages": 1}, date="2026-01-09")
+
+        # Act
+        await self.aggregator.stop()
+
+        # Assert
+        self.mock_dbms.increment_data_async.assert_awaited_once_with(
+            "statistics", {"date": "2026-01-09"}, {"total_messages": 1}
+        )
+
+    async def test_load_does_not_overwrite_deltas_flushed_meanwhile(self):
+        """Test a flush started before the load finishes is not lost from live statistics."""
+        # Arrange
+        database = {"total_messages": 10}
+
+        async def read_row(table_name, query):
+            row = dict(database, date="2026-01-09")
+            await asyncio.sleep(0.01)
+            return [row]
+
+        async def increment(table_name, query, counters):
+            database["total_messages"] += counters["total_messages"]
+            return True
+
+        self.mock_dbms.get_data_async.side_effect = read_row
+        self.mock_dbms.increment_data_async.side_effect = increment
+        self.aggregator.record({"total_messages": 2}, date="2026-01-09")
+
+        # Act
+        await asyncio.gather(self.aggregator.load("2026-01-09"), self.aggregator.flush())
+
+        # Assert
+        self.assertEqual(database["total_messages"], 12)
+        self.assertEqual(self.aggregator.get_live_statistics("2026-01-09")["total_messages"], 12)
+
+    async def test_cancelled_flush_requeues_unwritten_deltas(self):
+        """Test cancelling a flush mid-write puts its deltas back so stop() still writes them."""
+        # Arrange
+        started = asyncio.Event()
+
+        async def hang(*args):
+            started.set()
+            await asyncio.sleep(60)
+
+        self.mock_dbms.increment_data_async.side_effect = hang
+        self.aggregator.record({"total_messages": 1})
+        self.aggregator.record_command("dish")
+        flush = asyncio.ensure_future(self.aggregator.flush())
+        await started.wait()
+
+        # Act
+        flush.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await flush
+        self.mock_dbms.increment_data_async.side_effect = None
+        await self.aggregator.flush()
+
+        # Assert
+        self.assertEqual(
+            self.mock_dbms.increment_data_async.await_args[0][2],
+            {"total_messages": 1, "total_commands": 1, "command_breakdown.dish": 1},
+        )
+        self.assertEqual(self.mock_dbms.bulk_increment_async.await_args[0][1][0][1], {"usage_count": 1})
+        self.assertEqual(self.aggregator.get_live_statistics()["total_messages"], 1)
+
+    async def test_command_usage_is_flushed_with_one_bulk_write(self):
+        """Test command invocations update statistics and all commands rows with two writes in total."""
+        # Act
+        for command_name in ("dish", "dish", "funfact"):
+            self.aggregator.record_command(command_name)
+        await self.aggregator.flush()
+
+        # Assert
+        self.mock_dbms.increment_data_async.assert_awaited_once()
+        self.assertEqual(
+            self.mock_dbms.increment_data_async.await_args[0][2],
+            {"total_commands": 3, "command_breakdown.dish": 2, "command_breakdown.funfact": 1},
+        )
+        self.mock_dbms.bulk_increment_async.assert_awaited_once()
+        table_name, updates = self.mock_dbms.bulk_increment_async.await_args[0]
+        self.assertEqual(table_name, "commands")
+        self.assertEqual([(query, counters) for query, counters, _values in updates], [
+            ({"command_name": "dish"}, {"usage_count": 2}),
+            ({"command_name": "funfact"}, {"usage_count": 1}),
+        ])
+        self.assertTrue(all(values["last_used"] for _query, _counters, values in updates))
+
+    async def test_failed_command_usage_flush_is_retried(self):
+        """Test usage counts survive a failed bulk write and are added to later invocations."""
+        # Arrange
+        self.mock_dbms.bulk_increment_async.side_effect = [Exception("Mongo down"), True]
+        self.aggregator.record_command("dish")
+
+        # Act
+        await self.aggregator.flush()
+        self.aggregator.record_command("dish")
+        await self.aggregator.flush()
+
+        # Assert
+        self.assertEqual(self.mock_dbms.bulk_increment_async.await_count, 2)
+        self.assertEqual(self.mock_dbms.bulk_increment_async.await_args[0][1][0][1], {"usage_count": 2})
+
+
+if __name__ == "__main__":
+    unittest.main()
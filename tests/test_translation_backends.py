@@ -0,0 +1,100 @@
+"""Unit tests for the translation backends and their registry."""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import unittest
+from unittest.mock import Mock
+
+from discord_bot.adapters.translation_backends import (
+    LocalTranslationBackend,
+    GoogleTranslationBackend,
+    create_translation_backend,
+    register_translation_backend,
+    TRANSLATION_BACKENDS,
+)
+from discord_bot.business_logic.translator import Translator
+
+
+class TestLocalTranslationBackend(unittest.TestCase):
+    """Test the deterministic offline backend."""
+
+    def test_dictionary_words_and_fallback(self):
+        """Test known words are translated and unknown texts get a target prefix."""
+        # Arrange
+        backend = LocalTranslationBackend(latency=0, error_rate=0)
+
+        # Act
+        results = backend.translate_batch(["Hello", "see you"], "de")
+
+        # Assert
+        self.assertEqual(results, ["hallo", "[de] see you"])
+        self.assertEqual(backend.calls, 1)
+
+    def test_error_rate_is_reproducible(self):
+        """Test the same seed fails the same calls."""
+        # Arrange
+        def outcomes(backend: LocalTranslationBackend) -> list[bool]:
+            results = []
+            for _ in range(50):
+                try:
+                    backend.translate("hello", "fr")
+                    results.append(True)
+                except ConnectionError:
+                    results.append(False)
+            return results
+
+        # Act
+        first = outcomes(LocalTranslationBackend(latency=0, error_rate=0.3, seed=7))
+        second = outcomes(LocalTranslationBackend(latency=0, error_rate=0.3, seed=7))
+
+        # Assert
+        self.assertEqual(first, second)
+        self.assertIn(False, first)
+        self.assertIn(True, first)
+
+    def test_translator_runs_offline_with_local_backend(self):
+        """Test Translator works end to end without network access."""
+        # Arrange
+        translator = Translator(backend=LocalTranslationBackend(latency=0, error_rate=0))
+        translator.logging = Mock()
+
+        # Act
+        result = translator.translate_many(["thanks", "thanks", "ok"], "es")
+
+        # Assert
+        self.assertEqual(result, ["gracias", "gracias", "[es] ok"])
+        translator.executor.shutdown(wait=True)
+
+
+class TestBackendRegistry(unittest.TestCase):
+    """Test selecting backends by name."""
+
+    def test_create_known_backends(self):
+        """Test the built-in names create the matching backend classes."""
+        # Act & Assert
+        self.assertIsInstance(create_translation_backend("google"), GoogleTranslationBackend)
+        self.assertIsInstance(create_translation_backend("local"), LocalTranslationBackend)
+
+    def test_unknown_backend_raises(self):
+        """Test a misspelled backend name fails loudly instead of silently using another one."""
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            create_translation_backend("deepl")
+
+    def test_register_additional_backend(self):
+        """Test custom backends can be registered under a new name."""
+        # Arrange
+        register_translation_backend("echo", lambda: LocalTranslationBackend(latency=0))
+        self.addCleanup(TRANSLATION_BACKENDS.pop, "echo")
+
+        # Act
+        backend = create_translation_backend("echo")
+
+        # Assert
+        self.assertEqual(backend.translate("yes", "de"), "ja")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,10 +4,16 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+import asyncio
+import threading
+import time
 import unittest
+from datetime import datetime
 from unittest.mock import Mock, patch, MagicMock
 
-from discord_bot.business_logic.translator import Translator
+from discord_bot.adapters.db import DBMS
+from discord_bot.business_logic.translator import CircuitBreaker, Translator, TranslationCache
+from tests.fake_mongo import connect_fake
 
 
 class TestTranslator(unittest.TestCase):
@@ -18,7 +24,7 @@ class TestTranslator(unittest.TestCase):
         self.mock_dbms = Mock()
         self.translator = Translator(dbms=self.mock_dbms)
 
-    @patch('discord_bot.business_logic.translator.GoogleTranslator')
+    @patch("discord_bot.adapters.translation_backends.GoogleTranslator")
     def test_execute_function_translates_text(self, mock_google_translator):
         """Test that execute_function translates text correctly."""
         # Arrange
@@ -33,7 +39,7 @@ class TestTranslator(unittest.TestCase):
         self.assertEqual(result, "Hallo Welt")
         mock_translator_instance.translate.assert_called_once_with("Hello World")
 
-    @patch('discord_bot.business_logic.translator.GoogleTranslator')
+    @patch("discord_bot.adapters.translation_backends.GoogleTranslator")
     def test_execute_function_with_user_specific_language(self, mock_google_translator):
         """Test that execute_function uses user-specific target language."""
         # Arrange
@@ -52,8 +58,9 @@ class TestTranslator(unittest.TestCase):
         self.mock_dbms.get_data.assert_called_once_with("users", {"user_id": user_id})
         mock_google_translator.assert_called_with(source="auto", target="fr")
 
-    @patch('discord_bot.business_logic.translator.GoogleTranslator')
-    def test_execute_function_returns_original_text_on_failure(self, mock_google_translator):
+    @patch("discord_bot.business_logic.translator.time.sleep")
+    @patch("discord_bot.adapters.translation_backends.GoogleTranslator")
+    def test_execute_function_returns_original_text_on_failure(self, mock_google_translator, mock_sleep):
         """Test that execute_function returns original text when translation fails."""
         # Arrange
         original_text = "Hello World"
@@ -64,9 +71,37 @@ class TestTranslator(unittest.TestCase):
 
         # Assert
         self.assertEqual(result, original_text)
-        self.assertEqual(mock_google_translator.call_count, 10)  # Should retry 10 times
+        self.assertEqual(mock_google_translator.call_count, self.translator.max_attempts)
+        self.assertEqual(mock_sleep.call_count, self.translator.max_attempts - 1)  # Backoff between attempts
 
-    @patch('discord_bot.business_logic.translator.GoogleTranslator')
+    @patch("discord_bot.business_logic.translator.random.uniform", side_effect=lambda low, high: high)
+    def test_backoff_grows_exponentially_up_to_the_cap(self, _mock_uniform):
+        """Test the retry delay doubles per attempt and stops at backoff_max."""
+        # Arrange
+        self.translator.backoff_base = 0.5
+        self.translator.backoff_max = 3
+
+        # Act
+        delays = [self.translator._backoff(attempt) for attempt in range(5)]
+
+        # Assert
+        self.assertEqual(delays, [0.5, 1.0, 2.0, 3, 3])
+
+    @patch("discord_bot.adapters.translation_backends.GoogleTranslator")
+    def test_client_is_reused_per_language(self, mock_google_translator):
+        """Test one backend client per target language instead of one per translation."""
+        # Arrange
+        mock_google_translator.return_value.translate.side_effect = lambda text: text.upper()
+
+        # Act
+        for text in ("a", "b", "c"):
+            self.translator.translate_to(text, "fr")
+        self.translator.translate_to("a", "es")
+
+        # Assert
+        self.assertEqual(mock_google_translator.call_count, 2)
+
+    @patch("discord_bot.adapters.translation_backends.GoogleTranslator")
     def test_execute_function_without_user_id(self, mock_google_translator):
         """Test that execute_function works without user_id."""
         # Arrange
@@ -81,7 +116,7 @@ class TestTranslator(unittest.TestCase):
         self.assertEqual(result, "Hallo")
         self.mock_dbms.get_data.assert_not_called()
 
-    @patch('discord_bot.business_logic.translator.GoogleTranslator')
+    @patch("discord_bot.adapters.translation_backends.GoogleTranslator")
     def test_execute_function_with_nonexistent_user(self, mock_google_translator):
         """Test that execute_function uses default language for non-existent user."""
         # Arrange
@@ -99,6 +134,474 @@ class TestTranslator(unittest.TestCase):
         self.assertEqual(result, "Translated")
         self.mock_dbms.get_data.assert_called_once_with("users", {"user_id": user_id})
 
+    def test_get_target_languages_uses_one_query(self):
+        """Test the languages of a group are resolved with a single users query."""
+        # Arrange
+        self.mock_dbms.get_data.return_value = [{"user_id": 1, "target_language": "fr"}]
+
+        # Act
+        languages = self.translator.get_target_languages([1, 2])
+
+        # Assert
+        self.assertEqual(languages, {1: "fr", 2: "de"})
+        self.mock_dbms.get_data.assert_called_once_with("users", {"user_id": {"$in": [1, 2]}})
+
+    def test_user_language_is_queried_only_once(self):
+        """Test repeated lookups, including users without a preference, hit the language cache."""
+        # Arrange
+        self.mock_dbms.get_data.return_value = [{"user_id": 1, "target_language": "fr"}]
+
+        # Act
+        for _ in range(5):
+            languages = self.translator.get_target_languages([1, 2])
+
+        # Assert
+        self.assertEqual(languages, {1: "fr", 2: "de"})
+        self.mock_dbms.get_data.assert_called_once()
+
+    def test_warmed_language_cache_needs_no_query(self):
+        """Test warm_language_cache loads all preferences so later lookups skip the database."""
+        # Arrange
+        self.mock_dbms.get_data.return_value = [{"user_id": 1, "target_language": "ja"}, {"user_id": 2}]
+        self.translator.warm_language_cache()
+        self.mock_dbms.get_data.reset_mock()
+
+        # Act
+        languages = self.translator.get_target_languages([1])
+
+        # Assert
+        self.assertEqual(languages, {1: "ja"})
+        self.mock_dbms.get_data.assert_not_called()
+
+    def test_set_user_language_writes_through(self):
+        """Test a changed preference is saved and served from the cache without a new query."""
+        # Arrange
+        self.translator.logging = Mock()
+        self.mock_dbms.get_data.return_value = [{"user_id": 1, "target_language": "fr"}]
+        self.translator.get_target_languages([1])
+
+        # Act
+        saved = self.translator.set_user_language(1, " ES ", "Alice")
+        self.mock_dbms.get_data.reset_mock()
+        languages = self.translator.get_target_languages([1])
+
+        # Assert
+        self.assertTrue(saved)
+        self.mock_dbms.update_data.assert_called_once_with(
+            "users", {"user_id": 1}, {"target_language": "es", "user_name": "Alice"}
+        )
+        self.assertEqual(languages, {1: "es"})
+        self.mock_dbms.get_data.assert_not_called()
+
+    def test_set_user_language_inserts_new_user(self):
+        """Test a user without a users document gets one."""
+        # Arrange
+        self.translator.logging = Mock()
+        self.mock_dbms.get_data.return_value = []
+
+        # Act
+        self.translator.set_user_language(7, "it")
+
+        # Assert
+        self.mock_dbms.insert_data.assert_called_once_with("users", {"user_id": 7, "target_language": "it"})
+
+    def test_invalidate_user_language_reloads(self):
+        """Test an invalidated user is read from the database again."""
+        # Arrange
+        self.mock_dbms.get_data.return_value = []
+        self.translator.get_target_languages([1])
+        self.mock_dbms.get_data.return_value = [{"user_id": 1, "target_language": "pl"}]
+
+        # Act
+        self.translator.invalidate_user_language(1)
+        languages = self.translator.get_target_languages([1])
+
+        # Assert
+        self.assertEqual(languages, {1: "pl"})
+
+    @patch("discord_bot.adapters.translation_backends.GoogleTranslator")
+    def test_repeated_text_is_served_from_cache(self, mock_google_translator):
+        """Test that a repeated phrase skips the translation backend."""
+        # Arrange
+        mock_google_translator.return_value.translate.return_value = "Hallo"
+
+        # Act
+        results = [self.translator.execute_function("Hello") for _ in range(5)]
+
+        # Assert
+        self.assertEqual(results, ["Hallo"] * 5)
+        mock_google_translator.return_value.translate.assert_called_once_with("Hello")
+        self.assertEqual(self.translator.cache.stats()["hits"], 4)
+
+    @patch("discord_bot.business_logic.translator.time.sleep")
+    @patch("discord_bot.adapters.translation_backends.GoogleTranslator")
+    def test_failed_translation_is_not_cached(self, mock_google_translator, _mock_sleep):
+        """Test that the original text returned after failures is not cached."""
+        # Arrange
+        mock_google_translator.side_effect = Exception("Translation API error")
+        self.translator.logging = Mock()
+
+        # Act
+        self.translator.execute_function("Hello")
+
+        # Assert
+        self.assertEqual(self.translator.cache.stats()["entries"], 0)
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Test that the circuit breaker fails fast during outages and recovers after a probe."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.breaker = CircuitBreaker(failure_rate=0.5, min_calls=4, window=10, open_seconds=30)
+
+    def test_opens_when_failure_rate_crosses_threshold(self):
+        """Test the breaker rejects calls once half of the recent calls failed."""
+        # Act
+        for success in (True, False, True, False):
+            self.breaker.record(success)
+
+        # Assert
+        self.assertFalse(self.breaker.allow())
+        self.assertEqual(self.breaker.status()["state"], "open")
+        self.assertEqual(self.breaker.status()["rejected"], 1)
+
+    def test_stays_closed_below_min_calls(self):
+        """Test a few early failures do not open the breaker."""
+        # Act
+        for _ in range(3):
+            self.breaker.record(False)
+
+        # Assert
+        self.assertTrue(self.breaker.allow())
+
+    @patch("discord_bot.business_logic.translator.time.monotonic")
+    def test_half_open_probe_closes_or_reopens(self, mock_monotonic):
+        """Test one probe is allowed after open_seconds and its outcome decides the state."""
+        # Arrange
+        mock_monotonic.return_value = 1000.0
+        for _ in range(4):
+            self.breaker.record(False)
+        mock_monotonic.return_value = 1031.0
+
+        # Act & Assert
+        self.assertTrue(self.breaker.allow())
+        self.assertFalse(self.breaker.allow())  # Only one probe at a time
+        self.breaker.record(False)
+        self.assertEqual(self.breaker.status()["state"], "open")
+
+        mock_monotonic.return_value = 1062.0
+        self.assertTrue(self.breaker.allow())
+        self.breaker.record(True)
+        self.assertEqual(self.breaker.status()["state"], "closed")
+        self.assertTrue(self.breaker.allow())
+
+    @patch("discord_bot.business_logic.translator.time.sleep")
+    @patch("discord_bot.adapters.translation_backends.GoogleTranslator")
+    def test_open_breaker_skips_backend(self, mock_google_translator, _mock_sleep):
+        """Test translations return the original text without backend calls while open."""
+        # Arrange
+        mock_google_translator.return_value.translate.side_effect = Exception("Backend down")
+        translator = Translator(breaker=self.breaker)
+        translator.logging = Mock()
+        translator.translate_to("first", "de")
+        calls_when_open = mock_google_translator.return_value.translate.call_count
+
+        # Act
+        result = translator.translate_to("second", "de")
+
+        # Assert
+        self.assertEqual(result, "second")
+        self.assertEqual(mock_google_translator.return_value.translate.call_count, calls_when_open)
+        self.assertEqual(translator.get_backend_status()["breaker"]["state"], "open")
+
+
+class UpperBackend:
+    """Fake GoogleTranslator that upper-cases texts and records every backend call."""
+    calls: list[list[str]] = []
+    release = threading.Event()
+
+    def __init__(self, source: str, target: str):
+        self.target = target
+
+    def translate(self, text: str) -> str:
+        return self.translate_batch([text])[0]
+
+    def translate_batch(self, batch: list[str]) -> list[str]:
+        UpperBackend.calls.append(list(batch))
+        UpperBackend.release.wait(5)
+        return [text.upper() for text in batch]
+
+
+@patch("discord_bot.adapters.translation_backends.GoogleTranslator", UpperBackend)
+class TestTranslateMany(unittest.IsolatedAsyncioTestCase):
+    """Test deduplication, chunking, request coalescing and burst batching."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        UpperBackend.calls = []
+        UpperBackend.release.set()
+        self.translator = Translator(max_workers=4, batch_size=2, batch_window=0.02)
+        self.translator.logging = Mock()
+
+    def tearDown(self):
+        """Release the worker pool."""
+        UpperBackend.release.set()
+        self.translator.executor.shutdown(wait=True)
+
+    async def test_duplicates_are_translated_once_in_chunks(self):
+        """Test duplicate texts share one translation and distinct texts are chunked by batch_size."""
+        # Act
+        result = self.translator.translate_many(["a", "b", "a", "c"], "de")
+
+        # Assert
+        self.assertEqual(result, ["A", "B", "A", "C"])
+        self.assertEqual(UpperBackend.calls, [["a", "b"], ["c"]])
+
+    async def test_cached_texts_skip_the_backend(self):
+        """Test a second batch only sends texts that are not cached yet."""
+        # Arrange
+        self.translator.translate_many(["a", "b"], "de")
+
+        # Act
+        result = self.translator.translate_many(["a", "b", "c"], "de")
+
+        # Assert
+        self.assertEqual(result, ["A", "B", "C"])
+        self.assertEqual(UpperBackend.calls, [["a", "b"], ["c"]])
+
+    async def test_concurrent_identical_requests_are_coalesced(self):
+        """Test callers asking for a text that is already in flight wait for that call."""
+        # Arrange
+        UpperBackend.release.clear()
+        first = self.translator.executor.submit(self.translator.translate_to, "hello", "de")
+        while not UpperBackend.calls:
+            await asyncio.sleep(0.001)
+        second = self.translator.executor.submit(self.translator.translate_to, "hello", "de")
+        await asyncio.sleep(0.05)
+
+        # Act
+        UpperBackend.release.set()
+
+        # Assert
+        self.assertEqual((first.result(5), second.result(5)), ("HELLO", "HELLO"))
+        self.assertEqual(UpperBackend.calls, [["hello"]])
+
+    async def test_burst_of_async_translations_is_batched(self):
+        """Test messages arriving within the batch window become one translate_many call."""
+        # Arrange
+        translator = Translator(max_workers=4, batch_size=25, batch_window=0.02)
+        translator.logging = Mock()
+        texts = [f"message {index}" for index in range(10)]
+
+        # Act
+        results = await asyncio.gather(*(translator.translate_to_async(text, "de") for text in texts))
+
+        # Assert
+        self.assertEqual(results, [text.upper() for text in texts])
+        self.assertEqual(UpperBackend.calls, [texts])
+        translator.executor.shutdown(wait=True)
+
+
+class TestTranslationCache(unittest.TestCase):
+    """Test LRU eviction, expiry, size limits and persistence of the translation cache."""
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test the entry not read for the longest time is dropped at max_entries."""
+        # Arrange
+        cache = TranslationCache(max_entries=2, max_bytes=10_000, ttl=0)
+        cache.put("a", "auto", "de", "A")
+        cache.put("b", "auto", "de", "B")
+        cache.get("a", "auto", "de")
+
+        # Act
+        cache.put("c", "auto", "de", "C")
+
+        # Assert
+        self.assertEqual(cache.get("a", "auto", "de"), "A")
+        self.assertIsNone(cache.get("b", "auto", "de"))
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_byte_limit_evicts_and_skips_oversized_entries(self):
+        """Test max_bytes bounds the memory used by cached texts."""
+        # Arrange
+        cache = TranslationCache(max_entries=100, max_bytes=40, ttl=0)
+
+        # Act
+        cache.put("x" * 10, "auto", "de", "y" * 10)
+        cache.put("z" * 10, "auto", "de", "w" * 10)
+        cache.put("huge" * 20, "auto", "de", "entry")
+
+        # Assert
+        stats = cache.stats()
+        self.assertEqual(stats["entries"], 1)
+        self.assertLessEqual(stats["bytes"], 40)
+        self.assertIsNone(cache.get("huge" * 20, "auto", "de"))
+
+    def test_key_includes_source_and_target(self):
+        """Test the same text cached for different languages is kept apart."""
+        # Arrange
+        cache = TranslationCache(max_entries=10, max_bytes=10_000, ttl=0)
+
+        # Act
+        cache.put("Hello", "auto", "de", "Hallo")
+        cache.put("Hello", "auto", "fr", "Bonjour")
+
+        # Assert
+        self.assertEqual(cache.get("Hello", "auto", "de"), "Hallo")
+        self.assertEqual(cache.get("Hello", "auto", "fr"), "Bonjour")
+        self.assertIsNone(cache.get("Hello", "en", "de"))
+
+    @patch("discord_bot.business_logic.translator.time.time")
+    def test_expired_entry_is_a_miss(self, mock_time):
+        """Test entries older than the TTL are dropped on read."""
+        # Arrange
+        cache = TranslationCache(max_entries=10, max_bytes=10_000, ttl=60)
+        mock_time.return_value = 1000.0
+        cache.put("Hello", "auto", "de", "Hallo")
+
+        # Act
+        mock_time.return_value = 1061.0
+        result = cache.get("Hello", "auto", "de")
+
+        # Assert
+        self.assertIsNone(result)
+        self.assertEqual(cache.stats()["expirations"], 1)
+        self.assertEqual(cache.stats()["bytes"], 0)
+
+    def test_persisted_entries_survive_restart(self):
+        """Test a new cache on the same database loads earlier translations."""
+        # Arrange
+        dbms = DBMS(db_name="test")
+        connect_fake(dbms)
+        TranslationCache(max_entries=10, max_bytes=10_000, ttl=0, dbms=dbms).put("Hello", "auto", "de", "Hallo")
+
+        # Act
+        restarted = TranslationCache(max_entries=10, max_bytes=10_000, ttl=0, dbms=dbms)
+
+        # Assert
+        self.assertEqual(restarted.get("Hello", "auto", "de"), "Hallo")
+
+    def test_persisting_an_existing_key_replaces_it(self):
+        """Test re-caching a key that is still stored does not fail or duplicate it."""
+        # Arrange
+        dbms = DBMS(db_name="test")
+        connect_fake(dbms)
+        TranslationCache(max_entries=10, max_bytes=10_000, ttl=0, dbms=dbms).put("Hello", "auto", "de", "Hallo")
+
+        # Act
+        TranslationCache(max_entries=10, max_bytes=10_000, ttl=0, dbms=dbms).put("Hello", "auto", "de", "Servus")
+
+        # Assert
+        rows = dbms.get_data("translation_cache", {})
+        self.assertEqual([row["translation"] for row in rows], ["Servus"])
+
+    def test_stored_entries_are_dated_and_expired_rows_deleted_on_load(self):
+        """Test created_at is stored as a date for the TTL index and expired float-dated rows are removed."""
+        # Arrange
+        dbms = DBMS(db_name="test")
+        connect_fake(dbms)
+        TranslationCache(max_entries=10, max_bytes=10_000, ttl=60, dbms=dbms).put("Hello", "auto", "de", "Hallo")
+        dbms.insert_data(
+            "translation_cache",
+            {
+                "_id": "old",
+                "text": "Hi",
+                "source": "auto",
+                "target": "de",
+                "translation": "Hallo",
+                "created_at": time.time() - 3600,
+            },
+        )
+
+        # Act
+        restarted = TranslationCache(max_entries=10, max_bytes=10_000, ttl=60, dbms=dbms)
+        loaded = restarted.load()
+
+        # Assert
+        self.assertEqual(loaded, 1)
+        rows = dbms.get_data("translation_cache", {})
+        self.assertEqual(len(rows), 1)
+        self.assertIsInstance(rows[0]["created_at"], datetime)
+
+    @patch("discord_bot.business_logic.translator.time.monotonic")
+    def test_failed_load_is_retried_only_after_backoff(self, mock_monotonic):
+        """Test a database outage costs one failed load per retry interval, not one per lookup."""
+        # Arrange
+        dbms = Mock()
+        dbms.get_data.side_effect = Exception("Mongo down")
+        cache = TranslationCache(max_entries=10, max_bytes=10_000, ttl=0, dbms=dbms)
+        mock_monotonic.return_value = 100.0
+
+        # Act
+        with self.assertRaises(Exception):
+            cache.get("Hello", "auto", "de")
+        cache.put("Hello", "auto", "de", "Hallo")
+        during_backoff = cache.get("Hello", "auto", "de")
+        mock_monotonic.return_value = 100.0 + TranslationCache.LOAD_RETRY_SECONDS
+        dbms.get_data.side_effect = None
+        dbms.get_data.return_value = []
+        cache.get("Hello", "auto", "de")
+
+        # Assert
+        self.assertEqual(during_backoff, "Hallo")
+        self.assertEqual(dbms.get_data.call_count, 2)
+
+
+class SleepingBackend:
+    """Fake GoogleTranslator whose translate call blocks like a slow network request."""
+    delay = 0.3
+
+    def __init__(self, source: str, target: str):
+        self.target = target
+
+    def translate(self, text: str) -> str:
+        time.sleep(self.delay)
+        return f"{text} ({self.target})"
+
+
+class TestTranslatorAsync(unittest.IsolatedAsyncioTestCase):
+    """Test that translations run off the event loop with a timeout."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.translator = Translator(dbms=Mock(), max_workers=2, timeout=5)
+        self.translator.logging = Mock()
+
+    def tearDown(self):
+        """Release the worker pool."""
+        self.translator.executor.shutdown(wait=True)
+
+    @patch("discord_bot.adapters.translation_backends.GoogleTranslator", SleepingBackend)
+    async def test_other_commands_are_served_during_slow_translation(self):
+        """Test the event loop keeps handling other work while the backend sleeps."""
+        # Arrange
+        served: list[float] = []
+
+        async def other_command() -> None:
+            started = time.perf_counter()
+            while time.perf_counter() - started < SleepingBackend.delay:
+                await asyncio.sleep(0.01)
+                served.append(time.perf_counter())
+
+        # Act
+        translated, _ = await asyncio.gather(self.translator.execute_function_async("Hello"), other_command())
+
+        # Assert
+        self.assertEqual(translated, "Hello (de)")
+        self.assertGreater(len(served), 10)  # The loop was never blocked for the whole sleep
+
+    @patch("discord_bot.adapters.translation_backends.GoogleTranslator", SleepingBackend)
+    async def test_timeout_returns_original_text(self):
+        """Test a translation slower than the timeout falls back to the original text."""
+        # Act
+        started = time.perf_counter()
+        result = await self.translator.execute_function_async("Hello", timeout=0.05)
+
+        # Assert
+        self.assertEqual(result, "Hello")
+        self.assertLess(time.perf_counter() - started, SleepingBackend.delay)
+
 
 if __name__ == "__main__":
     unittest.main()